@@ -0,0 +1,178 @@
+import base64
+import contextvars
+import hashlib
+import hmac
+import json
+import secrets
+import time
+import uuid
+from typing import Annotated, Optional
+from fastapi import Depends, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from starlette import status
+from starlette.concurrency import run_in_threadpool
+from cache.cache import RedisCache, cache
+from config.settings import settings
+
+SCRYPT_R = 8
+SCRYPT_P = 1
+SCRYPT_DKLEN = 32
+HASH_PREFIX = "scrypt"
+
+_TOKEN_HEADER = {"alg": "HS256", "typ": "JWT"}
+
+
+# Keys that anyone who has read this repository could sign tokens with.
+INSECURE_SECRET_KEYS = {"", "dev-only-change-me"}
+
+
+class TokenError(Exception):
+    pass
+
+
+class InsecureSecretKeyError(RuntimeError):
+    pass
+
+
+def check_secret_key():
+    if settings.AUTH_ENABLED and settings.AUTH_SECRET_KEY.strip() in INSECURE_SECRET_KEYS:
+        raise InsecureSecretKeyError(
+            "AUTH_SECRET_KEY is unset or a placeholder while AUTH_ENABLED is on; anyone could forge tokens. "
+            "Set it to a long random value, e.g. `python -c 'import secrets; print(secrets.token_urlsafe(48))'`."
+        )
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+# Passwords -------------------------------------------------------------------
+
+def _scrypt(password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+    return hashlib.scrypt(password.encode(), salt=salt, n=n, r=r, p=p, dklen=SCRYPT_DKLEN, maxmem=256 * n * r)
+
+def _hash_password(password: str) -> str:
+    salt = secrets.token_bytes(16)
+    n = settings.PASSWORD_SCRYPT_N
+    digest = _scrypt(password, salt, n, SCRYPT_R, SCRYPT_P)
+    return f"{HASH_PREFIX}${n}${SCRYPT_R}${SCRYPT_P}${_b64encode(salt)}${_b64encode(digest)}"
+
+def _verify_password(password: str, stored: str) -> bool:
+    if not stored.startswith(HASH_PREFIX + "$"):
+        # Rows written before passwords were hashed hold the plain value;
+        # callers rehash them after a successful login.
+        return hmac.compare_digest(password.encode(), stored.encode())
+    _, n, r, p, salt, digest = stored.split("$")
+    return hmac.compare_digest(_scrypt(password, _b64decode(salt), int(n), int(r), int(p)), _b64decode(digest))
+
+def needs_rehash(stored: str) -> bool:
+    return not stored.startswith(f"{HASH_PREFIX}${settings.PASSWORD_SCRYPT_N}${SCRYPT_R}${SCRYPT_P}$")
+
+# scrypt is memory-hard and deliberately slow (tens of ms), so it runs in the
+# thread pool instead of stalling the event loop.
+async def hash_password(password: str) -> str:
+    return await run_in_threadpool(_hash_password, password)
+
+async def verify_password(password: str, stored: str) -> bool:
+    return await run_in_threadpool(_verify_password, password, stored)
+
+
+# Tokens ----------------------------------------------------------------------
+
+def _sign(signing_input: bytes) -> bytes:
+    return hmac.new(settings.AUTH_SECRET_KEY.encode(), signing_input, hashlib.sha256).digest()
+
+def create_access_token(user) -> dict:
+    now = int(time.time())
+    claims = {
+        "sub": str(user.user_id),
+        "username": user.username,
+        "role": user.role,
+        "iat": now,
+        "exp": now + settings.AUTH_TOKEN_TTL_SECONDS,
+        "jti": uuid.uuid4().hex,
+    }
+    signing_input = f"{_b64encode(json.dumps(_TOKEN_HEADER, separators=(',', ':')).encode())}.{_b64encode(json.dumps(claims, separators=(',', ':')).encode())}"
+    token = f"{signing_input}.{_b64encode(_sign(signing_input.encode()))}"
+    return {"access_token": token, "token_type": "bearer", "expires_in": settings.AUTH_TOKEN_TTL_SECONDS}
+
+def decode_access_token(token: str) -> dict:
+    """Verify a token's signature and expiry; no database access."""
+    try:
+        header, payload, signature = token.split(".")
+        expected = _sign(f"{header}.{payload}".encode())
+        if not hmac.compare_digest(expected, _b64decode(signature)):
+            raise TokenError("Invalid token signature.")
+        if json.loads(_b64decode(header)) != _TOKEN_HEADER:
+            raise TokenError("Unsupported token header.")
+        claims = json.loads(_b64decode(payload))
+    except (ValueError, TypeError) as e:
+        raise TokenError("Malformed token.") from e
+    if not isinstance(claims, dict) or not isinstance(claims.get("exp"), int):
+        raise TokenError("Malformed token.")
+    if claims["exp"] <= time.time():
+        raise TokenError("Token has expired.")
+    return claims
+
+
+class TokenRevocationList:
+    """Revoked token ids, kept until the token would have expired anyway.
+
+    Always held in process memory; when the shared cache is Redis the
+    revocation is also written there so every worker honours it. The Redis
+    client is used directly rather than through RedisCache, so the per-request
+    revocation lookup does not count as a cache miss.
+    """
+
+    def __init__(self, client=None, prefix: str = "hms:"):
+        self.client = client
+        self.prefix = prefix
+        self._revoked = {}
+
+    def _purge(self, now: float):
+        for jti in [jti for jti, expires_at in self._revoked.items() if expires_at <= now]:
+            del self._revoked[jti]
+
+    async def revoke(self, jti: str, expires_at: float):
+        now = time.time()
+        self._purge(now)
+        self._revoked[jti] = expires_at
+        if self.client is not None:
+            await self.client.set(self._key(jti), str(expires_at), ex=max(1, int(expires_at - now) + 1))
+
+    async def is_revoked(self, jti: str) -> bool:
+        if jti in self._revoked:
+            return True
+        if self.client is not None:
+            return await self.client.get(self._key(jti)) is not None
+        return False
+
+    def _key(self, jti: str) -> str:
+        return f"{self.prefix}revoked_token:{jti}"
+
+
+# Id of the authenticated user for the current request, recorded as the actor
+# in the audit log. Async dependencies run in the request's own task, so a
+# value set here is visible to the handler and its session events.
+current_actor = contextvars.ContextVar("current_actor", default=None)
+
+revoked_tokens = TokenRevocationList(cache.client, cache.prefix) if isinstance(cache, RedisCache) else TokenRevocationList()
+bearer_scheme = HTTPBearer(auto_error=False)
+
+def _unauthorized(detail: str):
+    return HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=detail, headers={"WWW-Authenticate": "Bearer"})
+
+async def get_current_user(credentials: Annotated[Optional[HTTPAuthorizationCredentials], Depends(bearer_scheme)]) -> dict:
+    if credentials is None:
+        raise _unauthorized("Not authenticated.")
+    try:
+        claims = decode_access_token(credentials.credentials)
+    except TokenError as e:
+        raise _unauthorized(str(e))
+    if await revoked_tokens.is_revoked(claims["jti"]):
+        raise _unauthorized("Token has been revoked.")
+    current_actor.set(claims["sub"])
+    return claims
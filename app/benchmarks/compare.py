@@ -0,0 +1,49 @@
+"""Compare two load-test reports endpoint by endpoint.
+
+    python -m benchmarks.compare before.json after.json
+
+Runs are matched on concurrency; positive deltas mean the second report is
+slower (latency) or faster (throughput).
+"""
+import argparse
+import json
+
+METRICS = ("throughput_rps", "p50_ms", "p95_ms", "p99_ms")
+
+
+def _delta(before: float, after: float) -> str:
+    if not before:
+        return "n/a"
+    return f"{(after - before) / before * 100:+.1f}%"
+
+def compare(before: dict, after: dict):
+    lines = [f"before: {before['commit']}  after: {after['commit']}"]
+    after_runs = {run["concurrency"]: run for run in after["runs"]}
+    for run in before["runs"]:
+        other = after_runs.get(run["concurrency"])
+        if other is None:
+            continue
+        lines.append(f"\nconcurrency {run['concurrency']}")
+        lines.append(f"{'endpoint':40} " + " ".join(f"{metric:>30}" for metric in METRICS))
+        rows = [("TOTAL", run["total"], other["total"])]
+        rows += [(name, stats, other["endpoints"][name]) for name, stats in run["endpoints"].items() if name in other["endpoints"]]
+        for name, old, new in rows:
+            cells = [f"{old[metric]:>9} -> {new[metric]:>9} {_delta(old[metric], new[metric]):>8}" for metric in METRICS]
+            lines.append(f"{name:40} " + " ".join(cells))
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("before")
+    parser.add_argument("after")
+    args = parser.parse_args()
+    with open(args.before) as f:
+        before = json.load(f)
+    with open(args.after) as f:
+        after = json.load(f)
+    print(compare(before, after))
+
+
+if __name__ == "__main__":
+    main()
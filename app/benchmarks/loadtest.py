@@ -0,0 +1,205 @@
+"""Drive every router with concurrent HTTP requests and report latency.
+
+Start the API against a seeded database (see benchmarks.seed), then run from
+the app/ directory:
+
+    python -m benchmarks.loadtest --base-url http://127.0.0.1:8000 \\
+        --concurrency 32 --duration 30 --output bench.json
+
+The JSON report holds throughput and p50/p95/p99 latency per endpoint plus
+the git commit and run configuration; compare two reports with
+``python -m benchmarks.compare before.json after.json``.
+
+With authentication enabled pass --username/--password; one token is issued
+up front and sent with every request, so the report includes auth overhead.
+"""
+import argparse
+import asyncio
+import json
+import math
+import random
+import subprocess
+import time
+from datetime import datetime, timezone
+import httpx
+from sqlalchemy import create_engine, text
+from config.settings import settings
+
+SAMPLE_SIZE = 1000
+SEARCH_TERMS = ["Sharma", "Sharrma", "Priya Iyer", "Rahul", "+91700000"]
+FULL_TEXT_TERMS = ["diabetes", "hypertension", "fracture", "asthma"]
+
+
+def _sample_ids(database_url: str) -> dict:
+    queries = {
+        "patient": "SELECT patient_id FROM patients",
+        "doctor": "SELECT doctor_id FROM doctors",
+        "staff": "SELECT staff_id FROM staff",
+        "department": "SELECT department_id FROM departments",
+        "inventory": "SELECT item_id FROM inventory",
+        "bill": "SELECT bill_id FROM billing",
+        "appointment": "SELECT appointment_id FROM appointments",
+    }
+    engine = create_engine(database_url)
+    ids = {}
+    with engine.connect() as conn:
+        for name, sql in queries.items():
+            # TABLESAMPLE spreads the sample over large tables; small ones
+            # may sample nothing, so fall back to a plain LIMIT.
+            rows = conn.execute(text(f"{sql} TABLESAMPLE SYSTEM (1) LIMIT {SAMPLE_SIZE}")).all()
+            rows = rows or conn.execute(text(f"{sql} LIMIT {SAMPLE_SIZE}")).all()
+            ids[name] = [str(row[0]) for row in rows]
+    engine.dispose()
+    return ids
+
+def build_scenarios(ids: dict):
+    """(name, weight, request factory) for every router; the factory returns (method, url, json body)."""
+    pick = lambda name: random.choice(ids[name])
+    # New patients need unique phone numbers; start at a random offset so
+    # repeated runs against the same database rarely collide. The offset comes
+    # from the OS, not the module RNG, which --seed makes repeat every run.
+    phone_numbers = iter(range(6000000000 + random.SystemRandom().randrange(10 ** 9), 7000000000))
+    return [
+        ("GET /patients", 10, lambda: ("GET", "/patients?limit=50", None)),
+        ("GET /patients?city", 5, lambda: ("GET", "/patients?limit=50&city=Pune&fields=name,phone_number", None)),
+        ("GET /patients/{id}", 15, lambda: ("GET", f"/patients/{pick('patient')}", None)),
+        ("GET /patients/{id}/timeline", 8, lambda: ("GET", f"/patients/{pick('patient')}/timeline?limit=20", None)),
+        ("POST /patients/", 2, lambda: ("POST", "/patients/", {
+            "name": "Load Test", "date_of_birth": "1990-01-01", "address": "1 Test Road", "city": "Pune", "state": "Maharashtra",
+            "zip_code": "411001", "phone_number": f"+91{next(phone_numbers)}",
+            "email": None, "medical_history": "none",
+        })),
+        ("GET /doctors/", 5, lambda: ("GET", "/doctors/?limit=50&specialization=Cardiology", None)),
+        ("GET /doctors/{id}", 10, lambda: ("GET", f"/doctors/{pick('doctor')}", None)),
+        ("GET /staff", 3, lambda: ("GET", "/staff?limit=50", None)),
+        ("GET /staff/{id}", 5, lambda: ("GET", f"/staff/{pick('staff')}", None)),
+        ("GET /departments", 2, lambda: ("GET", "/departments?limit=50", None)),
+        ("GET /departments/{id}", 5, lambda: ("GET", f"/departments/{pick('department')}", None)),
+        ("GET /inventory", 3, lambda: ("GET", "/inventory?limit=50&category=Medicine", None)),
+        ("GET /inventory/{id}", 4, lambda: ("GET", f"/inventory/{pick('inventory')}", None)),
+        ("GET /inventory/alerts", 3, lambda: ("GET", "/inventory/alerts", None)),
+        ("GET /appointments", 3, lambda: ("GET", f"/appointments?doctor_id={pick('doctor')}", None)),
+        ("GET /appointments/{id}", 4, lambda: ("GET", f"/appointments/{pick('appointment')}", None)),
+        ("GET /appointments/slots/next", 3, lambda: ("GET", "/appointments/slots/next?specialization=Cardiology&limit=5", None)),
+        ("GET /billing/{id}", 4, lambda: ("GET", f"/billing/{pick('bill')}", None)),
+        ("GET /billing/reports/summary", 2, lambda: ("GET", "/billing/reports/summary?group_by=payment_method&group_by=payment_status", None)),
+        ("GET /search/patients", 5, lambda: ("GET", f"/search/patients?q={random.choice(SEARCH_TERMS)}", None)),
+        ("GET /search/medical-records", 3, lambda: ("GET", f"/search/medical-records?q={random.choice(FULL_TEXT_TERMS)}", None)),
+        ("GET /export/departments", 1, lambda: ("GET", "/export/departments", None)),
+        ("GET /health/pool", 1, lambda: ("GET", "/health/pool", None)),
+    ]
+
+def percentile(sorted_values, fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    # Nearest-rank percentile.
+    index = min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+async def run(base_url: str, scenarios, concurrency: int, duration: float, warmup: float, headers: dict) -> dict:
+    names = [name for name, _, _ in scenarios]
+    weights = [weight for _, weight, _ in scenarios]
+    factories = {name: factory for name, _, factory in scenarios}
+    latencies = {name: [] for name in names}
+    errors = {name: 0 for name in names}
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0, headers=headers) as client:
+        async def worker(deadline: float, record: bool):
+            while time.perf_counter() < deadline:
+                name = random.choices(names, weights)[0]
+                method, url, body = factories[name]()
+                started = time.perf_counter()
+                try:
+                    response = await client.request(method, url, json=body)
+                    failed = response.status_code >= 500
+                except httpx.HTTPError:
+                    failed = True
+                elapsed = time.perf_counter() - started
+                if record:
+                    latencies[name].append(elapsed)
+                    errors[name] += failed
+
+        if warmup:
+            deadline = time.perf_counter() + warmup
+            await asyncio.gather(*(worker(deadline, False) for _ in range(concurrency)))
+        started = time.perf_counter()
+        deadline = started + duration
+        await asyncio.gather(*(worker(deadline, True) for _ in range(concurrency)))
+        wall = time.perf_counter() - started
+
+    endpoints = {}
+    for name in names:
+        values = sorted(latencies[name])
+        if not values:
+            continue
+        endpoints[name] = {
+            "requests": len(values),
+            "errors": errors[name],
+            "throughput_rps": round(len(values) / wall, 2),
+            "mean_ms": round(sum(values) / len(values) * 1000, 3),
+            "p50_ms": round(percentile(values, 0.50) * 1000, 3),
+            "p95_ms": round(percentile(values, 0.95) * 1000, 3),
+            "p99_ms": round(percentile(values, 0.99) * 1000, 3),
+        }
+    everything = sorted(value for values in latencies.values() for value in values)
+    return {
+        "total": {
+            "requests": len(everything),
+            "errors": sum(errors.values()),
+            "throughput_rps": round(len(everything) / wall, 2),
+            "p50_ms": round(percentile(everything, 0.50) * 1000, 3),
+            "p95_ms": round(percentile(everything, 0.95) * 1000, 3),
+            "p99_ms": round(percentile(everything, 0.99) * 1000, 3),
+        },
+        "endpoints": endpoints,
+    }
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def _login(base_url: str, username: str, password: str) -> dict:
+    response = httpx.post(f"{base_url}/users/login", json={"username": username, "password": password}, timeout=30.0)
+    response.raise_for_status()
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--database-url", default=settings.DATABASE_URL, help="used only to sample existing ids")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[32], help="one run per value, e.g. 1 8 32 128")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds measured per run")
+    parser.add_argument("--warmup", type=float, default=5.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--username", help="log in as this user and send its bearer token")
+    parser.add_argument("--password")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    scenarios = build_scenarios(_sample_ids(args.database_url))
+    headers = _login(args.base_url, args.username, args.password) if args.username else {}
+    report = {
+        "commit": _git_commit(),
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "config": {"base_url": args.base_url, "duration": args.duration, "warmup": args.warmup, "seed": args.seed},
+        "runs": [],
+    }
+    for concurrency in args.concurrency:
+        result = asyncio.run(run(args.base_url, scenarios, concurrency, args.duration, args.warmup, headers))
+        report["runs"].append({"concurrency": concurrency, **result})
+    output = json.dumps(report, indent=2, default=str)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Measure worker cold start and throughput scaling of serve.py.
+
+For each worker count the production launcher is started from scratch, the
+readiness endpoint is polled to time the cold start, the load test runs at a
+fixed concurrency and the server is stopped with SIGTERM. Run from the app/
+directory against a migrated, seeded database, with CACHE_BACKEND=redis
+since serve.py refuses to start several workers on the in-process cache:
+
+    CACHE_BACKEND=redis python -m benchmarks.scaling --workers 1 2 4 8 --concurrency 64 \\
+        --duration 30 --output scaling.json
+
+Cold start is reported twice: until the first worker answers ready, and
+until every worker has (each reports its pid and its own lifespan time).
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import signal
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+import httpx
+from benchmarks.loadtest import _git_commit, _login, _sample_ids, build_scenarios, run
+from config.settings import settings
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _wait_ready(base_url: str, workers: int, timeout: float) -> dict:
+    started = time.perf_counter()
+    first_ready, pids = None, {}
+    deadline = started + timeout
+    while time.perf_counter() < deadline and len(pids) < workers:
+        try:
+            # A fresh connection each time so the kernel can hand it to any worker.
+            response = httpx.get(f"{base_url}/health/ready", timeout=2.0, headers={"Connection": "close"})
+        except httpx.HTTPError:
+            response = None
+        if response is not None and response.status_code == 200:
+            body = response.json()
+            first_ready = first_ready or time.perf_counter() - started
+            pids.setdefault(body["pid"], body["startup_seconds"])
+        else:
+            time.sleep(0.05)
+    if first_ready is None:
+        raise RuntimeError(f"Server did not become ready within {timeout}s")
+    return {
+        "first_ready_seconds": round(first_ready, 3),
+        "all_ready_seconds": round(time.perf_counter() - started, 3) if len(pids) == workers else None,
+        "workers_seen": len(pids),
+        "worker_lifespan_seconds": sorted(round(value, 3) for value in pids.values()),
+    }
+
+
+def measure(workers: int, args, scenarios) -> dict:
+    base_url = f"http://127.0.0.1:{args.port}"
+    server = subprocess.Popen(
+        [sys.executable, "serve.py", "--port", str(args.port), "--workers", str(workers), "--log-level", "warning"],
+        cwd=APP_DIR,
+    )
+    try:
+        startup = _wait_ready(base_url, workers, args.startup_timeout)
+        headers = _login(base_url, args.username, args.password) if args.username else {}
+        result = asyncio.run(run(base_url, scenarios, args.concurrency, args.duration, args.warmup, headers))
+    finally:
+        stopping = time.perf_counter()
+        server.send_signal(signal.SIGTERM)
+        try:
+            server.wait(timeout=settings.GRACEFUL_SHUTDOWN_SECONDS + 10)
+        except subprocess.TimeoutExpired:
+            server.kill()
+            server.wait()
+        shutdown_seconds = time.perf_counter() - stopping
+    return {"workers": workers, "startup": startup, "shutdown_seconds": round(shutdown_seconds, 3), **result}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--database-url", default=settings.DATABASE_URL, help="used only to sample existing ids")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--warmup", type=float, default=5.0)
+    parser.add_argument("--startup-timeout", type=float, default=60.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--username")
+    parser.add_argument("--password")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    scenarios = build_scenarios(_sample_ids(args.database_url))
+    runs = [measure(workers, args, scenarios) for workers in sorted(set(args.workers))]
+    baseline = runs[0]["total"]["throughput_rps"] or None
+    for result in runs:
+        result["speedup"] = round(result["total"]["throughput_rps"] / baseline, 2) if baseline else None
+    report = {
+        "commit": _git_commit(),
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "config": {"concurrency": args.concurrency, "duration": args.duration, "warmup": args.warmup, "cpu_count": os.cpu_count()},
+        "runs": runs,
+    }
+    output = json.dumps(report, indent=2, default=str)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""Seed a local database with synthetic data for benchmarking.
+
+Run from the app/ directory against a database migrated with
+`alembic upgrade head`:
+
+    python -m benchmarks.seed --scale 10000 --truncate
+
+``--scale`` is the number of patients; the other tables are sized relative to
+it (2 appointments, 1 medical record and 2 bills per patient, one doctor per
+100 patients, ...), so --scale 5000000 produces roughly 30M rows in total.
+Data is generated from a fixed random seed, so runs are reproducible.
+"""
+import argparse
+import random
+import time
+import uuid
+from datetime import date, timedelta
+from decimal import Decimal
+from sqlalchemy import create_engine, text
+from config.settings import settings
+from models.models import Appointment, Billing, Department, Doctor, Inventory, MedicalRecord, Patient, Staff
+
+CHUNK_SIZE = 5000
+CITIES = [("Mumbai", "Maharashtra"), ("Pune", "Maharashtra"), ("Delhi", "Delhi"), ("Bengaluru", "Karnataka"), ("Chennai", "Tamil Nadu"), ("Kolkata", "West Bengal"), ("Jaipur", "Rajasthan"), ("Ahmedabad", "Gujarat")]
+FIRST_NAMES = ["Aarav", "Vivaan", "Aditya", "Diya", "Ananya", "Ishaan", "Kavya", "Rohan", "Saanvi", "Arjun", "Meera", "Kabir", "Priya", "Rahul", "Sneha"]
+LAST_NAMES = ["Sharma", "Verma", "Patel", "Iyer", "Reddy", "Nair", "Gupta", "Singh", "Khan", "Das", "Joshi", "Mehta"]
+SPECIALIZATIONS = ["Cardiology", "Neurology", "Orthopedics", "Pediatrics", "Dermatology", "Oncology", "General Medicine", "ENT"]
+CONDITIONS = ["hypertension", "type 2 diabetes", "asthma", "migraine", "fracture of the left radius", "seasonal allergies", "hypothyroidism", "anaemia", "gastritis", "lower back pain"]
+TREATMENTS = ["physiotherapy", "dietary changes and exercise", "inhaled corticosteroids", "cast and rest", "antibiotics course", "beta blockers", "insulin therapy", "iron supplements"]
+PAYMENT_METHODS = ["Cash", "Card", "UPI", "Insurance"]
+PAYMENT_STATUSES = ["Paid", "Paid", "Paid", "Pending", "Overdue"]
+INVENTORY_CATEGORIES = ["Medicine", "Consumable", "Equipment", "Surgical"]
+SLOTS_PER_DAY = 16
+
+TABLES = [Billing, MedicalRecord, Appointment, Department, Staff, Inventory, Doctor, Patient]
+
+
+def _name(rng):
+    return f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+
+def _insert(conn, model, rows):
+    total = 0
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == CHUNK_SIZE:
+            conn.execute(model.__table__.insert(), batch)
+            total += len(batch)
+            batch = []
+    if batch:
+        conn.execute(model.__table__.insert(), batch)
+        total += len(batch)
+    return total
+
+def seed(database_url: str, scale: int, random_seed: int = 42, truncate: bool = False) -> dict:
+    rng = random.Random(random_seed)
+    today = date.today()
+    counts = {
+        "patients": scale,
+        "doctors": max(10, scale // 100),
+        "staff": max(10, scale // 200),
+        "departments": len(SPECIALIZATIONS),
+        "inventory": max(100, scale // 10),
+        "appointments": scale * 2,
+        "medical_records": scale,
+        "bills": scale * 2,
+    }
+    patient_ids = [uuid.UUID(int=rng.getrandbits(128), version=4) for _ in range(counts["patients"])]
+    doctor_ids = [uuid.UUID(int=rng.getrandbits(128), version=4) for _ in range(counts["doctors"])]
+    staff_ids = [uuid.UUID(int=rng.getrandbits(128), version=4) for _ in range(counts["staff"])]
+
+    def patients():
+        for n, patient_id in enumerate(patient_ids):
+            city, state = rng.choice(CITIES)
+            yield {
+                "patient_id": patient_id, "name": _name(rng), "date_of_birth": today - timedelta(days=rng.randint(365, 90 * 365)),
+                "address": f"{rng.randint(1, 999)} MG Road", "city": city, "state": state, "zip_code": f"{rng.randint(100000, 999999)}",
+                "phone_number": f"+91{7000000000 + n}", "email": f"patient{n}@example.com",
+                "medical_history": ", ".join(rng.sample(CONDITIONS, rng.randint(0, 3))),
+            }
+
+    def doctors():
+        for n, doctor_id in enumerate(doctor_ids):
+            yield {
+                "doctor_id": doctor_id, "name": f"Dr. {_name(rng)}", "specialization": SPECIALIZATIONS[n % len(SPECIALIZATIONS)],
+                "phone_number": f"+91{8000000000 + n}", "email": f"doctor{n}@example.com",
+                "availability_schedule": "Mon-Fri 09:00-17:00",
+            }
+
+    def staff():
+        for n, staff_id in enumerate(staff_ids):
+            yield {
+                "staff_id": staff_id, "name": _name(rng), "role": rng.choice(["Nurse", "Technician", "Receptionist", "Pharmacist"]),
+                "phone_number": f"+91{9000000000 + n}", "email": f"staff{n}@example.com", "schedule": "Mon-Sat 08:00-16:00",
+            }
+
+    def departments():
+        for n, specialization in enumerate(SPECIALIZATIONS):
+            yield {
+                "department_id": uuid.UUID(int=rng.getrandbits(128), version=4), "name": specialization,
+                "head_of_department_id": staff_ids[n % len(staff_ids)], "contact_information": f"ext. {100 + n}",
+            }
+
+    def inventory():
+        for n in range(counts["inventory"]):
+            yield {
+                "item_id": uuid.UUID(int=rng.getrandbits(128), version=4), "name": f"Item {n}", "quantity": rng.randint(0, 500),
+                "supplier": f"Supplier {n % 50}", "expiry_date": today + timedelta(days=rng.randint(-30, 720)),
+                "category": rng.choice(INVENTORY_CATEGORIES),
+            }
+
+    def appointments():
+        # Walk each doctor's day in fixed slots so (doctor, date, time) stays
+        # unique, as the partial unique index requires.
+        for n in range(counts["appointments"]):
+            doctor_index, slot = n % len(doctor_ids), n // len(doctor_ids)
+            day = today - timedelta(days=365) + timedelta(days=slot // SLOTS_PER_DAY)
+            minutes = 9 * 60 + (slot % SLOTS_PER_DAY) * 30
+            yield {
+                "appointment_id": uuid.UUID(int=rng.getrandbits(128), version=4), "patient_id": rng.choice(patient_ids),
+                "doctor_id": doctor_ids[doctor_index], "date": day, "time": f"{minutes // 60:02d}:{minutes % 60:02d}",
+                "status": "Completed" if day < today else "Pending",
+            }
+
+    def medical_records():
+        for _ in range(counts["medical_records"]):
+            yield {
+                "record_id": uuid.UUID(int=rng.getrandbits(128), version=4), "patient_id": rng.choice(patient_ids),
+                "doctor_id": rng.choice(doctor_ids), "diagnosis": rng.choice(CONDITIONS), "treatment": rng.choice(TREATMENTS),
+                "prescription": "As directed", "date": today - timedelta(days=rng.randint(0, 3 * 365)),
+            }
+
+    def bills():
+        for _ in range(counts["bills"]):
+            yield {
+                "bill_id": uuid.UUID(int=rng.getrandbits(128), version=4), "patient_id": rng.choice(patient_ids),
+                "date": today - timedelta(days=rng.randint(0, 365)), "amount": Decimal(rng.randint(10000, 5000000)) / 100,
+                "payment_status": rng.choice(PAYMENT_STATUSES), "insurance_details": "None", "payment_method": rng.choice(PAYMENT_METHODS),
+            }
+
+    engine = create_engine(database_url)
+    timings = {}
+    with engine.begin() as conn:
+        if truncate:
+            names = ", ".join(model.__tablename__ for model in TABLES)
+            conn.execute(text(f"TRUNCATE {names}, doctor_slots, billing_daily_summary CASCADE"))
+        for label, model, rows in [
+            ("patients", Patient, patients()), ("doctors", Doctor, doctors()), ("staff", Staff, staff()),
+            ("departments", Department, departments()), ("inventory", Inventory, inventory()),
+            ("appointments", Appointment, appointments()), ("medical_records", MedicalRecord, medical_records()),
+            ("bills", Billing, bills()),
+        ]:
+            started = time.perf_counter()
+            _insert(conn, model, rows)
+            timings[label] = round(time.perf_counter() - started, 3)
+        # Bulk-loaded bills bypass the routes, so rebuild their summary once.
+        conn.execute(text("DELETE FROM billing_daily_summary"))
+        conn.execute(text(
+            "INSERT INTO billing_daily_summary (day, payment_method, payment_status, bill_count, total_amount) "
+            "SELECT date, payment_method, payment_status, count(*), sum(amount) FROM billing "
+            "GROUP BY date, payment_method, payment_status"
+        ))
+    with engine.connect() as conn:
+        conn.execution_options(isolation_level="AUTOCOMMIT").execute(text("ANALYZE"))
+    engine.dispose()
+    return {"scale": scale, "seed": random_seed, "rows": counts, "seconds": timings}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    parser.add_argument("--scale", type=int, default=10000, help="number of patients (other tables scale with it)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--truncate", action="store_true", help="empty the tables first")
+    args = parser.parse_args()
+    print(seed(args.database_url, args.scale, args.seed, args.truncate))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Serialization cost per 1,000 rows: old list path versus the fast path.
+
+Run from the app/ directory:
+
+    python -m benchmarks.serialization --rows 1000 --repeat 50
+
+"before" reproduces what FastAPI did for ``response_model=List[PatientCreate]``:
+validate ORM instances through the create schema (from_attributes, phone and
+zip regexes, EmailStr), dump them in JSON mode and encode with the stdlib
+json module. "after" encodes the plain row mappings that crud.get_page
+returns with FastJSONResponse (orjson when installed). Steps are also timed
+separately, so the share of validation versus encoding is visible.
+
+With --database-url the same comparison includes fetching: ORM instances via
+session.scalars() versus mappings of the public columns.
+"""
+import argparse
+import json
+import statistics
+import time
+import uuid
+from datetime import date, timedelta
+from typing import List
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+from crud import public_columns
+from models.models import Patient
+from responses import FastJSONResponse, orjson
+from schemas.schema import PatientCreate, PatientRead
+
+
+def _rows(count: int):
+    start = date(1950, 1, 1)
+    return [
+        {
+            "patient_id": uuid.UUID(int=index + 1),
+            "name": f"Patient {index}",
+            "date_of_birth": start + timedelta(days=index % 20000),
+            "address": f"{index} Main Road",
+            "city": "Pune",
+            "state": "Maharashtra",
+            "zip_code": f"{411000 + index % 1000:06d}",
+            "phone_number": f"+91{9000000000 + index}",
+            "email": f"patient{index}@example.com",
+            "medical_history": "Hypertension; seasonal allergies. " * 4,
+        }
+        for index in range(count)
+    ]
+
+def _time(fn, repeat: int) -> float:
+    fn()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def measure(count: int, repeat: int) -> dict:
+    rows = _rows(count)
+    instances = [Patient(**row) for row in rows]
+    create_adapter = TypeAdapter(List[PatientCreate])
+    read_adapter = TypeAdapter(List[PatientRead])
+    page = {"items": rows, "next_cursor": rows[-1]["patient_id"]}
+    response = FastJSONResponse(page)
+
+    def before():
+        validated = create_adapter.validate_python(instances, from_attributes=True)
+        return json.dumps(create_adapter.dump_python(validated, mode="json")).encode()
+
+    results = {
+        "before_total": _time(before, repeat),
+        "before_validate": _time(lambda: create_adapter.validate_python(instances, from_attributes=True), repeat),
+        "read_schema_validate": _time(lambda: read_adapter.validate_python(rows), repeat),
+        "after_total": _time(lambda: response.render(page), repeat),
+    }
+    scale = 1000 / count
+    report = {name: round(seconds * scale * 1000, 3) for name, seconds in results.items()}
+    report["speedup"] = round(results["before_total"] / results["after_total"], 1)
+    return report
+
+def measure_fetch(database_url: str, count: int, repeat: int) -> dict:
+    engine = create_engine(database_url)
+    columns = list(public_columns(Patient).values())
+    with Session(engine) as session:
+        def orm():
+            session.expunge_all()
+            return session.scalars(select(Patient).limit(count)).all()
+
+        def mappings():
+            return [dict(row) for row in session.execute(select(*columns).limit(count)).mappings()]
+
+        fetched = len(mappings())
+        results = {"fetch_orm": _time(orm, repeat), "fetch_mappings": _time(mappings, repeat)}
+    engine.dispose()
+    scale = 1000 / max(fetched, 1)
+    return {name: round(seconds * scale * 1000, 3) for name, seconds in results.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--database-url", help="also time fetching ORM instances versus row mappings")
+    args = parser.parse_args()
+
+    report = {"rows": args.rows, "encoder": "orjson" if orjson is not None else "json", "ms_per_1000_rows": measure(args.rows, args.repeat)}
+    if args.database_url:
+        report["ms_per_1000_rows"].update(measure_fetch(args.database_url, args.rows, args.repeat))
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
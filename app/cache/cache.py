@@ -0,0 +1,166 @@
+import abc
+import itertools
+import json
+import time
+from collections import OrderedDict
+from typing import Optional
+from config.settings import settings
+
+
+class CacheStats:
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def as_dict(self):
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "invalidations": self.invalidations}
+
+
+class BaseCache(abc.ABC):
+    backend = "base"
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self.stats = CacheStats()
+
+    @abc.abstractmethod
+    async def get(self, key: str):
+        ...
+
+    @abc.abstractmethod
+    async def set(self, key: str, value, ttl: Optional[float] = None):
+        ...
+
+    @abc.abstractmethod
+    async def delete(self, *keys: str):
+        """Drop the keys and advance their generation."""
+
+    @abc.abstractmethod
+    async def generation(self, key: str):
+        """Opaque marker that changes whenever the key is deleted."""
+
+    async def get_or_load(self, key: str, loader):
+        # Read-through: misses are filled from loader(); None is never cached
+        # so a missing row is looked up again on the next request. A value
+        # loaded while the key was invalidated may predate the write that
+        # invalidated it, so it is returned but not cached.
+        value = await self.get(key)
+        if value is not None:
+            return value
+        generation = await self.generation(key)
+        value = await loader()
+        if value is not None and await self.generation(key) == generation:
+            await self.set(key, value)
+        return value
+
+    def snapshot(self):
+        return {"backend": self.backend, "ttl_seconds": self.ttl, **self.stats.as_dict()}
+
+
+class InMemoryCache(BaseCache):
+    """Per-process TTL cache with LRU eviction once max_entries is reached."""
+
+    backend = "memory"
+
+    def __init__(self, ttl: float, max_entries: int):
+        super().__init__(ttl)
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        # Generations come from one counter so they never repeat. Only the
+        # most recent ones are kept; a forgotten key reports the highest
+        # generation dropped so far, which still differs from anything it
+        # could have reported before its last delete.
+        self._counter = itertools.count(1)
+        self._generations = OrderedDict()
+        self._generation_floor = 0
+
+    async def get(self, key: str):
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            self.stats.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return dict(value)
+
+    async def set(self, key: str, value, ttl: Optional[float] = None):
+        self._entries[key] = (time.monotonic() + (ttl or self.ttl), dict(value))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    async def delete(self, *keys: str):
+        for key in keys:
+            self._generations[key] = next(self._counter)
+            self._generations.move_to_end(key)
+            if self._entries.pop(key, None) is not None:
+                self.stats.invalidations += 1
+        while len(self._generations) > self.max_entries:
+            _, dropped = self._generations.popitem(last=False)
+            self._generation_floor = max(self._generation_floor, dropped)
+
+    async def generation(self, key: str):
+        return self._generations.get(key, self._generation_floor)
+
+    def snapshot(self):
+        return {**super().snapshot(), "entries": len(self._entries), "max_entries": self.max_entries}
+
+
+class RedisCache(BaseCache):
+    """Adapter for any client exposing the async redis get/set(ex=)/delete/incr/expire API.
+
+    Eviction is left to the server's maxmemory policy, so the evictions
+    counter stays at zero here; read it from Redis INFO instead.
+    """
+
+    backend = "redis"
+
+    def __init__(self, client, ttl: float, prefix: str = "hms:"):
+        super().__init__(ttl)
+        self.client = client
+        self.prefix = prefix
+
+    async def get(self, key: str):
+        raw = await self.client.get(self.prefix + key)
+        if raw is None:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return json.loads(raw)
+
+    async def set(self, key: str, value, ttl: Optional[float] = None):
+        await self.client.set(self.prefix + key, json.dumps(value, default=str), ex=int(ttl or self.ttl))
+
+    async def delete(self, *keys: str):
+        # The generation is bumped before the value goes, so a concurrent
+        # get_or_load sees the change when it comes to write back. Generations
+        # outlive any load by far but do not accumulate forever.
+        for key in keys:
+            await self.client.incr(self._generation_key(key))
+            await self.client.expire(self._generation_key(key), int(10 * self.ttl))
+        if keys:
+            self.stats.invalidations += await self.client.delete(*(self.prefix + key for key in keys))
+
+    async def generation(self, key: str):
+        return await self.client.get(self._generation_key(key))
+
+    def _generation_key(self, key: str) -> str:
+        return f"{self.prefix}generation:{key}"
+
+
+def create_cache():
+    if settings.CACHE_BACKEND == "redis":
+        from redis import asyncio as redis_asyncio
+        return RedisCache(redis_asyncio.from_url(settings.REDIS_URL), ttl=settings.CACHE_TTL_SECONDS)
+    return InMemoryCache(ttl=settings.CACHE_TTL_SECONDS, max_entries=settings.CACHE_MAX_ENTRIES)
+
+
+cache = create_cache()
@@ -0,0 +1,162 @@
+import uuid
+from typing import Optional
+from sqlalchemy import func, inspect, literal_column, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+BULK_MAX_ITEMS = 10000
+# Rows per INSERT statement; keeps bind parameters well under the driver limit.
+BULK_CHUNK_SIZE = 1000
+
+# Awaited as listener(db, model, [(row, result), ...]) before bulk_upsert
+# commits, for side effects that must share its transaction (the audit log).
+bulk_write_listeners = []
+
+
+UNIQUE_VIOLATION = "23505"
+FOREIGN_KEY_VIOLATION = "23503"
+
+def integrity_violation(error: SQLAlchemyError):
+    """(SQLSTATE, constraint name) of an IntegrityError, where the driver reports them."""
+    # asyncpg raises the server error as the cause of the DBAPI adapter's
+    # exception; psycopg exposes it through diag.
+    for source in (error.orig, getattr(error.orig, "__cause__", None), getattr(error.orig, "diag", None)):
+        constraint = getattr(source, "constraint_name", None)
+        if constraint:
+            return getattr(source, "sqlstate", None) or getattr(error.orig, "pgcode", None), constraint
+    return getattr(error.orig, "sqlstate", None), None
+
+def primary_key(model):
+    return inspect(model).primary_key[0]
+
+def public_columns(model):
+    # Columns flagged info={"internal": True} (e.g. search vectors) are never
+    # returned by the API.
+    return {column.key: column for column in inspect(model).columns if not column.info.get("internal")}
+
+def version_column(model):
+    # Models opt into optimistic concurrency via __mapper_args__ version_id_col.
+    return inspect(model).version_id_col
+
+def row_to_dict(item):
+    return {key: getattr(item, key) for key in public_columns(type(item))}
+
+def parse_fields(model, fields: Optional[str]):
+    columns = public_columns(model)
+    if not fields:
+        return list(columns.values())
+    names = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in names if name not in columns]
+    if unknown:
+        raise ValueError(f"Unknown field(s) for {model.__name__}: {', '.join(unknown)}")
+    pk = primary_key(model)
+    # The primary key is always selected because it is the pagination cursor,
+    # and the version because list ETags are derived from it.
+    always = [column for column in (pk, version_column(model)) if column is not None]
+    return always + [columns[name] for name in names if name not in {column.key for column in always}]
+
+async def get_page(model, db: AsyncSession, limit: int = DEFAULT_PAGE_SIZE, cursor=None, filters: Optional[dict] = None, fields: Optional[str] = None):
+    pk = primary_key(model)
+    stmt = select(*parse_fields(model, fields)).order_by(pk).limit(limit + 1)
+    if cursor is not None:
+        stmt = stmt.where(pk > cursor)
+    for name, value in (filters or {}).items():
+        if value is not None:
+            stmt = stmt.where(getattr(model, name) == value)
+    rows = (await db.execute(stmt)).mappings().all()
+    next_cursor = rows[limit - 1][pk.key] if len(rows) > limit else None
+    return {"items": [dict(row) for row in rows[:limit]], "next_cursor": next_cursor}
+
+async def get_row(model, db: AsyncSession, item_id):
+    # Plain mapping of the public columns; no ORM instance or identity map.
+    row = (await db.execute(select(*public_columns(model).values()).where(primary_key(model) == item_id))).mappings().first()
+    return dict(row) if row is not None else None
+
+async def create_item(model, db: AsyncSession, data: dict):
+    item = model(**data)
+    db.add(item)
+    await db.commit()
+    await db.refresh(item)
+    return item
+
+async def get_items(model, db: AsyncSession):
+    result = await db.execute(select(model))
+    return result.scalars().all()
+
+async def get_item(model, db: AsyncSession, item_id):
+    return await db.get(model, item_id)
+
+async def update_item(model, db: AsyncSession, item_id, data: dict):
+    item = await db.get(model, item_id)
+    if item is None:
+        return None
+    for key, value in data.items():
+        setattr(item, key, value)
+    await db.commit()
+    await db.refresh(item)
+    return item
+
+async def delete_item(model, db: AsyncSession, item_id):
+    item = await db.get(model, item_id)
+    if item is None:
+        return False
+    try:
+        await db.delete(item)
+        await db.commit()
+    except SQLAlchemyError:
+        await db.rollback()
+        return False
+    return True
+
+async def bulk_upsert(model, db: AsyncSession, items: list, conflict_key: Optional[str] = None):
+    # One multi-row INSERT per chunk, all in a single transaction. With a
+    # conflict_key existing rows are updated in place (ON CONFLICT DO UPDATE);
+    # duplicates inside the batch are skipped because Postgres cannot update
+    # the same row twice in one statement.
+    pk = primary_key(model)
+    results = [None] * len(items)
+    pending = []
+    seen = {}
+    for index, item in enumerate(items):
+        if conflict_key is not None:
+            key = item[conflict_key]
+            if key in seen:
+                results[index] = {"index": index, "id": None, "outcome": "skipped", "detail": f"Duplicate {conflict_key} in batch (item {seen[key]})."}
+                continue
+            seen[key] = index
+        pending.append((index, {pk.key: uuid.uuid4(), **item}))
+
+    for start in range(0, len(pending), BULK_CHUNK_SIZE):
+        chunk = pending[start:start + BULK_CHUNK_SIZE]
+        stmt = pg_insert(model).values([row for _, row in chunk])
+        if conflict_key is None:
+            await db.execute(stmt)
+            for index, row in chunk:
+                results[index] = {"index": index, "id": row[pk.key], "outcome": "created", "detail": None}
+            continue
+        set_ = {key: stmt.excluded[key] for key in chunk[0][1] if key not in (pk.key, conflict_key)}
+        version = version_column(model)
+        if version is not None:
+            # Core upserts bypass the ORM's version counter, so bump it here.
+            set_.update({version.key: version + 1, "updated_at": func.now()})
+        stmt = stmt.on_conflict_do_update(index_elements=[conflict_key], set_=set_).returning(
+            pk, getattr(model, conflict_key), literal_column("xmax = 0").label("inserted")
+        )
+        returned = {row[1]: row for row in (await db.execute(stmt)).all()}
+        for index, row in chunk:
+            item_id, _, inserted = returned[row[conflict_key]]
+            results[index] = {"index": index, "id": item_id, "outcome": "created" if inserted else "updated", "detail": None}
+    for listener in bulk_write_listeners:
+        await listener(db, model, [(row, results[index]) for index, row in pending])
+    await db.commit()
+
+    outcomes = [result["outcome"] for result in results]
+    return {
+        "created": outcomes.count("created"),
+        "updated": outcomes.count("updated"),
+        "skipped": outcomes.count("skipped"),
+        "results": results,
+    }
@@ -0,0 +1,109 @@
+import threading
+from bisect import bisect_left
+
+from sqlalchemy import event
+
+# Upper bounds (seconds) of the checkout latency histogram buckets.
+CHECKOUT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class PoolMetrics:
+    """Checkout latency and connection churn of one engine's pool."""
+
+    def __init__(self, name: str, buckets=CHECKOUT_BUCKETS):
+        self.name = name
+        self.engine = None
+        self._lock = threading.Lock()
+        self.buckets = buckets
+        self.bucket_counts = [0] * (len(buckets) + 1)
+        self.checkout_count = 0
+        self.checkout_seconds_total = 0.0
+        self.checkout_seconds_max = 0.0
+        self.connections_opened = 0
+        self.invalidations = 0
+        self.timeouts = 0
+
+    def observe_checkout(self, seconds: float):
+        with self._lock:
+            self.bucket_counts[bisect_left(self.buckets, seconds)] += 1
+            self.checkout_count += 1
+            self.checkout_seconds_total += seconds
+            self.checkout_seconds_max = max(self.checkout_seconds_max, seconds)
+
+    def observe_timeout(self):
+        with self._lock:
+            self.timeouts += 1
+
+    def attach(self, engine):
+        self.engine = engine
+
+        @event.listens_for(engine, "connect")
+        def _on_connect(dbapi_connection, connection_record):
+            with self._lock:
+                self.connections_opened += 1
+
+        @event.listens_for(engine, "invalidate")
+        def _on_invalidate(dbapi_connection, connection_record, exception):
+            with self._lock:
+                self.invalidations += 1
+
+    def snapshot(self) -> dict:
+        pool = self.engine.pool
+        with self._lock:
+            cumulative, histogram = 0, []
+            for bound, count in zip(self.buckets + (float("inf"),), self.bucket_counts):
+                cumulative += count
+                histogram.append({"le": "+Inf" if bound == float("inf") else bound, "count": cumulative})
+            checkout = {
+                "count": self.checkout_count,
+                "seconds_total": self.checkout_seconds_total,
+                "seconds_avg": self.checkout_seconds_total / self.checkout_count if self.checkout_count else 0.0,
+                "seconds_max": self.checkout_seconds_max,
+                "timeouts": self.timeouts,
+                "histogram": histogram,
+            }
+            connections_opened, invalidations = self.connections_opened, self.invalidations
+        return {
+            "name": self.name,
+            "pool_class": type(pool).__name__,
+            "size": _call(pool, "size"),
+            "checked_in": _call(pool, "checkedin"),
+            "checked_out": _call(pool, "checkedout"),
+            "overflow": _call(pool, "overflow"),
+            "connections_opened": connections_opened,
+            "invalidations": invalidations,
+            "checkout": checkout,
+        }
+
+
+def _call(pool, name):
+    method = getattr(pool, name, None)
+    return method() if callable(method) else None
+
+
+class PoolMetricsRegistry:
+    """One PoolMetrics per engine, so replica pressure is not mixed into the
+    primary's numbers. Engines are keyed by their sync engine."""
+
+    def __init__(self):
+        self._by_name = {}
+        self._by_engine = {}
+
+    def attach(self, name: str, engine) -> PoolMetrics:
+        metrics = PoolMetrics(name)
+        metrics.attach(engine)
+        self._by_name[name] = self._by_engine[engine] = metrics
+        return metrics
+
+    def for_engine(self, engine) -> PoolMetrics:
+        return self._by_engine[engine]
+
+    def all(self):
+        return list(self._by_name.values())
+
+    def clear(self):
+        self._by_name.clear()
+        self._by_engine.clear()
+
+
+pool_metrics = PoolMetricsRegistry()
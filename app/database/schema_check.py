@@ -0,0 +1,38 @@
+import logging
+import os
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlalchemy import text
+from sqlalchemy.exc import ProgrammingError
+
+logger = logging.getLogger(__name__)
+
+ALEMBIC_INI = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "alembic.ini")
+
+
+class SchemaMismatchError(RuntimeError):
+    pass
+
+
+def migration_heads():
+    config = Config(ALEMBIC_INI)
+    config.set_main_option("script_location", os.path.join(os.path.dirname(ALEMBIC_INI), "migrations"))
+    return set(ScriptDirectory.from_config(config).get_heads())
+
+async def check_schema(engine, mode: str):
+    # Workers only verify the schema; migrating is a separate deploy step
+    # (alembic upgrade head) so N workers never race to alter tables.
+    if mode == "off":
+        return
+    async with engine.connect() as connection:
+        try:
+            current = set((await connection.execute(text("SELECT version_num FROM alembic_version"))).scalars())
+        except ProgrammingError:
+            current = set()
+    expected = migration_heads()
+    if current == expected:
+        return
+    message = f"Database schema is at {sorted(current) or 'no revision'}, code expects {sorted(expected)}; run `alembic upgrade head`."
+    if mode == "strict":
+        raise SchemaMismatchError(message)
+    logger.warning(message)
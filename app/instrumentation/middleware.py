@@ -0,0 +1,96 @@
+import contextvars
+import logging
+import time
+from collections import deque
+from datetime import datetime, timezone
+from sqlalchemy import event
+from config.settings import settings
+from instrumentation.metrics import db_query_duration, db_slow_queries, http_request_db_duration, http_request_duration, http_request_queries
+
+slow_query_logger = logging.getLogger("hospital.slow_query")
+
+# Most recent slow statements, newest last, for GET /health/slow-queries.
+recent_slow_queries = deque(maxlen=100)
+
+
+class RequestStats:
+    __slots__ = ("db_seconds", "queries")
+
+    def __init__(self):
+        self.db_seconds = 0.0
+        self.queries = 0
+
+
+# Set per request by the middleware. SQLAlchemy runs cursor events inside a
+# greenlet that inherits the calling task's context, so the events see it.
+current_request_stats = contextvars.ContextVar("current_request_stats", default=None)
+
+
+class InstrumentationMiddleware:
+    """Pure ASGI middleware recording latency, SQL time and query count per route."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        stats = RequestStats()
+        token = current_request_stats.set(stats)
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            current_request_stats.reset(token)
+            # The router stores the matched route in the scope; use its path
+            # template so ids do not explode the label cardinality.
+            route = scope.get("route")
+            path = getattr(route, "path", None) or "unmatched"
+            method = scope["method"]
+            http_request_duration.observe(elapsed, method, path, status_code)
+            http_request_db_duration.observe(stats.db_seconds, method, path)
+            http_request_queries.observe(stats.queries, method, path)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_started"].pop()
+    db_query_duration.observe(elapsed)
+    stats = current_request_stats.get()
+    if stats is not None:
+        stats.db_seconds += elapsed
+        stats.queries += 1
+    if elapsed >= settings.SLOW_QUERY_THRESHOLD_SECONDS:
+        db_slow_queries.inc()
+        params = repr(parameters)[:2000] if settings.SLOW_QUERY_LOG_PARAMETERS else "<redacted>"
+        recent_slow_queries.append({
+            "at": datetime.now(timezone.utc),
+            "duration_seconds": elapsed,
+            "statement": statement,
+            "parameters": params,
+        })
+        slow_query_logger.warning("Slow query (%.1f ms): %s | parameters: %s", elapsed * 1000, statement, params)
+
+def _handle_error(exception_context):
+    # after_cursor_execute does not fire for a failed statement; drop its
+    # start time so the stack stays paired with the next statement's.
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_started"):
+        conn.info["query_started"].pop()
+
+def install_query_instrumentation(engine):
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
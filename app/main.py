@@ -1,25 +1,77 @@
-from fastapi import FastAPI
-from models.models import Base
-from database.database import engine
-from schemas.schema import *
-from routes import patient, appointment, billing, department, doctor, inventory, medical_record, staff, user
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+from fastapi import Depends, FastAPI
+from auth.security import check_secret_key, get_current_user
+from config.settings import settings
+from database.database import all_async_engines, dispose_async_engine, init_async_engine
+from database.schema_check import check_schema
+from responses import FastJSONResponse
+from instrumentation.middleware import InstrumentationMiddleware, install_query_instrumentation
+from routes import patient, appointment, billing, department, doctor, inventory, medical_record, staff, user, health, export, search, audit
+from services.audit import install_audit_log
+from services.inventory_alerts import inventory_alert_scanner
+from services.scheduling import slot_horizon_extender
 import uvicorn
 
-app = FastAPI()
+logger = logging.getLogger(__name__)
 
-app.include_router(patient.router)
-app.include_router(appointment.router)
-app.include_router(billing.router)
-app.include_router(department.router)
-app.include_router(inventory.router)
-app.include_router(doctor.router)
-app.include_router(medical_record.router)
-app.include_router(staff.router)
-app.include_router(user.router)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Runs once per worker process, after the fork.
+    started = time.perf_counter()
+    app.state.ready = False
+    check_secret_key()
+    engine = init_async_engine()
+    if settings.INSTRUMENTATION_ENABLED:
+        for instrumented in all_async_engines():
+            install_query_instrumentation(instrumented.sync_engine)
+    await check_schema(engine, settings.SCHEMA_CHECK)
+    if settings.INVENTORY_ALERTS_ENABLED:
+        inventory_alert_scanner.start()
+    if settings.SLOT_GENERATION_ENABLED:
+        slot_horizon_extender.start()
+    app.state.startup_seconds = time.perf_counter() - started
+    app.state.ready = True
+    logger.info("Worker %s ready in %.3fs", os.getpid(), app.state.startup_seconds)
+    yield
+    # uvicorn has stopped accepting connections and drained in-flight
+    # requests (up to GRACEFUL_SHUTDOWN_SECONDS) before this point.
+    app.state.ready = False
+    await inventory_alert_scanner.stop()
+    await slot_horizon_extender.stop()
+    await dispose_async_engine()
+
+app = FastAPI(lifespan=lifespan, default_response_class=FastJSONResponse)
+app.state.ready = False
+
+if settings.INSTRUMENTATION_ENABLED:
+    app.add_middleware(InstrumentationMiddleware)
 
-Base.metadata.create_all(bind=engine)
+install_audit_log()
+
+# Tokens are verified from their signature alone, so protecting a router adds
+# no database round trip per request.
+protected = [Depends(get_current_user)] if settings.AUTH_ENABLED else []
+
+app.include_router(patient.router, dependencies=protected)
+app.include_router(appointment.router, dependencies=protected)
+app.include_router(billing.router, dependencies=protected)
+app.include_router(department.router, dependencies=protected)
+app.include_router(inventory.router, dependencies=protected)
+app.include_router(doctor.router, dependencies=protected)
+app.include_router(medical_record.router, dependencies=protected)
+app.include_router(staff.router, dependencies=protected)
+app.include_router(user.router)
+app.include_router(health.router)
+app.include_router(health.diagnostics_router, dependencies=protected)
+app.include_router(export.router, dependencies=protected)
+app.include_router(search.router, dependencies=protected)
+app.include_router(audit.router, dependencies=protected)
 
-    
+# The schema is managed by Alembic migrations (alembic upgrade head), not at import time.
+# For production use serve.py, which runs one worker per core.
 
 if __name__ == "__main__":
     uvicorn.run(app,host="127.0.0.1", port=8000)
\ No newline at end of file
@@ -0,0 +1,106 @@
+"""initial schema
+
+Matches the tables previously created by Base.metadata.create_all.
+
+Revision ID: 0001_initial_schema
+Revises:
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+revision = '0001_initial_schema'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'patients',
+        sa.Column('patient_id', UUID(as_uuid=True), primary_key=True),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('date_of_birth', sa.Date(), nullable=False),
+        sa.Column('address', sa.String(), nullable=False),
+        sa.Column('city', sa.String(), nullable=False),
+        sa.Column('state', sa.String(), nullable=False),
+        sa.Column('zip_code', sa.String(), nullable=False),
+        sa.Column('phone_number', sa.String(), nullable=False, unique=True),
+        sa.Column('email', sa.String(), nullable=True, unique=True),
+        sa.Column('medical_history', sa.Text()),
+    )
+    op.create_table(
+        'doctors',
+        sa.Column('doctor_id', UUID(as_uuid=True), primary_key=True),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('specialization', sa.String(), nullable=False),
+        sa.Column('phone_number', sa.String(), nullable=False, unique=True),
+        sa.Column('email', sa.String(), nullable=True, unique=True),
+        sa.Column('availability_schedule', sa.Text(), nullable=True),
+    )
+    op.create_table(
+        'appointments',
+        sa.Column('appointment_id', UUID(as_uuid=True), primary_key=True),
+        sa.Column('patient_id', UUID(as_uuid=True), sa.ForeignKey('patients.patient_id')),
+        sa.Column('doctor_id', UUID(as_uuid=True), sa.ForeignKey('doctors.doctor_id')),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('time', sa.String(), nullable=False),
+        sa.Column('status', sa.String(), nullable=False),
+    )
+    op.create_table(
+        'medical_records',
+        sa.Column('record_id', UUID(as_uuid=True), primary_key=True),
+        sa.Column('patient_id', UUID(as_uuid=True), sa.ForeignKey('patients.patient_id')),
+        sa.Column('doctor_id', UUID(as_uuid=True), sa.ForeignKey('doctors.doctor_id')),
+        sa.Column('diagnosis', sa.Text(), nullable=False),
+        sa.Column('treatment', sa.Text(), nullable=False),
+        sa.Column('prescription', sa.Text(), nullable=True),
+    )
+    op.create_table(
+        'billing',
+        sa.Column('bill_id', UUID(as_uuid=True), primary_key=True),
+        sa.Column('patient_id', UUID(as_uuid=True), sa.ForeignKey('patients.patient_id')),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('amount', sa.Float(), nullable=False),
+        sa.Column('payment_status', sa.String(), nullable=False),
+        sa.Column('insurance_details', sa.String(), nullable=True),
+        sa.Column('payment_method', sa.String(), nullable=False),
+    )
+    op.create_table(
+        'inventory',
+        sa.Column('item_id', UUID(as_uuid=True), primary_key=True),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('quantity', sa.Integer(), nullable=False),
+        sa.Column('supplier', sa.String(), nullable=False),
+        sa.Column('expiry_date', sa.Date(), nullable=False),
+        sa.Column('category', sa.String(), nullable=False),
+    )
+    op.create_table(
+        'staff',
+        sa.Column('staff_id', UUID(as_uuid=True), primary_key=True),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('role', sa.String(), nullable=False),
+        sa.Column('phone_number', sa.String(), nullable=False, unique=True),
+        sa.Column('email', sa.String(), nullable=True, unique=True),
+        sa.Column('schedule', sa.Text(), nullable=True),
+    )
+    op.create_table(
+        'departments',
+        sa.Column('department_id', UUID(as_uuid=True), primary_key=True),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('head_of_department_id', UUID(as_uuid=True), sa.ForeignKey('staff.staff_id')),
+        sa.Column('contact_information', sa.String(), nullable=False),
+    )
+    op.create_table(
+        'users',
+        sa.Column('user_id', UUID(as_uuid=True), primary_key=True),
+        sa.Column('username', sa.String(), nullable=False, unique=True),
+        sa.Column('password', sa.String(), nullable=False),
+        sa.Column('role', sa.String(), nullable=False),
+    )
+
+
+def downgrade():
+    for table in ('users', 'departments', 'staff', 'inventory', 'billing', 'medical_records', 'appointments', 'doctors', 'patients'):
+        op.drop_table(table)
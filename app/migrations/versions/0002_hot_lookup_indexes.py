@@ -0,0 +1,41 @@
+"""indexes for hot lookup columns
+
+Composite indexes for patient history, a doctor's day schedule, unpaid bills,
+expiring stock and the filtered keyset pagination on the list endpoints.
+Built CONCURRENTLY so existing tables stay writable while they are created.
+
+Revision ID: 0002_hot_lookup_indexes
+Revises: 0001_initial_schema
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = '0002_hot_lookup_indexes'
+down_revision = '0001_initial_schema'
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ('ix_appointments_patient_id_date', 'appointments', ['patient_id', 'date']),
+    ('ix_appointments_doctor_id_date_time', 'appointments', ['doctor_id', 'date', 'time']),
+    ('ix_medical_records_patient_id', 'medical_records', ['patient_id']),
+    ('ix_billing_patient_id_date', 'billing', ['patient_id', 'date']),
+    ('ix_billing_payment_status_date', 'billing', ['payment_status', 'date']),
+    ('ix_inventory_expiry_date', 'inventory', ['expiry_date']),
+    ('ix_inventory_category_item_id', 'inventory', ['category', 'item_id']),
+    ('ix_patients_city_patient_id', 'patients', ['city', 'patient_id']),
+    ('ix_patients_state_patient_id', 'patients', ['state', 'patient_id']),
+    ('ix_doctors_specialization_doctor_id', 'doctors', ['specialization', 'doctor_id']),
+]
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,41 @@
+"""doctor slot table for the scheduling engine
+
+Revision ID: 0003_doctor_slots
+Revises: 0002_hot_lookup_indexes
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+revision = '0003_doctor_slots'
+down_revision = '0002_hot_lookup_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'doctor_slots',
+        sa.Column('slot_id', UUID(as_uuid=True), primary_key=True),
+        sa.Column('doctor_id', UUID(as_uuid=True), sa.ForeignKey('doctors.doctor_id', ondelete='CASCADE'), nullable=False),
+        sa.Column('starts_at', sa.DateTime(), nullable=False),
+        sa.Column('ends_at', sa.DateTime(), nullable=False),
+        sa.Column('appointment_id', UUID(as_uuid=True), sa.ForeignKey('appointments.appointment_id', ondelete='SET NULL'), nullable=True, unique=True),
+        sa.UniqueConstraint('doctor_id', 'starts_at', name='uq_doctor_slots_doctor_id_starts_at'),
+    )
+    op.create_index(
+        'ix_doctor_slots_free_doctor_id_starts_at', 'doctor_slots', ['doctor_id', 'starts_at'],
+        postgresql_where=sa.text('appointment_id IS NULL'),
+    )
+    # Fails if the table already holds double bookings; resolve those first.
+    op.create_index(
+        'uq_appointments_doctor_id_date_time_active', 'appointments', ['doctor_id', 'date', 'time'],
+        unique=True, postgresql_where=sa.text("status <> 'Cancelled'"),
+    )
+
+
+def downgrade():
+    op.drop_index('uq_appointments_doctor_id_date_time_active', table_name='appointments')
+    op.drop_index('ix_doctor_slots_free_doctor_id_starts_at', table_name='doctor_slots')
+    op.drop_table('doctor_slots')
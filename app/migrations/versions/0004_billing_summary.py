@@ -0,0 +1,41 @@
+"""exact billing amounts and the daily billing summary
+
+Converts billing.amount to NUMERIC(12, 2) and creates billing_daily_summary,
+backfilled once from the existing bills. Afterwards the summary is kept up to
+date incrementally by the billing routes.
+
+Revision ID: 0004_billing_summary
+Revises: 0003_doctor_slots
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0004_billing_summary'
+down_revision = '0003_doctor_slots'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # ALTER TYPE holds an exclusive lock on billing until the migration
+    # commits, so the backfill below cannot race with new bills.
+    op.alter_column('billing', 'amount', type_=sa.Numeric(12, 2), postgresql_using='round(amount::numeric, 2)')
+    op.create_table(
+        'billing_daily_summary',
+        sa.Column('day', sa.Date(), primary_key=True),
+        sa.Column('payment_method', sa.String(), primary_key=True),
+        sa.Column('payment_status', sa.String(), primary_key=True),
+        sa.Column('bill_count', sa.Integer(), nullable=False),
+        sa.Column('total_amount', sa.Numeric(14, 2), nullable=False),
+    )
+    op.execute(
+        "INSERT INTO billing_daily_summary (day, payment_method, payment_status, bill_count, total_amount) "
+        "SELECT date, payment_method, payment_status, count(*), sum(amount) FROM billing "
+        "GROUP BY date, payment_method, payment_status"
+    )
+
+
+def downgrade():
+    op.drop_table('billing_daily_summary')
+    op.alter_column('billing', 'amount', type_=sa.Float(), postgresql_using='amount::double precision')
@@ -0,0 +1,22 @@
+"""index inventory.quantity for the low-stock scan
+
+Revision ID: 0005_inventory_quantity_index
+Revises: 0004_billing_summary
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = '0005_inventory_quantity_index'
+down_revision = '0004_billing_summary'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.create_index('ix_inventory_quantity', 'inventory', ['quantity'], postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_inventory_quantity', table_name='inventory', postgresql_concurrently=True, if_exists=True)
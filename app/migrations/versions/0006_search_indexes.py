@@ -0,0 +1,45 @@
+"""full-text and trigram search indexes
+
+Adds stored tsvector columns for patients.medical_history and
+medical_records (diagnosis weighted above treatment), GIN indexes on them,
+and pg_trgm GIN indexes on patients.name and patients.phone_number.
+Adding a stored generated column rewrites the table; schedule accordingly.
+
+Revision ID: 0006_search_indexes
+Revises: 0005_inventory_quantity_index
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+revision = '0006_search_indexes'
+down_revision = '0005_inventory_quantity_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column('patients', sa.Column(
+        'medical_history_search', TSVECTOR(),
+        sa.Computed("to_tsvector('english', coalesce(medical_history, ''))", persisted=True),
+    ))
+    op.add_column('medical_records', sa.Column(
+        'search_vector', TSVECTOR(),
+        sa.Computed("setweight(to_tsvector('english', coalesce(diagnosis, '')), 'A') || setweight(to_tsvector('english', coalesce(treatment, '')), 'B')", persisted=True),
+    ))
+    with op.get_context().autocommit_block():
+        op.create_index('ix_patients_name_trgm', 'patients', ['name'], postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}, postgresql_concurrently=True)
+        op.create_index('ix_patients_phone_number_trgm', 'patients', ['phone_number'], postgresql_using='gin', postgresql_ops={'phone_number': 'gin_trgm_ops'}, postgresql_concurrently=True)
+        op.create_index('ix_patients_medical_history_search', 'patients', ['medical_history_search'], postgresql_using='gin', postgresql_concurrently=True)
+        op.create_index('ix_medical_records_search_vector', 'medical_records', ['search_vector'], postgresql_using='gin', postgresql_concurrently=True)
+
+
+def downgrade():
+    op.drop_index('ix_medical_records_search_vector', table_name='medical_records')
+    op.drop_index('ix_patients_medical_history_search', table_name='patients')
+    op.drop_index('ix_patients_phone_number_trgm', table_name='patients')
+    op.drop_index('ix_patients_name_trgm', table_name='patients')
+    op.drop_column('medical_records', 'search_vector')
+    op.drop_column('patients', 'medical_history_search')
@@ -0,0 +1,35 @@
+"""date column on medical records for the patient timeline
+
+No date was ever stored for existing records and there is nothing to derive
+one from, so they stay NULL (undated) instead of being stamped with the
+migration date; the default applies to records created from now on. The
+index keeps undated records at the end of a newest-first history.
+
+Revision ID: 0007_medical_record_date
+Revises: 0006_search_indexes
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0007_medical_record_date'
+down_revision = '0006_search_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Added without a default first: a default on ADD COLUMN would fill it
+    # into every existing row.
+    op.add_column('medical_records', sa.Column('date', sa.Date(), nullable=True))
+    op.alter_column('medical_records', 'date', server_default=sa.func.current_date())
+    with op.get_context().autocommit_block():
+        op.create_index('ix_medical_records_patient_id_date', 'medical_records', ['patient_id', sa.text('date DESC NULLS LAST')], postgresql_concurrently=True)
+        op.drop_index('ix_medical_records_patient_id', table_name='medical_records', postgresql_concurrently=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.create_index('ix_medical_records_patient_id', 'medical_records', ['patient_id'], postgresql_concurrently=True)
+        op.drop_index('ix_medical_records_patient_id_date', table_name='medical_records', postgresql_concurrently=True)
+    op.drop_column('medical_records', 'date')
@@ -0,0 +1,30 @@
+"""version and updated_at columns for conditional requests
+
+Both defaults are constant for the ALTER (now() is evaluated once), so on
+Postgres 11+ the columns are added without rewriting the tables.
+
+Revision ID: 0008_row_versions
+Revises: 0007_medical_record_date
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0008_row_versions'
+down_revision = '0007_medical_record_date'
+branch_labels = None
+depends_on = None
+
+VERSIONED_TABLES = ('doctors', 'departments', 'inventory')
+
+
+def upgrade():
+    for table in VERSIONED_TABLES:
+        op.add_column(table, sa.Column('version', sa.Integer(), nullable=False, server_default='1'))
+        op.add_column(table, sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()))
+
+
+def downgrade():
+    for table in VERSIONED_TABLES:
+        op.drop_column(table, 'updated_at')
+        op.drop_column(table, 'version')
@@ -0,0 +1,63 @@
+"""append-only audit log, range partitioned by month
+
+The parent table only routes rows: each month lives in its own partition
+(audit_log_YYYY_MM), created here for the current and next 12 months and
+afterwards by scripts/create_audit_partitions.py. The default partition
+catches rows for months nobody created yet, so writes never fail; the script
+moves such rows into their proper partition.
+
+Revision ID: 0009_audit_log
+Revises: 0008_row_versions
+Create Date: 2026-10-18
+"""
+from datetime import date
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = '0009_audit_log'
+down_revision = '0008_row_versions'
+branch_labels = None
+depends_on = None
+
+INITIAL_MONTHS = 13
+
+
+def _add_months(day, months):
+    index = day.year * 12 + day.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def upgrade():
+    op.execute("CREATE SEQUENCE audit_log_change_id_seq")
+    op.create_table(
+        'audit_log',
+        sa.Column('change_id', sa.BigInteger(), nullable=False, server_default=sa.text("nextval('audit_log_change_id_seq')")),
+        sa.Column('changed_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.Column('txid', sa.BigInteger(), nullable=False, server_default=sa.text('txid_current()')),
+        sa.Column('table_name', sa.String(), nullable=False),
+        sa.Column('row_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('operation', sa.String(), nullable=False),
+        sa.Column('old_values', postgresql.JSONB(), nullable=True),
+        sa.Column('new_values', postgresql.JSONB(), nullable=True),
+        sa.Column('actor', sa.String(), nullable=True),
+        # A partitioned table's primary key must include the partition key.
+        sa.PrimaryKeyConstraint('change_id', 'changed_at'),
+        postgresql_partition_by='RANGE (changed_at)',
+    )
+    op.execute("ALTER SEQUENCE audit_log_change_id_seq OWNED BY audit_log.change_id")
+    # Created on the parent, so every partition gets its own copy.
+    op.create_index('ix_audit_log_txid_change_id', 'audit_log', ['txid', 'change_id'])
+    op.execute("CREATE TABLE audit_log_default PARTITION OF audit_log DEFAULT")
+    first = date.today().replace(day=1)
+    for offset in range(INITIAL_MONTHS):
+        start, end = _add_months(first, offset), _add_months(first, offset + 1)
+        op.execute(
+            f"CREATE TABLE audit_log_{start:%Y_%m} PARTITION OF audit_log "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+
+
+def downgrade():
+    # Dropping the parent drops every partition with it.
+    op.drop_table('audit_log')
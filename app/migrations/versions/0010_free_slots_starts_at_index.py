@@ -0,0 +1,26 @@
+"""index free doctor slots by start time for the next-free-slots search
+
+Revision ID: 0010_free_slots_starts_at_index
+Revises: 0009_audit_log
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0010_free_slots_starts_at_index'
+down_revision = '0009_audit_log'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_doctor_slots_free_starts_at', 'doctor_slots', ['starts_at'],
+            postgresql_where=sa.text('appointment_id IS NULL'), postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_doctor_slots_free_starts_at', table_name='doctor_slots', postgresql_concurrently=True, if_exists=True)
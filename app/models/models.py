@@ -1,8 +1,8 @@
 import uuid
 from database.database import Base
-from sqlalchemy import (Column, Date, Float, String, Integer, ForeignKey, Text, UniqueConstraint)
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy import (BigInteger, Column, Computed, Date, DateTime, Numeric, Sequence, String, Integer, ForeignKey, Index, Text, UniqueConstraint, func, text)
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID
+from sqlalchemy.orm import deferred, relationship
 
 class Patient(Base):
     __tablename__ = 'patients'
@@ -17,7 +17,17 @@ class Patient(Base):
     phone_number = Column(String, unique=True, nullable=False)
     email = Column(String, unique=True, nullable=True)
     medical_history = Column(Text)
-    
+    medical_history_search = deferred(Column(TSVECTOR, Computed("to_tsvector('english', coalesce(medical_history, ''))", persisted=True), info={"internal": True}))
+
+    __table_args__ = (
+        # Filtered keyset pagination on the patient list.
+        Index('ix_patients_city_patient_id', 'city', 'patient_id'),
+        Index('ix_patients_state_patient_id', 'state', 'patient_id'),
+        # Typo-tolerant name and partial phone number search.
+        Index('ix_patients_name_trgm', 'name', postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}),
+        Index('ix_patients_phone_number_trgm', 'phone_number', postgresql_using='gin', postgresql_ops={'phone_number': 'gin_trgm_ops'}),
+        Index('ix_patients_medical_history_search', 'medical_history_search', postgresql_using='gin'),
+    )
 
 class Doctor(Base):
     __tablename__ = 'doctors'
@@ -28,7 +38,15 @@ class Doctor(Base):
     phone_number = Column(String, unique=True, nullable=False)
     email = Column(String, unique=True, nullable=True)
     availability_schedule = Column(Text, nullable=True)
-    
+    version = Column(Integer, nullable=False, server_default='1')
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        Index('ix_doctors_specialization_doctor_id', 'specialization', 'doctor_id'),
+    )
+    # Every ORM UPDATE checks and bumps version, so a stale write fails with
+    # StaleDataError instead of overwriting a concurrent edit.
+    __mapper_args__ = {'version_id_col': version, 'eager_defaults': True}
 
 class Appointment(Base):
     __tablename__ = 'appointments'
@@ -43,6 +61,36 @@ class Appointment(Base):
     patient = relationship('Patient')
     doctor = relationship('Doctor')
 
+    __table_args__ = (
+        # Patient appointment history, newest first.
+        Index('ix_appointments_patient_id_date', 'patient_id', 'date'),
+        # A doctor's schedule for a given day.
+        Index('ix_appointments_doctor_id_date_time', 'doctor_id', 'date', 'time'),
+        # Last line of defence against double booking: at most one live
+        # appointment per doctor and start time.
+        Index('uq_appointments_doctor_id_date_time_active', 'doctor_id', 'date', 'time', unique=True, postgresql_where=text("status <> 'Cancelled'")),
+    )
+
+class DoctorSlot(Base):
+    __tablename__ = 'doctor_slots'
+
+    slot_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    doctor_id = Column(UUID(as_uuid=True), ForeignKey('doctors.doctor_id', ondelete='CASCADE'), nullable=False)
+    starts_at = Column(DateTime, nullable=False)
+    ends_at = Column(DateTime, nullable=False)
+    appointment_id = Column(UUID(as_uuid=True), ForeignKey('appointments.appointment_id', ondelete='SET NULL'), unique=True, nullable=True)
+
+    doctor = relationship('Doctor')
+
+    __table_args__ = (
+        UniqueConstraint('doctor_id', 'starts_at', name='uq_doctor_slots_doctor_id_starts_at'),
+        # Free slots per doctor in start order, for regenerating a schedule.
+        Index('ix_doctor_slots_free_doctor_id_starts_at', 'doctor_id', 'starts_at', postgresql_where=text('appointment_id IS NULL')),
+        # Free slots of all doctors in start order, for the "next free slots"
+        # query: it reads them soonest first and stops at the limit.
+        Index('ix_doctor_slots_free_starts_at', 'starts_at', postgresql_where=text('appointment_id IS NULL')),
+    )
+
 class MedicalRecord(Base):
     __tablename__ = 'medical_records'
      
@@ -52,22 +100,48 @@ class MedicalRecord(Base):
     diagnosis = Column(Text, nullable=False)
     treatment = Column(Text, nullable=False)
     prescription = Column(Text, nullable=True)
+    # NULL for records created before dates were stored; see migration 0007.
+    date = Column(Date, nullable=True, server_default=func.current_date())
+    search_vector = deferred(Column(TSVECTOR, Computed("setweight(to_tsvector('english', coalesce(diagnosis, '')), 'A') || setweight(to_tsvector('english', coalesce(treatment, '')), 'B')", persisted=True), info={"internal": True}))
     
     patient = relationship('Patient')
     doctor = relationship('Doctor')
 
+    __table_args__ = (
+        # Patient history newest first, undated records last (also serves
+        # lookups by patient_id alone).
+        Index('ix_medical_records_patient_id_date', 'patient_id', text('date DESC NULLS LAST')),
+        Index('ix_medical_records_search_vector', 'search_vector', postgresql_using='gin'),
+    )
+
 class Billing(Base):
     __tablename__ = 'billing'
     
     bill_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     patient_id = Column(UUID(as_uuid=True), ForeignKey('patients.patient_id'))
     date = Column(Date, nullable=False)
-    amount = Column(Float, nullable=False)
+    amount = Column(Numeric(12, 2), nullable=False)
     payment_status = Column(String, nullable=False)
     insurance_details = Column(String, nullable=True)
     payment_method = Column(String, nullable=False) 
 
     patient = relationship("Patient")   
+
+    __table_args__ = (
+        Index('ix_billing_patient_id_date', 'patient_id', 'date'),
+        # Unpaid/pending bills by date.
+        Index('ix_billing_payment_status_date', 'payment_status', 'date'),
+    )
+
+class BillingDailySummary(Base):
+    # Maintained incrementally by services.billing_reports on every bill write.
+    __tablename__ = 'billing_daily_summary'
+
+    day = Column(Date, primary_key=True)
+    payment_method = Column(String, primary_key=True)
+    payment_status = Column(String, primary_key=True)
+    bill_count = Column(Integer, nullable=False, default=0)
+    total_amount = Column(Numeric(14, 2), nullable=False, default=0)
     
 class Inventory(Base):
     __tablename__ = 'inventory'
@@ -78,6 +152,17 @@ class Inventory(Base):
     supplier = Column(String, nullable=False)
     expiry_date = Column(Date, nullable=False)
     category = Column(String, nullable=False)    
+    version = Column(Integer, nullable=False, server_default='1')
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        # Stock expiring before a given date.
+        Index('ix_inventory_expiry_date', 'expiry_date'),
+        Index('ix_inventory_category_item_id', 'category', 'item_id'),
+        # Items below the reorder threshold.
+        Index('ix_inventory_quantity', 'quantity'),
+    )
+    __mapper_args__ = {'version_id_col': version, 'eager_defaults': True}
     
 class Staff(Base):
     __tablename__ = 'staff'
@@ -97,8 +182,12 @@ class Department(Base):
     name = Column(String, nullable=False)
     head_of_department_id = Column(UUID(as_uuid=True), ForeignKey('staff.staff_id'))
     contact_information = Column(String, nullable=False)
+    version = Column(Integer, nullable=False, server_default='1')
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
     
     head_of_department = relationship('Staff')
+
+    __mapper_args__ = {'version_id_col': version, 'eager_defaults': True}
     
 class User(Base):
     __tablename__ = 'users'
@@ -107,4 +196,27 @@ class User(Base):
     username = Column(String, unique=True, nullable=False)
     password = Column(String, nullable=False)
     role = Column(String, nullable=False)
-    
\ No newline at end of file
+
+audit_log_change_id_seq = Sequence('audit_log_change_id_seq')
+
+class AuditLog(Base):
+    # Append-only; range partitioned by month on changed_at (see migration
+    # 0009 and scripts/create_audit_partitions.py), so inserts only touch the
+    # current month's indexes and old months can be detached or dropped whole.
+    __tablename__ = 'audit_log'
+
+    change_id = Column(BigInteger, audit_log_change_id_seq, server_default=audit_log_change_id_seq.next_value(), primary_key=True)
+    changed_at = Column(DateTime(timezone=True), primary_key=True, server_default=func.now())
+    # Writing transaction's id; the change feed is ordered by (txid, change_id).
+    txid = Column(BigInteger, nullable=False, server_default=text('txid_current()'))
+    table_name = Column(String, nullable=False)
+    row_id = Column(UUID(as_uuid=True), nullable=False)
+    operation = Column(String, nullable=False)
+    old_values = Column(JSONB, nullable=True)
+    new_values = Column(JSONB, nullable=True)
+    actor = Column(String, nullable=True)
+
+    __table_args__ = (
+        Index('ix_audit_log_txid_change_id', 'txid', 'change_id'),
+        {'postgresql_partition_by': 'RANGE (changed_at)'},
+    )
@@ -0,0 +1,92 @@
+from datetime import datetime
+from typing import Annotated, List, Optional
+import uuid
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette import status
+from crud import FOREIGN_KEY_VIOLATION, get_page, get_row, integrity_violation, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from database.database import get_async_db
+from models.models import Appointment, Doctor
+from responses import FastJSONResponse
+from schemas.schema import AppointmentCreate, AppointmentRead, Page, SlotRead
+from services.scheduling import SlotUnavailableError, book_appointment, generate_slots, next_free_slots, reschedule_appointment
+
+router = APIRouter()
+
+DOUBLE_BOOKING_INDEX = "uq_appointments_doctor_id_date_time_active"
+
+def _integrity_error(e: IntegrityError) -> HTTPException:
+    sqlstate, constraint = integrity_violation(e)
+    if constraint == DOUBLE_BOOKING_INDEX:
+        return HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Doctor is already booked at that time.")
+    if sqlstate == FOREIGN_KEY_VIOLATION and constraint:
+        if "patient_id" in constraint:
+            return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Patient not found.")
+        if "doctor_id" in constraint:
+            return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Doctor not found.")
+    return HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Appointment violates a database constraint.")
+
+@router.post("/appointments/", status_code=status.HTTP_201_CREATED)
+async def create_appointment(appointment: AppointmentCreate, db: Annotated[AsyncSession, Depends(get_async_db)]):
+    try:
+        return await book_appointment(db, appointment.model_dump())
+    except SlotUnavailableError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except IntegrityError as e:
+        raise _integrity_error(e)
+
+@router.get("/appointments", status_code=status.HTTP_200_OK, response_model=Page)
+async def get_all_appointments(db: Annotated[AsyncSession, Depends(get_async_db)], limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE, cursor: Optional[uuid.UUID] = None, patient_id: Optional[uuid.UUID] = None, doctor_id: Optional[uuid.UUID] = None, fields: Optional[str] = None):
+    try:
+        page = await get_page(Appointment, db, limit, cursor, {"patient_id": patient_id, "doctor_id": doctor_id}, fields)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if not page["items"] and cursor is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No appointments found.")
+    # Rows are already plain mappings; returning the response directly skips
+    # a per-row validation pass against Page.
+    return FastJSONResponse(page)
+
+@router.get("/appointments/slots/next", status_code=status.HTTP_200_OK, response_model=List[SlotRead])
+async def get_next_free_slots(specialization: str, db: Annotated[AsyncSession, Depends(get_async_db)], limit: Annotated[int, Query(ge=1, le=100)] = 5, after: Optional[datetime] = None):
+    return await next_free_slots(db, specialization, limit, after)
+
+@router.post("/appointments/slots/{doctor_id}", status_code=status.HTTP_200_OK)
+async def generate_doctor_slots(doctor_id: uuid.UUID, db: Annotated[AsyncSession, Depends(get_async_db)], days: Annotated[Optional[int], Query(ge=1, le=90)] = None):
+    doctor = await db.get(Doctor, doctor_id)
+    if not doctor:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Doctor not found.")
+    try:
+        return await generate_slots(db, doctor, days=days)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+
+@router.get("/appointments/{appointment_id}", status_code=status.HTTP_200_OK, response_model=AppointmentRead)
+async def get_appointment(appointment_id: uuid.UUID, db: Annotated[AsyncSession, Depends(get_async_db)]):
+    appointment = await get_row(Appointment, db, appointment_id)
+    if not appointment:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Appointment not found.")
+    return appointment
+
+@router.put("/appointments/{appointment_id}", status_code=status.HTTP_202_ACCEPTED)
+async def update_appointment(appointment_id: uuid.UUID, appointment: AppointmentCreate, db: Annotated[AsyncSession, Depends(get_async_db)]):
+    update_appointment = await db.get(Appointment, appointment_id)
+    if not update_appointment:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Appointment not found.')
+    try:
+        return await reschedule_appointment(db, update_appointment, appointment.model_dump())
+    except SlotUnavailableError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except IntegrityError as e:
+        raise _integrity_error(e)
+
+@router.delete("/appointments/{appointment_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_appointment(appointment_id: uuid.UUID, db: Annotated[AsyncSession, Depends(get_async_db)]):
+    appointment = await db.get(Appointment, appointment_id)
+    if not appointment:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Appointment not found.")
+    # The slot is released by the ON DELETE SET NULL foreign key.
+    await db.delete(appointment)
+    await db.commit()
+    return {"detail": "Appointment deleted successfully"}
@@ -0,0 +1,20 @@
+from typing import Annotated, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette import status
+from crud import MAX_PAGE_SIZE
+from database.database import get_async_db
+from responses import FastJSONResponse
+from schemas.schema import ChangeFeedPage
+from services.audit import change_feed
+
+router = APIRouter()
+
+@router.get("/audit/changes", status_code=status.HTTP_200_OK, response_model=ChangeFeedPage)
+async def get_change_feed(db: Annotated[AsyncSession, Depends(get_async_db)], limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = 100, cursor: Optional[str] = None):
+    # Downstream consumers tail this: store next_cursor and poll with it.
+    try:
+        page = await change_feed(db, limit, cursor)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid change feed cursor.")
+    return FastJSONResponse(page)
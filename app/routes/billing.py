@@ -0,0 +1,71 @@
+from datetime import date
+from typing import Annotated, List, Literal, Optional
+import uuid
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette import status
+from crud import get_page, get_row, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from database.database import get_async_db
+from models.models import Billing
+from responses import FastJSONResponse
+from schemas.schema import BillingCreate, BillingRead, BillingReportRow, Page
+from services.billing_reports import bill_snapshot, billing_report, record_bill_change
+
+router = APIRouter()
+
+@router.post("/billing/", status_code=status.HTTP_201_CREATED)
+async def create_bill(bill: BillingCreate, db: Annotated[AsyncSession, Depends(get_async_db)]):
+    new_bill = Billing(**bill.model_dump())
+    db.add(new_bill)
+    await record_bill_change(db, new=bill_snapshot(new_bill))
+    await db.commit()
+    await db.refresh(new_bill)
+    if not new_bill:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to create bill.")
+    return new_bill
+
+@router.get("/billing", status_code=status.HTTP_200_OK, response_model=Page)
+async def get_all_bills(db: Annotated[AsyncSession, Depends(get_async_db)], limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE, cursor: Optional[uuid.UUID] = None, patient_id: Optional[uuid.UUID] = None, payment_status: Optional[str] = None, fields: Optional[str] = None):
+    try:
+        page = await get_page(Billing, db, limit, cursor, {"patient_id": patient_id, "payment_status": payment_status}, fields)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if not page["items"] and cursor is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No bills found.")
+    # Rows are already plain mappings; returning the response directly skips
+    # a per-row validation pass against Page.
+    return FastJSONResponse(page)
+
+@router.get("/billing/reports/summary", status_code=status.HTTP_200_OK, response_model=List[BillingReportRow])
+async def get_billing_report(db: Annotated[AsyncSession, Depends(get_async_db)], group_by: Annotated[List[Literal["day", "payment_method", "payment_status"]], Query()] = ["day"], start: Optional[date] = None, end: Optional[date] = None):
+    return await billing_report(db, list(dict.fromkeys(group_by)), start, end)
+
+@router.get("/billing/{bill_id}", status_code=status.HTTP_200_OK, response_model=BillingRead)
+async def get_bill(bill_id: uuid.UUID, db: Annotated[AsyncSession, Depends(get_async_db)]):
+    bill = await get_row(Billing, db, bill_id)
+    if not bill:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Bill not found.")
+    return bill
+
+@router.put("/billing/{bill_id}", status_code=status.HTTP_202_ACCEPTED)
+async def update_bill(bill_id: uuid.UUID, bill: BillingCreate, db: Annotated[AsyncSession, Depends(get_async_db)]):
+    update_bill = await db.get(Billing, bill_id, with_for_update=True)
+    if not update_bill:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Bill not found.')
+    old = bill_snapshot(update_bill)
+    for key, value in bill.model_dump().items():
+        setattr(update_bill, key, value)
+    await record_bill_change(db, old=old, new=bill_snapshot(update_bill))
+    await db.commit()
+    await db.refresh(update_bill)
+    return update_bill
+
+@router.delete("/billing/{bill_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_bill(bill_id: uuid.UUID, db: Annotated[AsyncSession, Depends(get_async_db)]):
+    bill = await db.get(Billing, bill_id, with_for_update=True)
+    if not bill:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Bill not found.")
+    await record_bill_change(db, old=bill_snapshot(bill))
+    await db.delete(bill)
+    await db.commit()
+    return {"detail": "Bill deleted successfully"}
@@ -1,54 +1,78 @@
-from typing import Annotated
+from typing import Annotated, Optional
 import uuid
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.exc import StaleDataError
 from starlette import status
-from database.database import get_db
+from cache.cache import cache
+from crud import get_row, get_page, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from database.database import get_async_db, get_primary_async_db
 from models.models import Department
-from schemas.schema import DepartmentCreate
+from responses import FastJSONResponse
+from schemas.schema import DepartmentCreate, DepartmentRead, Page
+from services.conditional import check_if_match, is_not_modified, item_etag, page_etag, page_last_modified, validator_headers
 
 router = APIRouter()
 
 @router.post("/departments/",status_code=status.HTTP_201_CREATED)
-async def create_department(department: DepartmentCreate, db: Annotated[Session, Depends(get_db)]):
+async def create_department(department: DepartmentCreate, db: Annotated[AsyncSession, Depends(get_async_db)]):
     new_department = Department(**department.model_dump())
     db.add(new_department)
-    db.commit()
-    db.refresh(new_department)
+    await db.commit()
+    await db.refresh(new_department)
     if not new_department:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to create department.")
     return new_department
 
-@router.get("/departments", status_code=status.HTTP_200_OK)
-async def get_all_departments(db: Annotated[Session, Depends(get_db)]):
-    departments = db.query(Department).all()
-    if not departments:
+@router.get("/departments", status_code=status.HTTP_200_OK, response_model=Page)
+async def get_all_departments(request: Request, db: Annotated[AsyncSession, Depends(get_async_db)], limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE, cursor: Optional[uuid.UUID] = None, head_of_department_id: Optional[uuid.UUID] = None, fields: Optional[str] = None):
+    try:
+        page = await get_page(Department, db, limit, cursor, {"head_of_department_id": head_of_department_id}, fields)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if not page["items"] and cursor is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No departments found.")
-    return departments
+    etag = page_etag(request, page, "department_id", "version")
+    last_modified = page_last_modified(page)
+    if is_not_modified(request, etag, last_modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=validator_headers(etag, last_modified))
+    return FastJSONResponse(page, headers=validator_headers(etag, last_modified))
 
-@router.get("/departments/{department_id}", status_code=status.HTTP_200_OK)
-async def get_department(department_id: uuid.UUID, db: Annotated[Session, Depends(get_db)]):
-    department = db.query(Department).filter(Department.department_id == department_id).first()
+@router.get("/departments/{department_id}", status_code=status.HTTP_200_OK, response_model=DepartmentRead)
+async def get_department(department_id: uuid.UUID, request: Request, response: Response, db: Annotated[AsyncSession, Depends(get_primary_async_db)]):
+    department = await cache.get_or_load(f"department:{department_id}", lambda: get_row(Department, db, department_id))
     if not department:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Department not found.")
+    headers = validator_headers(item_etag(department["version"]), department["updated_at"])
+    if is_not_modified(request, headers["ETag"], department["updated_at"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
     return department
 
 @router.put("/departments/{department_id}", status_code=status.HTTP_202_ACCEPTED)
-async def update_department(department_id: uuid.UUID, department: DepartmentCreate, db: Annotated[Session, Depends(get_db)]):
-    update_department = db.query(Department).filter(Department.department_id == department_id).first()
+async def update_department(department_id: uuid.UUID, department: DepartmentCreate, request: Request, response: Response, db: Annotated[AsyncSession, Depends(get_async_db)]):
+    update_department = await db.get(Department, department_id)
     if not update_department:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Department not found.')
+    check_if_match(request, item_etag(update_department.version))
     for key, value in department.model_dump().items():
         setattr(update_department, key, value)
-    db.commit()
-    db.refresh(update_department)
+    try:
+        await db.commit()
+    except StaleDataError:
+        await db.rollback()
+        raise HTTPException(status_code=status.HTTP_412_PRECONDITION_FAILED, detail="Department was modified concurrently; fetch it again before updating.")
+    await db.refresh(update_department)
+    await cache.delete(f"department:{department_id}")
+    response.headers.update(validator_headers(item_etag(update_department.version), update_department.updated_at))
     return update_department
 
 @router.delete("/departments/{department_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_department(department_id: uuid.UUID, db: Annotated[Session, Depends(get_db)]):
-    department = db.query(Department).filter(Department.department_id == department_id).first()
+async def delete_department(department_id: uuid.UUID, db: Annotated[AsyncSession, Depends(get_async_db)]):
+    department = await db.get(Department, department_id)
     if not department:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Department not found.")
-    db.delete(department)
-    db.commit()
+    await db.delete(department)
+    await db.commit()
+    await cache.delete(f"department:{department_id}")
     return {"detail": "Department deleted successfully"}
@@ -1,63 +1,109 @@
-from typing import List, Annotated
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from typing import Annotated, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
-from crud import create_item, get_items, get_item, update_item, delete_item
-from database.database import get_db
+from cache.cache import cache
+from crud import get_row, get_item, delete_item, get_page, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from database.database import get_async_db, get_primary_async_db
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm.exc import StaleDataError
 from models.models import Doctor
-from schemas.schema import DoctorCreate
+from responses import FastJSONResponse
+from schemas.schema import DoctorCreate, DoctorRead, Page
+from services.scheduling import generate_slots, parse_availability
+from services.conditional import check_if_match, is_not_modified, item_etag, page_etag, page_last_modified, validator_headers
+import logging
 import uuid
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 @router.post("/doctors/", status_code=status.HTTP_201_CREATED)
-async def create_doctor(doctor: DoctorCreate, db: Annotated[Session, Depends(get_db)]):
+async def create_doctor(doctor: DoctorCreate, db: Annotated[AsyncSession, Depends(get_async_db)]):
+    _check_schedule(doctor.availability_schedule)
     new_doctor = Doctor(**doctor.model_dump())
     db.add(new_doctor)
-    db.commit()
-    db.refresh(new_doctor)
+    await db.commit()
+    await db.refresh(new_doctor)
     if not new_doctor:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to create doctor")
+    # Bookable straight away instead of after the next slot generation run.
+    await generate_slots(db, new_doctor)
     return new_doctor
 
-@router.get("/doctors/", response_model=List[DoctorCreate], status_code=status.HTTP_200_OK)
-async def get_all_doctors(db: Annotated[Session, Depends(get_db)]):
-    doctors = db.query(Doctor).all()
-    if not doctors:
+def _check_schedule(schedule: str):
+    try:
+        parse_availability(schedule)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+
+@router.get("/doctors/", status_code=status.HTTP_200_OK, response_model=Page)
+async def get_all_doctors(request: Request, db: Annotated[AsyncSession, Depends(get_async_db)], limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE, cursor: Optional[uuid.UUID] = None, specialization: Optional[str] = None, fields: Optional[str] = None):
+    try:
+        page = await get_page(Doctor, db, limit, cursor, {"specialization": specialization}, fields)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if not page["items"] and cursor is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No doctors found.")
-    return doctors
+    etag = page_etag(request, page, "doctor_id", "version")
+    last_modified = page_last_modified(page)
+    if is_not_modified(request, etag, last_modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=validator_headers(etag, last_modified))
+    return FastJSONResponse(page, headers=validator_headers(etag, last_modified))
 
-@router.get("/doctors/{doctor_id}", response_model=DoctorCreate, status_code=status.HTTP_200_OK)
-async def get_doctor(doctor_id: uuid.UUID, db: Annotated[Session, Depends(get_db)]):
+@router.get("/doctors/{doctor_id}", response_model=DoctorRead, status_code=status.HTTP_200_OK)
+async def get_doctor(doctor_id: uuid.UUID, request: Request, response: Response, db: Annotated[AsyncSession, Depends(get_primary_async_db)]):
     try:
-        doctor = db.query(Doctor).filter(Doctor.doctor_id == doctor_id).first()
-    except SQLAlchemyError as e:
-        print(e)
-        return None
+        doctor = await cache.get_or_load(f"doctor:{doctor_id}", lambda: get_row(Doctor, db, doctor_id))
+    except SQLAlchemyError:
+        logger.exception("Failed to load doctor %s", doctor_id)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to load doctor.")
+    if doctor is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Doctor not found.")
+    # The cached row carries its version, so a revalidation that hits the
+    # cache is answered without touching the database.
+    headers = validator_headers(item_etag(doctor["version"]), doctor["updated_at"])
+    if is_not_modified(request, headers["ETag"], doctor["updated_at"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
     return doctor
 
 @router.put("/doctors/{doctor_id}", status_code=status.HTTP_202_ACCEPTED)
-async def update_doctor(doctor_id: uuid.UUID, doctor: DoctorCreate, db: Annotated[Session, Depends(get_db)]):
+async def update_doctor(doctor_id: uuid.UUID, doctor: DoctorCreate, request: Request, response: Response, db: Annotated[AsyncSession, Depends(get_async_db)]):
     try:
-        update_doctor = db.query(Doctor).filter(Doctor.doctor_id == doctor_id).first()
+        update_doctor = await db.get(Doctor, doctor_id)
         if update_doctor is None:
             raise HTTPException(status_code=404, detail="Doctor not found.")
+        check_if_match(request, item_etag(update_doctor.version))
+        _check_schedule(doctor.availability_schedule)
+        schedule_changed = update_doctor.availability_schedule != doctor.availability_schedule
         for key, value in doctor.model_dump().items():
             setattr(update_doctor, key, value)
-        db.commit()
-        db.refresh(update_doctor)
+        await db.commit()
+        await db.refresh(update_doctor)
+        await cache.delete(f"doctor:{doctor_id}")
+        if schedule_changed:
+            # Drops free slots the new schedule no longer offers; booked
+            # slots are kept.
+            await generate_slots(db, update_doctor)
+    except StaleDataError:
+        # Another request committed between our read and our UPDATE.
+        await db.rollback()
+        raise HTTPException(status_code=status.HTTP_412_PRECONDITION_FAILED, detail="Doctor was modified concurrently; fetch it again before updating.")
     except SQLAlchemyError as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to update {Doctor.__name__}. Error : {str(e)}")
+    response.headers.update(validator_headers(item_etag(update_doctor.version), update_doctor.updated_at))
     return {"detail": "Doctor updated successfully", "doctor": update_doctor}
 
 @router.delete("/doctors/{doctor_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_doctor(doctor_id: uuid.UUID, db: Annotated[Session, Depends(get_db)]):
-    doctor = get_item(Doctor, db, doctor_id)
+async def delete_doctor(doctor_id: uuid.UUID, db: Annotated[AsyncSession, Depends(get_async_db)]):
+    doctor = await get_item(Doctor, db, doctor_id)
     if not doctor:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Doctor not found.")
-    deleted = delete_item(Doctor, db, doctor_id)
+    deleted = await delete_item(Doctor, db, doctor_id)
     if not deleted:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to delete doctor.")
+    await cache.delete(f"doctor:{doctor_id}")
     return {"detail": "Doctor deleted successfully"}
@@ -0,0 +1,62 @@
+import csv
+import io
+import json
+from typing import Literal
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from starlette import status
+from crud import public_columns
+from database.database import AsyncSessionLocal, read_engine
+from models.models import Patient, Doctor, Appointment, MedicalRecord, Billing, Inventory, Staff, Department
+
+router = APIRouter()
+
+EXPORT_BATCH_SIZE = 1000
+
+# Users are deliberately not exportable: the table holds credentials.
+EXPORTABLE_MODELS = {
+    "patients": Patient,
+    "doctors": Doctor,
+    "appointments": Appointment,
+    "medical_records": MedicalRecord,
+    "billing": Billing,
+    "inventory": Inventory,
+    "staff": Staff,
+    "departments": Department,
+}
+
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+def _encode_ndjson(columns, rows):
+    keys = [column.key for column in columns]
+    return "".join(json.dumps(dict(zip(keys, row)), default=str) + "\n" for row in rows)
+
+def _encode_csv(rows):
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue()
+
+async def _stream_rows(model, format: str):
+    columns = list(public_columns(model).values())
+    if format == "csv":
+        yield _encode_csv([[column.key for column in columns]])
+    # The session is opened here rather than injected so it lives exactly as
+    # long as the response body is being streamed. Full-table scans are the
+    # heaviest reads we serve, so they go to a replica when there is one.
+    async with AsyncSessionLocal(bind=read_engine()) as db:
+        result = await db.stream(select(*columns).execution_options(yield_per=EXPORT_BATCH_SIZE))
+        async for rows in result.partitions():
+            yield _encode_csv(rows) if format == "csv" else _encode_ndjson(columns, rows)
+
+@router.get("/export/{table}", status_code=status.HTTP_200_OK)
+async def export_table(table: str, format: Literal["ndjson", "csv"] = "ndjson"):
+    model = EXPORTABLE_MODELS.get(table)
+    if model is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Table '{table}' cannot be exported.")
+    return StreamingResponse(
+        _stream_rows(model, format),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{table}.{format}"'},
+    )
@@ -0,0 +1,79 @@
+import asyncio
+import os
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse, PlainTextResponse
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from starlette import status
+from cache.cache import cache
+from database.database import AsyncSessionLocal
+from database.pool import pool_metrics
+from instrumentation.metrics import registry
+from instrumentation.middleware import recent_slow_queries
+
+# Probes stay unauthenticated; the diagnostics expose statements, pool and
+# cache internals and are mounted behind authentication in main.py.
+router = APIRouter()
+diagnostics_router = APIRouter()
+
+# Readiness must answer well inside a probe's timeout even when the pool is
+# exhausted or the database is unreachable.
+READINESS_DB_TIMEOUT_SECONDS = 2.0
+
+
+def _pool_metrics():
+    # One series per engine, labelled pool="primary" / "replica_N".
+    for metrics in pool_metrics.all():
+        pool = metrics.snapshot()
+        labels = {"pool": metrics.name}
+        yield ("db_pool_size", "gauge", "Configured pool size.", pool["size"], labels)
+        yield ("db_pool_checked_out", "gauge", "Connections currently checked out.", pool["checked_out"], labels)
+        yield ("db_pool_overflow", "gauge", "Overflow connections in use.", pool["overflow"], labels)
+        yield ("db_pool_checkouts_total", "counter", "Connection checkouts.", pool["checkout"]["count"], labels)
+        yield ("db_pool_checkout_seconds_total", "counter", "Time spent waiting for pooled connections.", pool["checkout"]["seconds_total"], labels)
+        yield ("db_pool_timeouts_total", "counter", "Checkouts that timed out.", pool["checkout"]["timeouts"], labels)
+
+def _cache_metrics():
+    cache_stats = cache.snapshot()
+    return [
+        ("cache_hits_total", "counter", "Cache hits.", cache_stats["hits"]),
+        ("cache_misses_total", "counter", "Cache misses.", cache_stats["misses"]),
+        ("cache_evictions_total", "counter", "Cache LRU evictions.", cache_stats["evictions"]),
+        ("cache_invalidations_total", "counter", "Explicit cache invalidations.", cache_stats["invalidations"]),
+    ]
+
+registry.collectors.extend([_pool_metrics, _cache_metrics])
+
+@router.get("/health/live", status_code=status.HTTP_200_OK)
+async def liveness():
+    # The event loop is answering; deliberately no dependency checks, so a
+    # database outage does not get healthy workers restarted.
+    return {"status": "alive", "pid": os.getpid()}
+
+@router.get("/health/ready", status_code=status.HTTP_200_OK)
+async def readiness(request: Request):
+    state = request.app.state
+    if not getattr(state, "ready", False):
+        return JSONResponse({"status": "starting", "pid": os.getpid()}, status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+    try:
+        async with AsyncSessionLocal() as db:
+            await asyncio.wait_for(db.execute(text("SELECT 1")), READINESS_DB_TIMEOUT_SECONDS)
+    except (SQLAlchemyError, OSError, asyncio.TimeoutError) as e:
+        return JSONResponse({"status": "database unavailable", "detail": str(e) or type(e).__name__, "pid": os.getpid()}, status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+    return {"status": "ready", "pid": os.getpid(), "startup_seconds": state.startup_seconds}
+
+@diagnostics_router.get("/metrics", response_class=PlainTextResponse, status_code=status.HTTP_200_OK)
+async def get_metrics():
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
+@diagnostics_router.get("/health/pool", status_code=status.HTTP_200_OK)
+async def get_pool_stats():
+    return {metrics.name: metrics.snapshot() for metrics in pool_metrics.all()}
+
+@diagnostics_router.get("/health/cache", status_code=status.HTTP_200_OK)
+async def get_cache_stats():
+    return cache.snapshot()
+
+@diagnostics_router.get("/health/slow-queries", status_code=status.HTTP_200_OK)
+async def get_slow_queries():
+    return list(reversed(recent_slow_queries))
@@ -1,56 +1,96 @@
-from typing import Annotated
+from typing import Annotated, Optional, List
 import uuid
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.exc import StaleDataError
 from starlette import status
-from crud import create_item
-from database.database import get_db
+from crud import get_page, get_row, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, bulk_upsert, BULK_MAX_ITEMS
+from database.database import get_async_db
 from models.models import Inventory
-from schemas.schema import InventoryCreate
+from responses import FastJSONResponse
+from schemas.schema import InventoryCreate, InventoryRead, Page, BulkResult
+from services.conditional import check_if_match, is_not_modified, item_etag, page_etag, page_last_modified, validator_headers
+from services.inventory_alerts import inventory_alert_scanner
 
 router = APIRouter()
 
 @router.post("/inventory/",status_code=status.HTTP_201_CREATED)
-async def create_inventory(inventory: InventoryCreate, db: Annotated[Session, Depends(get_db)]):
+async def create_inventory(inventory: InventoryCreate, db: Annotated[AsyncSession, Depends(get_async_db)]):
     new_inventory = Inventory(**inventory.model_dump())
     db.add(new_inventory)
-    db.commit()
-    db.refresh(new_inventory)
+    await db.commit()
+    await db.refresh(new_inventory)
     if not new_inventory:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to create inventory.")
     return new_inventory
+
+@router.post("/inventory/bulk", status_code=status.HTTP_200_OK, response_model=BulkResult)
+async def bulk_create_inventory(inventory: Annotated[List[InventoryCreate], Body(max_length=BULK_MAX_ITEMS)], db: Annotated[AsyncSession, Depends(get_async_db)]):
+    try:
+        return await bulk_upsert(Inventory, db, [item.model_dump() for item in inventory])
+    except IntegrityError as e:
+        await db.rollback()
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=f"Bulk inventory import failed: {e.orig}")
     
 
-@router.get("/inventory", status_code=status.HTTP_200_OK)
-async def get_all_inventory(db: Annotated[Session, Depends(get_db)]):
-    inventory = db.query(Inventory).all()
-    if not inventory:
+@router.get("/inventory", status_code=status.HTTP_200_OK, response_model=Page)
+async def get_all_inventory(request: Request, db: Annotated[AsyncSession, Depends(get_async_db)], limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE, cursor: Optional[uuid.UUID] = None, category: Optional[str] = None, supplier: Optional[str] = None, fields: Optional[str] = None):
+    try:
+        page = await get_page(Inventory, db, limit, cursor, {"category": category, "supplier": supplier}, fields)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if not page["items"] and cursor is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No inventory found.")
-    return inventory
+    etag = page_etag(request, page, "item_id", "version")
+    last_modified = page_last_modified(page)
+    if is_not_modified(request, etag, last_modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=validator_headers(etag, last_modified))
+    return FastJSONResponse(page, headers=validator_headers(etag, last_modified))
 
-@router.get("/inventory/{item_id}", status_code=status.HTTP_200_OK)
-async def get_inventory(item_id: uuid.UUID, db: Annotated[Session, Depends(get_db)]):
-    inventory = db.query(Inventory).filter(Inventory.item_id == item_id).first()
+@router.get("/inventory/alerts", status_code=status.HTTP_200_OK)
+async def get_inventory_alerts():
+    # Served from the background scanner's shared snapshot; never touches the table.
+    return await inventory_alert_scanner.current()
+
+@router.get("/inventory/{item_id}", status_code=status.HTTP_200_OK, response_model=InventoryRead)
+async def get_inventory(item_id: uuid.UUID, request: Request, response: Response, db: Annotated[AsyncSession, Depends(get_async_db)]):
+    # Revalidate against the version alone before loading the full row.
+    current = (await db.execute(select(Inventory.version, Inventory.updated_at).where(Inventory.item_id == item_id))).first()
+    if current is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Inventory item not found.")
+    headers = validator_headers(item_etag(current.version), current.updated_at)
+    if is_not_modified(request, headers["ETag"], current.updated_at):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    inventory = await get_row(Inventory, db, item_id)
     if not inventory:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Inventory item not found.")
+    response.headers.update(validator_headers(item_etag(inventory["version"]), inventory["updated_at"]))
     return inventory
 
 @router.put("/inventory/{item_id}", status_code=status.HTTP_202_ACCEPTED)
-async def update_inventory(item_id: uuid.UUID, inventory: InventoryCreate, db: Annotated[Session, Depends(get_db)]):
-    update_inventory = db.query(Inventory).filter(Inventory.item_id == item_id).first()
+async def update_inventory(item_id: uuid.UUID, inventory: InventoryCreate, request: Request, response: Response, db: Annotated[AsyncSession, Depends(get_async_db)]):
+    update_inventory = await db.get(Inventory, item_id)
     if not update_inventory:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Inventory item not found.')
+    check_if_match(request, item_etag(update_inventory.version))
     for key, value in inventory.model_dump().items():
         setattr(update_inventory, key, value)
-    db.commit()
-    db.refresh(update_inventory)
+    try:
+        await db.commit()
+    except StaleDataError:
+        await db.rollback()
+        raise HTTPException(status_code=status.HTTP_412_PRECONDITION_FAILED, detail="Inventory item was modified concurrently; fetch it again before updating.")
+    await db.refresh(update_inventory)
+    response.headers.update(validator_headers(item_etag(update_inventory.version), update_inventory.updated_at))
     return update_inventory
 
 @router.delete("/inventory/{item_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_inventory(item_id: uuid.UUID, db: Annotated[Session, Depends(get_db)]):
-    inventory = db.query(Inventory).filter(Inventory.item_id == item_id).first()
+async def delete_inventory(item_id: uuid.UUID, db: Annotated[AsyncSession, Depends(get_async_db)]):
+    inventory = await db.get(Inventory, item_id)
     if not inventory:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Inventory item not found.")
-    db.delete(inventory)
-    db.commit()
+    await db.delete(inventory)
+    await db.commit()
     return {"detail": "Inventory item deleted successfully"}
\ No newline at end of file
@@ -0,0 +1,67 @@
+from typing import Annotated, Optional
+import uuid
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette import status
+from crud import get_page, get_row, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from database.database import get_async_db
+from models.models import MedicalRecord
+from responses import FastJSONResponse
+from schemas.schema import MedicalRecordCreate, MedicalRecordRead, Page
+
+router = APIRouter()
+
+@router.post("/medical-records/", status_code=status.HTTP_201_CREATED)
+async def create_medical_record(medical_record: MedicalRecordCreate, db: Annotated[AsyncSession, Depends(get_async_db)]):
+    new_medical_record = MedicalRecord(**medical_record.model_dump())
+    db.add(new_medical_record)
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Patient or doctor does not exist.")
+    await db.refresh(new_medical_record)
+    return new_medical_record
+
+@router.get("/medical-records", status_code=status.HTTP_200_OK, response_model=Page)
+async def get_all_medical_records(db: Annotated[AsyncSession, Depends(get_async_db)], limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE, cursor: Optional[uuid.UUID] = None, patient_id: Optional[uuid.UUID] = None, doctor_id: Optional[uuid.UUID] = None, fields: Optional[str] = None):
+    try:
+        page = await get_page(MedicalRecord, db, limit, cursor, {"patient_id": patient_id, "doctor_id": doctor_id}, fields)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if not page["items"] and cursor is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No medical records found.")
+    return FastJSONResponse(page)
+
+@router.get("/medical-records/{record_id}", status_code=status.HTTP_200_OK, response_model=MedicalRecordRead)
+async def get_medical_record(record_id: uuid.UUID, db: Annotated[AsyncSession, Depends(get_async_db)]):
+    medical_record = await get_row(MedicalRecord, db, record_id)
+    if not medical_record:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Medical record not found.")
+    return medical_record
+
+@router.put("/medical-records/{record_id}", status_code=status.HTTP_202_ACCEPTED)
+async def update_medical_record(record_id: uuid.UUID, medical_record: MedicalRecordCreate, db: Annotated[AsyncSession, Depends(get_async_db)]):
+    # Updated through the ORM so the audit log records the old and new values.
+    update_medical_record = await db.get(MedicalRecord, record_id)
+    if not update_medical_record:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Medical record not found.')
+    for key, value in medical_record.model_dump().items():
+        setattr(update_medical_record, key, value)
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Patient or doctor does not exist.")
+    await db.refresh(update_medical_record)
+    return update_medical_record
+
+@router.delete("/medical-records/{record_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_medical_record(record_id: uuid.UUID, db: Annotated[AsyncSession, Depends(get_async_db)]):
+    medical_record = await db.get(MedicalRecord, record_id)
+    if not medical_record:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Medical record not found.")
+    await db.delete(medical_record)
+    await db.commit()
+    return {"detail": "Medical record deleted successfully"}
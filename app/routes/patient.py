@@ -1,55 +1,80 @@
-from typing import Annotated, List
+from typing import Annotated, List, Optional
 import uuid
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
-from database.database import get_db
-from sqlalchemy.exc import SQLAlchemyError
+from crud import get_page, get_row, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, bulk_upsert, BULK_MAX_ITEMS
+from database.database import get_async_db
+from sqlalchemy.exc import IntegrityError
 from models.models import Patient
-from schemas.schema import PatientCreate
+from schemas.schema import PatientCreate, PatientRead, Page, BulkResult, TimelinePage
+from responses import FastJSONResponse
+from services.timeline import patient_timeline
 
 router = APIRouter()
 
 @router.post("/patients/", status_code=status.HTTP_201_CREATED)
-async def create_patients(patient: PatientCreate, db: Annotated[Session, Depends(get_db)]):
+async def create_patients(patient: PatientCreate, db: Annotated[AsyncSession, Depends(get_async_db)]):
     new_patient = Patient(**patient.model_dump())
     db.add(new_patient)
-    db.commit()
-    db.refresh(new_patient)
+    await db.commit()
+    await db.refresh(new_patient)
     if not new_patient:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to create patient.")
     return new_patient
 
-@router.get("/patients", status_code=status.HTTP_200_OK, response_model=List[PatientCreate])
-async def get_all_patients(db: Annotated[Session, Depends(get_db)]):
-    patients = db.query(Patient).all()
-    if not patients:
+@router.post("/patients/bulk", status_code=status.HTTP_200_OK, response_model=BulkResult)
+async def bulk_create_patients(patients: Annotated[List[PatientCreate], Body(max_length=BULK_MAX_ITEMS)], db: Annotated[AsyncSession, Depends(get_async_db)]):
+    try:
+        return await bulk_upsert(Patient, db, [item.model_dump() for item in patients], conflict_key="phone_number")
+    except IntegrityError as e:
+        await db.rollback()
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=f"Bulk patient import failed: {e.orig}")
+
+@router.get("/patients", status_code=status.HTTP_200_OK, response_model=Page)
+async def get_all_patients(db: Annotated[AsyncSession, Depends(get_async_db)], limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE, cursor: Optional[uuid.UUID] = None, city: Optional[str] = None, state: Optional[str] = None, fields: Optional[str] = None):
+    try:
+        page = await get_page(Patient, db, limit, cursor, {"city": city, "state": state}, fields)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if not page["items"] and cursor is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No patients found.")
-    return patients
+    # Rows are already plain mappings; returning the response directly skips
+    # a per-row validation pass against Page.
+    return FastJSONResponse(page)
 
-@router.get("/patients/{patient_id}", response_model=PatientCreate, status_code=status.HTTP_200_OK)
-async def get_patient(patient_id: uuid.UUID, db: Annotated[Session, Depends(get_db)]):
-    patient = db.query(Patient).filter(Patient.patient_id == patient_id).first()
+@router.get("/patients/{patient_id}", response_model=PatientRead, status_code=status.HTTP_200_OK)
+async def get_patient(patient_id: uuid.UUID, db: Annotated[AsyncSession, Depends(get_async_db)]):
+    patient = await get_row(Patient, db, patient_id)
     if not patient:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Patient not found.")
     return patient
 
+@router.get("/patients/{patient_id}/timeline", response_model=TimelinePage, status_code=status.HTTP_200_OK)
+async def get_patient_timeline(patient_id: uuid.UUID, db: Annotated[AsyncSession, Depends(get_async_db)], limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None):
+    if not await db.get(Patient, patient_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Patient not found.")
+    try:
+        return await patient_timeline(db, patient_id, limit, cursor)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid timeline cursor.")
+
 @router.put("/patients/{patient_id}", status_code=status.HTTP_202_ACCEPTED)
-async def update_patient(patient_id: uuid.UUID, patient: PatientCreate, db: Annotated[Session, Depends(get_db)]):
-    update_patient = db.query(Patient).filter(Patient.patient_id == patient_id).first()
+async def update_patient(patient_id: uuid.UUID, patient: PatientCreate, db: Annotated[AsyncSession, Depends(get_async_db)]):
+    update_patient = await db.get(Patient, patient_id)
     if not update_patient:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Patient not found.')
     for key, value in patient.model_dump().items():
         setattr(update_patient, key, value)
-    db.commit()
-    db.refresh(update_patient)
+    await db.commit()
+    await db.refresh(update_patient)
     return update_patient
 
 @router.delete("/patients/{patient_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_patient(patient_id: uuid.UUID, db: Annotated[Session, Depends(get_db)]):
-    patient = db.query(Patient).filter(Patient.patient_id == patient_id).first()
+async def delete_patient(patient_id: uuid.UUID, db: Annotated[AsyncSession, Depends(get_async_db)]):
+    patient = await db.get(Patient, patient_id)
     if not patient:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Patient not found.")
-    db.delete(patient)
-    db.commit()
+    await db.delete(patient)
+    await db.commit()
     return {"detail": "Patient deleted successfully"}
@@ -0,0 +1,34 @@
+from typing import Annotated
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette import status
+from database.database import get_async_db
+from schemas.schema import SearchPage
+from services.search import MIN_QUERY_LENGTH, search_medical_history, search_medical_records, search_patients
+
+router = APIRouter()
+
+# Ranked results are paged by offset; deep offsets are capped because they
+# cost as much as returning every earlier page.
+MAX_SEARCH_LIMIT = 100
+MAX_SEARCH_OFFSET = 1000
+
+SearchQuery = Annotated[str, Query(min_length=MIN_QUERY_LENGTH, max_length=200)]
+Limit = Annotated[int, Query(ge=1, le=MAX_SEARCH_LIMIT)]
+Offset = Annotated[int, Query(ge=0, le=MAX_SEARCH_OFFSET)]
+
+@router.get("/search/patients", status_code=status.HTTP_200_OK, response_model=SearchPage)
+async def search_patients_by_name_or_phone(q: SearchQuery, db: Annotated[AsyncSession, Depends(get_async_db)], limit: Limit = 20, offset: Offset = 0):
+    # The length is checked again on the stripped term the index will see.
+    try:
+        return await search_patients(db, q.strip(), limit, offset)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+@router.get("/search/medical-history", status_code=status.HTTP_200_OK, response_model=SearchPage)
+async def search_patient_medical_history(q: SearchQuery, db: Annotated[AsyncSession, Depends(get_async_db)], limit: Limit = 20, offset: Offset = 0):
+    return await search_medical_history(db, q, limit, offset)
+
+@router.get("/search/medical-records", status_code=status.HTTP_200_OK, response_model=SearchPage)
+async def search_medical_records_by_text(q: SearchQuery, db: Annotated[AsyncSession, Depends(get_async_db)], limit: Limit = 20, offset: Offset = 0):
+    return await search_medical_records(db, q, limit, offset)
@@ -1,57 +1,77 @@
-from typing import Annotated, List
+from typing import Annotated, List, Optional
 import uuid
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
-from crud import create_item
-from database.database import get_db
+from cache.cache import cache
+from crud import get_row, get_page, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, bulk_upsert, BULK_MAX_ITEMS
+from database.database import get_async_db, get_primary_async_db
 from models.models import Staff
-from schemas.schema import StaffCreate
+from responses import FastJSONResponse
+from schemas.schema import StaffCreate, StaffRead, Page, BulkResult
 
 router = APIRouter()
 
 @router.post("/staff/", status_code=status.HTTP_201_CREATED)
-async def create_staff(staff: StaffCreate, db: Annotated[Session, Depends(get_db)]):
+async def create_staff(staff: StaffCreate, db: Annotated[AsyncSession, Depends(get_async_db)]):
     new_staff = Staff(**staff.model_dump())
     db.add(new_staff)
-    db.commit()
-    db.refresh(new_staff)
+    await db.commit()
+    await db.refresh(new_staff)
     if not new_staff:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to create staff.")
     return new_staff
 
-@router.get("/staff", status_code=status.HTTP_200_OK, response_model=List[StaffCreate])
-async def get_all_staff(db: Annotated[Session, Depends(get_db)]):
-    staff = db.query(Staff).all()
-    if not staff:
+@router.post("/staff/bulk", status_code=status.HTTP_200_OK, response_model=BulkResult)
+async def bulk_create_staff(staff: Annotated[List[StaffCreate], Body(max_length=BULK_MAX_ITEMS)], db: Annotated[AsyncSession, Depends(get_async_db)]):
+    try:
+        result = await bulk_upsert(Staff, db, [item.model_dump() for item in staff], conflict_key="phone_number")
+    except IntegrityError as e:
+        await db.rollback()
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=f"Bulk staff import failed: {e.orig}")
+    await cache.delete(*(f"staff:{item['id']}" for item in result["results"] if item["outcome"] == "updated"))
+    return result
+
+@router.get("/staff", status_code=status.HTTP_200_OK, response_model=Page)
+async def get_all_staff(db: Annotated[AsyncSession, Depends(get_async_db)], limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE, cursor: Optional[uuid.UUID] = None, role: Optional[str] = None, fields: Optional[str] = None):
+    try:
+        page = await get_page(Staff, db, limit, cursor, {"role": role}, fields)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if not page["items"] and cursor is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No staff found.")
-    return staff
+    # Rows are already plain mappings; returning the response directly skips
+    # a per-row validation pass against Page.
+    return FastJSONResponse(page)
 
 
-@router.get("/staff/{staff_id}", response_model=StaffCreate, status_code=status.HTTP_200_OK)
-async def get_staff(staff_id: uuid.UUID, db: Annotated[Session, Depends(get_db)]):
-    staff = db.query(Staff).filter(Staff.staff_id == staff_id).first()
+@router.get("/staff/{staff_id}", response_model=StaffRead, status_code=status.HTTP_200_OK)
+async def get_staff(staff_id: uuid.UUID, db: Annotated[AsyncSession, Depends(get_primary_async_db)]):
+    staff = await cache.get_or_load(f"staff:{staff_id}", lambda: get_row(Staff, db, staff_id))
     if not staff:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Staff not found.")
     return staff
 
 @router.put("/staff/{staff_id}", status_code=status.HTTP_202_ACCEPTED)
-async def update_staff(staff_id: uuid.UUID, staff: StaffCreate, db: Annotated[Session, Depends(get_db)]):
-    update_staff = db.query(Staff).filter(Staff.staff_id == staff_id).first()
+async def update_staff(staff_id: uuid.UUID, staff: StaffCreate, db: Annotated[AsyncSession, Depends(get_async_db)]):
+    update_staff = await db.get(Staff, staff_id)
     if not update_staff:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Staff not found.')
     for key, value in staff.model_dump().items():
         setattr(update_staff, key, value)
-    db.commit()
-    db.refresh(update_staff)
+    await db.commit()
+    await db.refresh(update_staff)
+    await cache.delete(f"staff:{staff_id}")
     return update_staff
 
 @router.delete("/staff/{staff_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_staff(staff_id: uuid.UUID, db: Annotated[Session, Depends(get_db)]):
-    staff = db.query(Staff).filter(Staff.staff_id == staff_id).first()
+async def delete_staff(staff_id: uuid.UUID, db: Annotated[AsyncSession, Depends(get_async_db)]):
+    staff = await db.get(Staff, staff_id)
     if not staff:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Staff not found.")
-    db.delete(staff)
-    db.commit()
+    await db.delete(staff)
+    await db.commit()
+    await cache.delete(f"staff:{staff_id}")
     return {"detail": "Staff deleted successfully"}
 
@@ -0,0 +1,54 @@
+from typing import Annotated, Optional
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy import exists, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette import status
+from auth.security import bearer_scheme, create_access_token, get_current_user, hash_password, needs_rehash, revoked_tokens, verify_password
+from database.database import get_async_db
+from models.models import User
+from schemas.schema import LoginRequest, Token, UserCreate, UserRead
+
+router = APIRouter()
+
+ADMIN_ROLE = "admin"
+
+# A fixed hash to verify against when the username does not exist, so a miss
+# costs the same scrypt work as a wrong password.
+_DUMMY_HASH = "scrypt$16384$8$1$AAAAAAAAAAAAAAAAAAAAAA$AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA"
+
+@router.post("/users/", status_code=status.HTTP_201_CREATED, response_model=UserRead)
+async def create_user(user: UserCreate, db: Annotated[AsyncSession, Depends(get_async_db)], credentials: Annotated[Optional[HTTPAuthorizationCredentials], Depends(bearer_scheme)]):
+    # The first account can be created anonymously to bootstrap the system;
+    # after that only admins may register users.
+    if await db.scalar(select(exists().select_from(User))):
+        claims = await get_current_user(credentials)
+        if claims["role"] != ADMIN_ROLE:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only admins can create users.")
+    new_user = User(username=user.username, password=await hash_password(user.password), role=user.role)
+    db.add(new_user)
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Username is already taken.")
+    return new_user
+
+@router.post("/users/login", status_code=status.HTTP_200_OK, response_model=Token)
+async def login(credentials: LoginRequest, db: Annotated[AsyncSession, Depends(get_async_db)]):
+    user = await db.scalar(select(User).where(User.username == credentials.username))
+    if not await verify_password(credentials.password, user.password if user else _DUMMY_HASH) or user is None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Incorrect username or password.", headers={"WWW-Authenticate": "Bearer"})
+    if needs_rehash(user.password):
+        user.password = await hash_password(credentials.password)
+        await db.commit()
+    return create_access_token(user)
+
+@router.post("/users/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(claims: Annotated[dict, Depends(get_current_user)]):
+    await revoked_tokens.revoke(claims["jti"], claims["exp"])
+
+@router.get("/users/me", status_code=status.HTTP_200_OK, response_model=UserRead)
+async def get_me(claims: Annotated[dict, Depends(get_current_user)]):
+    return UserRead(user_id=claims["sub"], username=claims["username"], role=claims["role"])
@@ -1,5 +1,7 @@
-from datetime import date
-from typing import Optional
+import datetime as dt
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, EmailStr, Field
 import uuid
 
@@ -14,6 +16,21 @@ class PatientCreate(BaseModel):
     email: Optional[EmailStr] = None
     medical_history: str
 
+# Read schemas describe rows we already stored, so they carry no input
+# validation (patterns, EmailStr); they exist for documentation and to keep
+# output cheap to serialise.
+class PatientRead(BaseModel):
+    patient_id: uuid.UUID
+    name: str
+    date_of_birth: date
+    address: str
+    city: str
+    state: str
+    zip_code: str
+    phone_number: str
+    email: Optional[str] = None
+    medical_history: Optional[str] = None
+
 class DoctorCreate(BaseModel):
     name: str
     specialization: str
@@ -21,6 +38,16 @@ class DoctorCreate(BaseModel):
     email: Optional[EmailStr] = None
     availability_schedule: str
 
+class DoctorRead(BaseModel):
+    doctor_id: uuid.UUID
+    name: str
+    specialization: str
+    phone_number: str
+    email: Optional[str] = None
+    availability_schedule: Optional[str] = None
+    version: int
+    updated_at: datetime
+
 class AppointmentCreate(BaseModel):
     patient_id: uuid.UUID
     doctor_id: uuid.UUID
@@ -34,21 +61,68 @@ class AppointmentCreate(BaseModel):
             raise ValueError('Appointment date must be today or in the future.')
         return date   
 
+class AppointmentRead(BaseModel):
+    appointment_id: uuid.UUID
+    patient_id: Optional[uuid.UUID] = None
+    doctor_id: Optional[uuid.UUID] = None
+    date: date
+    time: str
+    status: str
+
+class SlotRead(BaseModel):
+    slot_id: uuid.UUID
+    doctor_id: uuid.UUID
+    doctor_name: str
+    specialization: str
+    starts_at: datetime
+    ends_at: datetime
+
 class MedicalRecordCreate(BaseModel):
     patient_id: uuid.UUID
-    doctor_id: str
+    doctor_id: uuid.UUID
     diagnosis: str
     treatment: str
     prescription: str
+    # dt.date rather than date: inside this class body the field name would
+    # shadow the type once a default is assigned.
+    date: dt.date = Field(default_factory=dt.date.today)
+
+class MedicalRecordRead(BaseModel):
+    record_id: uuid.UUID
+    patient_id: Optional[uuid.UUID] = None
+    doctor_id: Optional[uuid.UUID] = None
+    diagnosis: str
+    treatment: str
+    prescription: Optional[str] = None
+    # dt.date for the same reason as MedicalRecordCreate.date.
+    date: Optional[dt.date] = None
 
 class BillingCreate(BaseModel):
     patient_id: uuid.UUID
     date: date
-    amount: float = Field(gt=0, description="Amount should be positive with 2 decimal places") 
+    amount: Decimal = Field(gt=0, max_digits=12, decimal_places=2, description="Amount should be positive with 2 decimal places") 
     payment_status: str
     insurance_details: str
     payment_method: str
 
+class BillingRead(BaseModel):
+    bill_id: uuid.UUID
+    patient_id: Optional[uuid.UUID] = None
+    date: date
+    amount: Decimal
+    payment_status: str
+    insurance_details: Optional[str] = None
+    payment_method: str
+
+class BillingReportRow(BaseModel):
+    day: Optional[date] = None
+    payment_method: Optional[str] = None
+    payment_status: Optional[str] = None
+    bill_count: int
+    total_amount: Decimal
+    paid_amount: Decimal
+    outstanding_amount: Decimal
+
 class InventoryCreate(BaseModel):
     name: str
     quantity: int = Field(gt=0, description="Quantity should be a positive integer") 
@@ -62,6 +136,16 @@ class InventoryCreate(BaseModel):
             raise ValueError('Expire date must be today or in the future.')
         return date
 
+class InventoryRead(BaseModel):
+    item_id: uuid.UUID
+    name: str
+    quantity: int
+    supplier: str
+    expiry_date: date
+    category: str
+    version: int
+    updated_at: datetime
+
 class StaffCreate(BaseModel):
     name: str
     role: str
@@ -69,12 +153,81 @@ class StaffCreate(BaseModel):
     email: Optional[EmailStr] = None
     schedule: str
 
+class StaffRead(BaseModel):
+    staff_id: uuid.UUID
+    name: str
+    role: str
+    phone_number: str
+    email: Optional[str] = None
+    schedule: Optional[str] = None
+
 class DepartmentCreate(BaseModel):
     name: str
     head_of_department_id: str
     contact_information: str
 
+class DepartmentRead(BaseModel):
+    department_id: uuid.UUID
+    name: str
+    head_of_department_id: Optional[uuid.UUID] = None
+    contact_information: str
+    version: int
+    updated_at: datetime
+
 class UserCreate(BaseModel):
     username: str
     password: str = Field(..., min_length=8, description="Password should be at least 8 characters long") 
     role: str
+
+class UserRead(BaseModel):
+    user_id: uuid.UUID
+    username: str
+    role: str
+
+class LoginRequest(BaseModel):
+    username: str
+    password: str
+
+class Token(BaseModel):
+    access_token: str
+    token_type: str
+    expires_in: int
+
+
+class Page(BaseModel):
+    items: List[Dict[str, Any]]
+    next_cursor: Optional[uuid.UUID] = None
+
+class SearchPage(BaseModel):
+    items: List[Dict[str, Any]]
+    next_offset: Optional[int] = None
+
+class TimelineEntry(BaseModel):
+    type: str
+    id: uuid.UUID
+    # dt.date for the same reason as MedicalRecordCreate.date.
+    date: Optional[dt.date] = None
+    doctor: Optional[Dict[str, Any]] = None
+    details: Dict[str, Any]
+
+class TimelinePage(BaseModel):
+    items: List[TimelineEntry]
+    next_cursor: Optional[str] = None
+
+class ChangeFeedPage(BaseModel):
+    items: List[Dict[str, Any]]
+    # Always set once a consumer has a position; poll again with it to tail.
+    next_cursor: Optional[str] = None
+    has_more: bool
+
+class BulkItemResult(BaseModel):
+    index: int
+    id: Optional[uuid.UUID] = None
+    outcome: str
+    detail: Optional[str] = None
+
+class BulkResult(BaseModel):
+    created: int
+    updated: int
+    skipped: int
+    results: List[BulkItemResult]
@@ -0,0 +1,77 @@
+"""Check read-replica routing against two independent local databases.
+
+No replication is needed: create a second database, migrate both, then run
+from the app/ directory:
+
+    createdb HospitalManagement_replica
+    DATABASE_URL=postgresql://.../HospitalManagement_replica alembic upgrade head
+    ASYNC_REPLICA_DATABASE_URLS=postgresql+asyncpg://.../HospitalManagement_replica \\
+        python -m scripts.check_replica_routing
+
+Because the two databases never sync, where a row is visible tells us which
+one served the request:
+
+* a row inserted only into the "replica" is readable by a fresh client, so
+  GETs go to the replica;
+* a row created through the API is readable by the client that created it
+  (read-your-writes cookie) but not by a fresh client within the window.
+"""
+import asyncio
+import os
+import sys
+import uuid
+from datetime import date, timedelta
+
+# Routing is what is under test, not auth or background jobs.
+os.environ["AUTH_ENABLED"] = "false"
+os.environ["INVENTORY_ALERTS_ENABLED"] = "false"
+
+import httpx
+from sqlalchemy import delete, insert
+from sqlalchemy.ext.asyncio import create_async_engine
+from config.settings import settings
+from main import app
+from models.models import Inventory
+
+ITEM = {"name": "routing check", "quantity": 1, "supplier": "routing check", "category": "routing check",
+        "expiry_date": (date.today() + timedelta(days=365)).isoformat()}
+
+
+async def check():
+    if not settings.ASYNC_REPLICA_DATABASE_URLS:
+        print("ASYNC_REPLICA_DATABASE_URLS is not set")
+        return 1
+    replica = create_async_engine(settings.ASYNC_REPLICA_DATABASE_URLS[0])
+    replica_only_id = uuid.uuid4()
+    async with replica.begin() as conn:
+        await conn.execute(insert(Inventory).values(item_id=replica_only_id, **{**ITEM, "expiry_date": date.fromisoformat(ITEM["expiry_date"])}))
+
+    transport = httpx.ASGITransport(app=app)
+    failures = 0
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://routing-check") as writer, \
+                httpx.AsyncClient(transport=transport, base_url="http://routing-check") as reader:
+            results = []
+            response = await reader.get(f"/inventory/{replica_only_id}")
+            results.append(("fresh client reads from the replica", response.status_code == 200))
+
+            created = await writer.post("/inventory/", json=ITEM)
+            created_id = created.json()["item_id"]
+            results.append(("write sets the read-your-writes cookie", "hms_primary_until" in created.cookies))
+            response = await writer.get(f"/inventory/{created_id}")
+            results.append(("writer reads its own write from the primary", response.status_code == 200))
+            response = await reader.get(f"/inventory/{created_id}")
+            results.append(("other clients still read from the replica", response.status_code == 404))
+
+            for description, ok in results:
+                failures += not ok
+                print(f"{'OK  ' if ok else 'FAIL'} {description}")
+            await writer.delete(f"/inventory/{created_id}")
+    async with replica.begin() as conn:
+        await conn.execute(delete(Inventory).where(Inventory.item_id == replica_only_id))
+    await replica.dispose()
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(check()))
@@ -0,0 +1,61 @@
+"""Create upcoming monthly audit_log partitions; run from cron once a month.
+
+Run from the app/ directory:
+
+    python -m scripts.create_audit_partitions --months-ahead 3
+
+Partitions are created ahead of time so inserts never land in the default
+partition. If rows did land there (the job was not run), they are moved into
+the new month's partition in the same transaction, because Postgres refuses
+to attach a range that overlaps rows in the default partition.
+
+Retention is a matter of detaching or dropping whole months, e.g.
+``ALTER TABLE audit_log DETACH PARTITION audit_log_2025_01``; no DELETE
+against the live table is ever needed.
+"""
+import argparse
+import sys
+from datetime import date
+from sqlalchemy import create_engine, text
+from config.settings import settings
+
+
+def _add_months(day: date, months: int) -> date:
+    index = day.year * 12 + day.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+def ensure_partition(conn, start: date) -> bool:
+    name = f"audit_log_{start:%Y_%m}"
+    if conn.execute(text("SELECT to_regclass(:name)"), {"name": name}).scalar() is not None:
+        return False
+    end = _add_months(start, 1)
+    bounds = {"start": start, "end": end}
+    conn.execute(text(f"CREATE TABLE {name} (LIKE audit_log INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"))
+    conn.execute(text(
+        f"WITH moved AS (DELETE FROM audit_log_default WHERE changed_at >= :start AND changed_at < :end RETURNING *) "
+        f"INSERT INTO {name} SELECT * FROM moved"
+    ), bounds)
+    conn.execute(text(f"ALTER TABLE audit_log ATTACH PARTITION {name} FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"))
+    return True
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    parser.add_argument("--months-ahead", type=int, default=3)
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    first = date.today().replace(day=1)
+    for offset in range(args.months_ahead + 1):
+        start = _add_months(first, offset)
+        # One transaction per month, so the lock ATTACH holds on the default
+        # partition while re-checking it is released quickly.
+        with engine.begin() as conn:
+            created = ensure_partition(conn, start)
+        print(f"{'created' if created else 'exists '} audit_log_{start:%Y_%m}")
+    engine.dispose()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
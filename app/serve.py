@@ -0,0 +1,72 @@
+"""Production entry point: one uvicorn worker process per CPU core.
+
+Run from the app/ directory after `alembic upgrade head`:
+
+    python serve.py --host 0.0.0.0 --port 8000
+
+Each worker builds its own connection pool in the application lifespan, so
+the database sees up to workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW)
+connections; size max_connections accordingly. On SIGTERM workers stop
+accepting connections, finish in-flight requests for up to
+GRACEFUL_SHUTDOWN_SECONDS and then close their pools.
+
+More than one worker requires CACHE_BACKEND=redis: with the in-process
+cache every worker would keep its own copy of cached rows and of the token
+revocation list, so an update or a logout handled by one worker would go
+unnoticed by the others.
+"""
+import argparse
+import logging
+import os
+import uvicorn
+from auth.security import InsecureSecretKeyError, check_secret_key
+from config.settings import settings
+
+logger = logging.getLogger("hospital.serve")
+
+
+def default_workers() -> int:
+    if settings.WEB_CONCURRENCY > 0:
+        return settings.WEB_CONCURRENCY
+    # The handlers are async, so a worker saturates one core; more processes
+    # than cores only adds context switches and database connections.
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=default_workers())
+    parser.add_argument("--log-level", default="info")
+    args = parser.parse_args()
+    try:
+        check_secret_key()
+    except InsecureSecretKeyError as e:
+        parser.error(str(e))
+    if args.workers > 1 and settings.CACHE_BACKEND != "redis":
+        parser.error(
+            f"--workers {args.workers} needs CACHE_BACKEND=redis; the in-memory cache and token "
+            "revocation list are per process. Set CACHE_BACKEND=redis or run --workers 1."
+        )
+
+    logging.basicConfig(level=args.log_level.upper())
+    max_connections = args.workers * (settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW)
+    logger.info("Starting %d workers; up to %d database connections", args.workers, max_connections)
+    uvicorn.run(
+        "main:app",
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        lifespan="on",
+        proxy_headers=True,
+        timeout_graceful_shutdown=settings.GRACEFUL_SHUTDOWN_SECONDS,
+        log_level=args.log_level,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Optional
+from sqlalchemy import event, func, insert, inspect, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from auth.security import current_actor
+from crud import bulk_write_listeners, primary_key, public_columns
+from models.models import AuditLog, Billing, MedicalRecord, Patient
+
+AUDITED_MODELS = (Patient, MedicalRecord, Billing)
+
+
+def _jsonable(value):
+    if isinstance(value, (uuid.UUID, Decimal)):
+        return str(value)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+def _loaded_values(state) -> dict:
+    # Only what is already in memory: the handler is mid-flush, and a deleted
+    # row cannot be reloaded anyway.
+    return {key: _jsonable(state.dict[key]) for key in public_columns(state.class_) if key in state.dict}
+
+def _changed_values(state):
+    old, new = {}, {}
+    for key in public_columns(state.class_):
+        history = state.attrs[key].history
+        if not history.has_changes():
+            continue
+        old[key] = _jsonable(history.deleted[0]) if history.deleted else None
+        new[key] = _jsonable(history.added[0]) if history.added else None
+    return old, new
+
+def _entry(state, operation: str, old_values: Optional[dict], new_values: Optional[dict]) -> dict:
+    return {
+        "table_name": state.class_.__tablename__,
+        "row_id": state.dict[primary_key(state.class_).key],
+        "operation": operation,
+        "old_values": old_values,
+        "new_values": new_values,
+        "actor": current_actor.get(),
+    }
+
+def _after_flush(session, flush_context):
+    # after_flush still sees the pre-flush new/dirty/deleted sets and
+    # attribute history, and primary keys have been assigned by now. The
+    # audit rows go out on the same connection, i.e. in the same transaction
+    # as the change itself, so they commit or roll back together.
+    entries = []
+    for obj in session.new:
+        if isinstance(obj, AUDITED_MODELS):
+            entries.append(_entry(inspect(obj), "insert", None, _loaded_values(inspect(obj))))
+    for obj in session.dirty:
+        if isinstance(obj, AUDITED_MODELS):
+            old, new = _changed_values(inspect(obj))
+            if new:
+                entries.append(_entry(inspect(obj), "update", old, new))
+    for obj in session.deleted:
+        if isinstance(obj, AUDITED_MODELS):
+            entries.append(_entry(inspect(obj), "delete", _loaded_values(inspect(obj)), None))
+    if entries:
+        session.connection().execute(insert(AuditLog.__table__), entries)
+
+async def _record_bulk_changes(db: AsyncSession, model, written: list):
+    # Core bulk upserts bypass the unit of work, so crud.bulk_upsert reports
+    # them here. Old values of upserted rows are not known.
+    if model not in AUDITED_MODELS:
+        return
+    pk = primary_key(model)
+    columns = public_columns(model)
+    entries = [
+        {
+            "table_name": model.__tablename__,
+            "row_id": result["id"],
+            "operation": "insert" if result["outcome"] == "created" else "update",
+            "old_values": None,
+            "new_values": {key: _jsonable(value) for key, value in row.items() if key in columns and key != pk.key},
+            "actor": current_actor.get(),
+        }
+        for row, result in written
+        if result["outcome"] in ("created", "updated")
+    ]
+    if entries:
+        await db.execute(insert(AuditLog.__table__), entries)
+
+
+def install_audit_log():
+    # Listens on the Session class, so it covers every AsyncSession (whose
+    # sync_session is a plain Session) whichever engine it is bound to.
+    if not event.contains(Session, "after_flush", _after_flush):
+        event.listen(Session, "after_flush", _after_flush)
+    if _record_bulk_changes not in bulk_write_listeners:
+        bulk_write_listeners.append(_record_bulk_changes)
+
+
+def encode_cursor(txid: int, change_id: int) -> str:
+    return f"{txid}_{change_id}"
+
+def decode_cursor(cursor: str):
+    txid, _, change_id = cursor.partition("_")
+    return int(txid), int(change_id)
+
+async def change_feed(db: AsyncSession, limit: int, cursor: Optional[str] = None):
+    # Ordered by (txid, change_id) and limited to transactions older than the
+    # oldest one still running. Any transaction that commits later has a
+    # txid at or above that horizon, so it always sorts after the cursor a
+    # consumer already holds and is never skipped. Ordering by change_id
+    # alone would lose rows: ids are taken at insert time, not commit time.
+    horizon = func.txid_snapshot_xmin(func.txid_current_snapshot())
+    stmt = (
+        select(*public_columns(AuditLog).values())
+        .where(AuditLog.txid < horizon)
+        .order_by(AuditLog.txid, AuditLog.change_id)
+        .limit(limit + 1)
+    )
+    if cursor:
+        stmt = stmt.where(tuple_(AuditLog.txid, AuditLog.change_id) > decode_cursor(cursor))
+    rows = [dict(row) for row in (await db.execute(stmt)).mappings().all()]
+    page = rows[:limit]
+    # The cursor is returned even for an empty page so a consumer can keep
+    # polling from where it is.
+    next_cursor = encode_cursor(page[-1]["txid"], page[-1]["change_id"]) if page else cursor
+    return {"items": page, "next_cursor": next_cursor, "has_more": len(rows) > limit}
@@ -0,0 +1,64 @@
+from datetime import date
+from decimal import Decimal
+from typing import Optional
+from sqlalchemy import case, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from config.settings import settings
+from models.models import BillingDailySummary
+
+GROUP_COLUMNS = {
+    "day": BillingDailySummary.day,
+    "payment_method": BillingDailySummary.payment_method,
+    "payment_status": BillingDailySummary.payment_status,
+}
+
+SUMMARY_FIELDS = ("date", "payment_method", "payment_status", "amount")
+
+
+def bill_snapshot(bill) -> dict:
+    return {field: getattr(bill, field) for field in SUMMARY_FIELDS}
+
+async def record_bill_change(db: AsyncSession, old: Optional[dict] = None, new: Optional[dict] = None):
+    """Apply one bill write to the daily summary in the caller's transaction.
+
+    ``old`` is the bill before the write (None on create) and ``new`` the bill
+    after it (None on delete). Only the affected summary rows are touched.
+    """
+    deltas = {}
+    for snapshot, sign in ((old, -1), (new, 1)):
+        if snapshot is None:
+            continue
+        key = (snapshot["date"], snapshot["payment_method"], snapshot["payment_status"])
+        count, amount = deltas.get(key, (0, Decimal(0)))
+        deltas[key] = (count + sign, amount + sign * Decimal(snapshot["amount"]))
+    # Sorted so concurrent writers lock summary rows in the same order.
+    for (day, method, status), (count, amount) in sorted(deltas.items()):
+        if count == 0 and amount == 0:
+            continue
+        stmt = pg_insert(BillingDailySummary).values(day=day, payment_method=method, payment_status=status, bill_count=count, total_amount=amount)
+        await db.execute(stmt.on_conflict_do_update(
+            index_elements=[BillingDailySummary.day, BillingDailySummary.payment_method, BillingDailySummary.payment_status],
+            set_={
+                "bill_count": BillingDailySummary.bill_count + stmt.excluded.bill_count,
+                "total_amount": BillingDailySummary.total_amount + stmt.excluded.total_amount,
+            },
+        ))
+
+async def billing_report(db: AsyncSession, group_by: list, start: Optional[date] = None, end: Optional[date] = None):
+    columns = [GROUP_COLUMNS[name] for name in group_by]
+    paid = func.lower(BillingDailySummary.payment_status).in_(settings.BILLING_PAID_STATUSES)
+    total = func.coalesce(func.sum(BillingDailySummary.total_amount), 0)
+    paid_total = func.coalesce(func.sum(case((paid, BillingDailySummary.total_amount), else_=0)), 0)
+    stmt = select(
+        *columns,
+        func.coalesce(func.sum(BillingDailySummary.bill_count), 0).label("bill_count"),
+        total.label("total_amount"),
+        paid_total.label("paid_amount"),
+        (total - paid_total).label("outstanding_amount"),
+    ).group_by(*columns).order_by(*columns)
+    if start is not None:
+        stmt = stmt.where(BillingDailySummary.day >= start)
+    if end is not None:
+        stmt = stmt.where(BillingDailySummary.day <= end)
+    return [dict(row) for row in (await db.execute(stmt)).mappings()]
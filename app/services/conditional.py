@@ -0,0 +1,70 @@
+import hashlib
+import json
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+from fastapi import HTTPException, Request
+from starlette import status
+
+
+def _as_datetime(value) -> Optional[datetime]:
+    # Rows cached in Redis come back with datetimes serialised as strings.
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+def http_date(value) -> str:
+    return format_datetime(_as_datetime(value).astimezone(timezone.utc), usegmt=True)
+
+def item_etag(version) -> str:
+    return f'"{version}"'
+
+def page_etag(request: Request, page: dict, pk_key: str, version_key: str) -> str:
+    # A page is identified by the query that produced it plus the (id,
+    # version) of every row on it, so any edit, insert or delete in the
+    # window changes the tag.
+    digest = hashlib.sha1(request.url.query.encode())
+    digest.update(json.dumps([[str(item[pk_key]), item[version_key]] for item in page["items"]]).encode())
+    digest.update(str(page["next_cursor"]).encode())
+    return f'W/"{digest.hexdigest()}"'
+
+def validator_headers(etag: str, last_modified=None) -> dict:
+    headers = {"ETag": etag}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    return headers
+
+def page_last_modified(page: dict):
+    values = [_as_datetime(item["updated_at"]) for item in page["items"] if item.get("updated_at") is not None]
+    return max(values) if values else None
+
+def _tags(header: str):
+    return [tag.strip() for tag in header.split(",") if tag.strip()]
+
+def _opaque(tag: str) -> str:
+    return tag[2:] if tag.startswith("W/") else tag
+
+def is_not_modified(request: Request, etag: str, last_modified=None) -> bool:
+    # If-None-Match takes precedence over If-Modified-Since (RFC 9110 13.2.2)
+    # and uses weak comparison.
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return any(tag == "*" or _opaque(tag) == _opaque(etag) for tag in _tags(if_none_match))
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    # HTTP dates have one second resolution.
+    return _as_datetime(last_modified).replace(microsecond=0) <= since
+
+def check_if_match(request: Request, etag: str):
+    # If-Match uses strong comparison; a client that sends none keeps the
+    # old last-write-wins behaviour.
+    if_match = request.headers.get("if-match")
+    if if_match is None:
+        return
+    if not any(tag == "*" or (not tag.startswith("W/") and tag == etag) for tag in _tags(if_match)):
+        raise HTTPException(status_code=status.HTTP_412_PRECONDITION_FAILED, detail="Resource has been modified; fetch it again before updating.")
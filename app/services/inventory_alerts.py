@@ -0,0 +1,93 @@
+from datetime import date, datetime, timedelta, timezone
+from sqlalchemy import select
+from cache.cache import cache
+from config.settings import settings
+from database.database import AsyncSessionLocal
+from models.models import Inventory
+from services.periodic import LeaderTask
+
+# Advisory lock held by whichever worker is currently the scanning leader.
+LEADER_LOCK_KEY = 0x1A1E7
+SNAPSHOT_CACHE_KEY = "inventory:alerts"
+
+ALERT_COLUMNS = (Inventory.item_id, Inventory.name, Inventory.category, Inventory.supplier, Inventory.quantity, Inventory.expiry_date)
+
+
+class InventoryAlertScanner(LeaderTask):
+    """Periodically refreshes expiry and low-stock alerts into a shared snapshot.
+
+    The scans are bounded range queries on indexed columns (expiry_date,
+    quantity), so the cost depends on the number of alerts rather than on
+    the size of the inventory table; requests only ever read the snapshot.
+    Expired and soon-expiring stock are separate lists with their own limit,
+    so a backlog of long-expired items cannot push upcoming expiries out.
+
+    Only the leader worker scans; it publishes the snapshot to the cache,
+    from which all workers serve it.
+    """
+
+    name = "inventory alert scan"
+    lock_key = LEADER_LOCK_KEY
+
+    def __init__(self, session_factory, cache, interval: float, expiry_window_days: int, low_stock_threshold: int, max_items: int):
+        super().__init__(interval)
+        self.session_factory = session_factory
+        self.cache = cache
+        self.expiry_window_days = expiry_window_days
+        self.low_stock_threshold = low_stock_threshold
+        self.max_items = max_items
+        self.snapshot = {"generated_at": None, "expired": [], "expiring": [], "low_stock": []}
+
+    async def current(self) -> dict:
+        shared = await self.cache.get(SNAPSHOT_CACHE_KEY)
+        return shared if shared is not None else self.snapshot
+
+    async def scan(self):
+        today = date.today()
+        expires_before = today + timedelta(days=self.expiry_window_days)
+        async with self.session_factory() as db:
+            expired = await db.execute(
+                select(*ALERT_COLUMNS)
+                .where(Inventory.expiry_date < today)
+                .order_by(Inventory.expiry_date)
+                .limit(self.max_items)
+            )
+            expiring = await db.execute(
+                select(*ALERT_COLUMNS)
+                .where(Inventory.expiry_date >= today, Inventory.expiry_date <= expires_before)
+                .order_by(Inventory.expiry_date)
+                .limit(self.max_items)
+            )
+            low_stock = await db.execute(
+                select(*ALERT_COLUMNS)
+                .where(Inventory.quantity <= self.low_stock_threshold)
+                .order_by(Inventory.quantity)
+                .limit(self.max_items)
+            )
+            self.snapshot = {
+                "generated_at": datetime.now(timezone.utc),
+                "expiry_window_days": self.expiry_window_days,
+                "low_stock_threshold": self.low_stock_threshold,
+                "expired": [dict(row) for row in expired.mappings()],
+                "expiring": [dict(row) for row in expiring.mappings()],
+                "low_stock": [dict(row) for row in low_stock.mappings()],
+            }
+        await self.cache.set(SNAPSHOT_CACHE_KEY, self.snapshot, ttl=max(self.cache.ttl, 3 * self.interval))
+        return self.snapshot
+
+    async def run_once(self):
+        await self.scan()
+
+
+def create_inventory_alert_scanner():
+    return InventoryAlertScanner(
+        AsyncSessionLocal,
+        cache,
+        interval=settings.INVENTORY_ALERT_INTERVAL_SECONDS,
+        expiry_window_days=settings.INVENTORY_EXPIRY_WINDOW_DAYS,
+        low_stock_threshold=settings.INVENTORY_LOW_STOCK_THRESHOLD,
+        max_items=settings.INVENTORY_ALERT_MAX_ITEMS,
+    )
+
+
+inventory_alert_scanner = create_inventory_alert_scanner()
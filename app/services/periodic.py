@@ -0,0 +1,87 @@
+import abc
+import asyncio
+import logging
+from sqlalchemy import text
+from database.database import get_async_engine
+
+logger = logging.getLogger(__name__)
+
+
+class LeaderTask(abc.ABC):
+    """Background loop that runs in every worker but works in only one.
+
+    Each tick the worker holding the Postgres advisory lock lock_key calls
+    run_once(); the others just sleep. If the leader dies its connection
+    closes, the lock is released and another worker takes over on its next
+    tick.
+    """
+
+    name = "background task"
+    lock_key: int
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._task = None
+        self._leader_connection = None
+
+    @abc.abstractmethod
+    async def run_once(self):
+        ...
+
+    async def _is_leader(self) -> bool:
+        # The lock is session level, so it lives as long as the dedicated
+        # connection held in _leader_connection; a failed ping means it is gone.
+        if self._leader_connection is not None:
+            await self._leader_connection.execute(text("SELECT 1"))
+            await self._leader_connection.commit()
+            return True
+        connection = await get_async_engine().connect()
+        try:
+            acquired = (await connection.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": self.lock_key})).scalar()
+            await connection.commit()
+        except Exception:
+            await connection.close()
+            raise
+        if acquired:
+            self._leader_connection = connection
+        else:
+            await connection.close()
+        return acquired
+
+    async def _resign(self):
+        connection, self._leader_connection = self._leader_connection, None
+        if connection is None:
+            return
+        try:
+            # Pooled connections outlive close(), and so would the lock.
+            await connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": self.lock_key})
+            await connection.commit()
+        except Exception:
+            logger.warning("Could not release the %s leader lock", self.name, exc_info=True)
+            await connection.invalidate()
+        await connection.close()
+
+    async def _run(self):
+        while True:
+            try:
+                if await self._is_leader():
+                    await self.run_once()
+            except Exception:
+                logger.exception("%s failed", self.name.capitalize())
+                await self._resign()
+            await asyncio.sleep(self.interval)
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        await self._resign()
@@ -0,0 +1,250 @@
+import logging
+import re
+import uuid
+from datetime import date, datetime, time, timedelta
+from typing import Optional
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from config.settings import settings
+from database.database import AsyncSessionLocal
+from models.models import Appointment, Doctor, DoctorSlot
+from services.periodic import LeaderTask
+
+logger = logging.getLogger(__name__)
+
+WEEKDAYS = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+CANCELLED = "Cancelled"
+
+# One availability rule: "<days> <HH:MM>-<HH:MM>", e.g. "Mon-Fri 09:00-17:00".
+# Days are a comma separated list of day names or day ranges; rules are
+# separated by ";" or new lines.
+_RULE = re.compile(r"^\s*(?P<days>[A-Za-z,\-\s]+?)\s+(?P<start>\d{1,2}:\d{2})\s*-\s*(?P<end>\d{1,2}:\d{2})\s*$")
+
+
+class SlotUnavailableError(Exception):
+    pass
+
+
+def _weekday(name: str) -> int:
+    key = name.strip().lower()[:3]
+    if key not in WEEKDAYS:
+        raise ValueError(f"Unknown day '{name.strip()}' in availability schedule.")
+    return WEEKDAYS.index(key)
+
+def parse_availability(schedule: str) -> list:
+    """Parse an availability schedule into (weekday, start, end) rules.
+
+    >>> parse_availability("Mon-Wed,Fri 09:00-13:00; Sat 10:00-12:00")[0]
+    (0, datetime.time(9, 0), datetime.time(13, 0))
+    """
+    rules = []
+    for chunk in re.split(r"[;\n]", schedule or ""):
+        if not chunk.strip():
+            continue
+        match = _RULE.match(chunk)
+        if not match:
+            raise ValueError(f"Cannot parse availability rule '{chunk.strip()}'; expected e.g. 'Mon-Fri 09:00-17:00'.")
+        start, end = time.fromisoformat(match["start"].zfill(5)), time.fromisoformat(match["end"].zfill(5))
+        if end <= start:
+            raise ValueError(f"Availability rule '{chunk.strip()}' ends before it starts.")
+        days = set()
+        for part in match["days"].split(","):
+            if "-" in part:
+                first, last = (_weekday(name) for name in part.split("-", 1))
+                days.update(range(first, last + 1) if first <= last else [*range(first, 7), *range(0, last + 1)])
+            elif part.strip():
+                days.add(_weekday(part))
+        rules.extend((day, start, end) for day in sorted(days))
+    return rules
+
+def expand_slots(rules: list, start: date, days: int, slot_minutes: int):
+    length = timedelta(minutes=slot_minutes)
+    for offset in range(days):
+        day = start + timedelta(days=offset)
+        for weekday, opens, closes in rules:
+            if weekday != day.weekday():
+                continue
+            slot_start, closes_at = datetime.combine(day, opens), datetime.combine(day, closes)
+            while slot_start + length <= closes_at:
+                yield slot_start, slot_start + length
+                slot_start += length
+
+async def generate_slots(db: AsyncSession, doctor: Doctor, start: Optional[date] = None, days: Optional[int] = None):
+    """Rebuild a doctor's free slots from their availability schedule.
+
+    Booked slots are never touched; free future slots that no longer match
+    the schedule are dropped and missing ones are inserted.
+    """
+    start = start or date.today()
+    days = days or settings.APPOINTMENT_HORIZON_DAYS
+    rules = parse_availability(doctor.availability_schedule)
+    window_start = datetime.combine(start, time.min)
+    window_end = window_start + timedelta(days=days)
+    # Keyed by start time so overlapping rules do not produce duplicate slots.
+    wanted = dict(expand_slots(rules, start, days, settings.APPOINTMENT_SLOT_MINUTES))
+    slots = [
+        {"slot_id": uuid.uuid4(), "doctor_id": doctor.doctor_id, "starts_at": starts_at, "ends_at": ends_at}
+        for starts_at, ends_at in wanted.items()
+    ]
+    existing = await db.scalars(
+        select(DoctorSlot.starts_at).where(
+            DoctorSlot.doctor_id == doctor.doctor_id,
+            DoctorSlot.starts_at >= window_start,
+            DoctorSlot.starts_at < window_end,
+            DoctorSlot.appointment_id.is_(None),
+        )
+    )
+    stale = [starts_at for starts_at in existing if starts_at not in wanted]
+    if stale:
+        await db.execute(
+            delete(DoctorSlot).where(
+                DoctorSlot.doctor_id == doctor.doctor_id,
+                DoctorSlot.starts_at.in_(stale),
+                DoctorSlot.appointment_id.is_(None),
+            )
+        )
+    await _insert_slots(db, slots)
+    await db.commit()
+    return {"doctor_id": doctor.doctor_id, "slots": len(slots), "removed": len(stale)}
+
+async def _insert_slots(db: AsyncSession, slots: list):
+    if slots:
+        await db.execute(pg_insert(DoctorSlot).values(slots).on_conflict_do_nothing(constraint="uq_doctor_slots_doctor_id_starts_at"))
+
+async def _fill_day(db: AsyncSession, doctor_id: uuid.UUID, day: date) -> bool:
+    """Generate a doctor's slots for a day nobody generated slots for yet.
+
+    Days that already have slots, booked or free, are left alone so that a
+    deliberately removed slot is not brought back. Returns whether any slot
+    was added.
+    """
+    day_start = datetime.combine(day, time.min)
+    has_slots = await db.scalar(
+        select(DoctorSlot.slot_id)
+        .where(DoctorSlot.doctor_id == doctor_id, DoctorSlot.starts_at >= day_start, DoctorSlot.starts_at < day_start + timedelta(days=1))
+        .limit(1)
+    )
+    schedule = await db.scalar(select(Doctor.availability_schedule).where(Doctor.doctor_id == doctor_id))
+    if has_slots is not None or not schedule:
+        return False
+    try:
+        rules = parse_availability(schedule)
+    except ValueError:
+        return False
+    slots = [
+        {"slot_id": uuid.uuid4(), "doctor_id": doctor_id, "starts_at": starts_at, "ends_at": ends_at}
+        for starts_at, ends_at in dict(expand_slots(rules, day, 1, settings.APPOINTMENT_SLOT_MINUTES)).items()
+    ]
+    await _insert_slots(db, slots)
+    return bool(slots)
+
+class SlotHorizonExtender(LeaderTask):
+    """Regenerates every scheduled doctor's slots so they reach the horizon.
+
+    Without it the generated window ends APPOINTMENT_HORIZON_DAYS after the
+    last manual generation and the next-free-slots search runs dry. Doctors
+    are walked in doctor_id batches; generate_slots is idempotent.
+    """
+
+    name = "slot generation"
+    lock_key = 0x510751
+    batch_size = 100
+
+    def __init__(self, session_factory, interval: float):
+        super().__init__(interval)
+        self.session_factory = session_factory
+
+    async def run_once(self):
+        after = None
+        while True:
+            async with self.session_factory() as db:
+                stmt = select(Doctor).where(Doctor.availability_schedule.is_not(None)).order_by(Doctor.doctor_id).limit(self.batch_size)
+                if after is not None:
+                    stmt = stmt.where(Doctor.doctor_id > after)
+                doctors = (await db.scalars(stmt)).all()
+                for doctor in doctors:
+                    try:
+                        await generate_slots(db, doctor)
+                    except ValueError as e:
+                        logger.warning("Skipping slots for doctor %s: %s", doctor.doctor_id, e)
+            if len(doctors) < self.batch_size:
+                return
+            after = doctors[-1].doctor_id
+
+async def next_free_slots(db: AsyncSession, specialization: str, limit: int, after: Optional[datetime] = None):
+    # Walks ix_doctor_slots_free_starts_at soonest first, keeping slots of the
+    # specialization, and stops after limit rows instead of sorting them all.
+    # Only generated slots are offered; see POST /appointments/slots/{doctor_id}.
+    stmt = (
+        select(DoctorSlot.slot_id, DoctorSlot.doctor_id, Doctor.name.label("doctor_name"), Doctor.specialization, DoctorSlot.starts_at, DoctorSlot.ends_at)
+        .join(Doctor, Doctor.doctor_id == DoctorSlot.doctor_id)
+        .where(
+            Doctor.specialization == specialization,
+            DoctorSlot.appointment_id.is_(None),
+            DoctorSlot.starts_at >= (after or datetime.now()),
+        )
+        .order_by(DoctorSlot.starts_at, DoctorSlot.doctor_id)
+        .limit(limit)
+    )
+    return [dict(row) for row in (await db.execute(stmt)).mappings()]
+
+def _starts_at(appointment: Appointment) -> datetime:
+    return datetime.combine(appointment.date, time.fromisoformat(appointment.time))
+
+async def _try_claim(db: AsyncSession, appointment: Appointment) -> bool:
+    # A single conditional UPDATE: under concurrent bookings the row lock makes
+    # the loser re-check "appointment_id IS NULL" and match nothing.
+    claimed = await db.execute(
+        update(DoctorSlot)
+        .where(
+            DoctorSlot.doctor_id == appointment.doctor_id,
+            DoctorSlot.starts_at == _starts_at(appointment),
+            DoctorSlot.appointment_id.is_(None),
+        )
+        .values(appointment_id=appointment.appointment_id)
+        .returning(DoctorSlot.slot_id)
+    )
+    return claimed.scalar_one_or_none() is not None
+
+async def _claim_slot(db: AsyncSession, appointment: Appointment):
+    # Slots are normally generated ahead of time; a day beyond the horizon or
+    # never generated is filled from the schedule on demand. Only a time the
+    # schedule does not offer, or one already taken, is unavailable.
+    if await _try_claim(db, appointment):
+        return
+    if await _fill_day(db, appointment.doctor_id, appointment.date) and await _try_claim(db, appointment):
+        return
+    raise SlotUnavailableError(f"Doctor has no free slot at {appointment.date} {appointment.time}.")
+
+async def _release_slot(db: AsyncSession, appointment: Appointment):
+    await db.execute(update(DoctorSlot).where(DoctorSlot.appointment_id == appointment.appointment_id).values(appointment_id=None))
+
+async def book_appointment(db: AsyncSession, data: dict) -> Appointment:
+    appointment = Appointment(appointment_id=uuid.uuid4(), **data)
+    db.add(appointment)
+    try:
+        await db.flush()
+        await _claim_slot(db, appointment)
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+    return appointment
+
+async def reschedule_appointment(db: AsyncSession, appointment: Appointment, data: dict) -> Appointment:
+    try:
+        await _release_slot(db, appointment)
+        for key, value in data.items():
+            setattr(appointment, key, value)
+        await db.flush()
+        if appointment.status != CANCELLED:
+            await _claim_slot(db, appointment)
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+    return appointment
+
+
+slot_horizon_extender = SlotHorizonExtender(AsyncSessionLocal, interval=settings.SLOT_GENERATION_INTERVAL_SECONDS)
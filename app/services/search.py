@@ -0,0 +1,64 @@
+import re
+from sqlalchemy import func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from models.models import MedicalRecord, Patient
+
+SEARCH_LANGUAGE = "english"
+# Anything that looks like (part of) a phone number is matched against
+# phone_number instead of the name.
+_PHONE_QUERY = re.compile(r"^\+?[\d\s\-]{3,}$")
+# pg_trgm extracts no trigram from fewer than three characters, so shorter
+# terms cannot use the trigram indexes and would scan the whole table.
+MIN_QUERY_LENGTH = 3
+
+PATIENT_COLUMNS = (Patient.patient_id, Patient.name, Patient.phone_number, Patient.date_of_birth, Patient.city, Patient.state)
+
+
+async def _page(db: AsyncSession, stmt, limit: int, offset: int):
+    rows = (await db.execute(stmt.limit(limit + 1).offset(offset))).mappings().all()
+    return {
+        "items": [dict(row) for row in rows[:limit]],
+        "next_offset": offset + limit if len(rows) > limit else None,
+    }
+
+async def search_patients(db: AsyncSession, q: str, limit: int, offset: int):
+    # Both branches are served by trigram GIN indexes: "%" is pg_trgm's
+    # similarity operator and infix (I)LIKE patterns use the same index.
+    if _PHONE_QUERY.match(q):
+        digits = re.sub(r"[^\d+]", "", q)
+        if len(digits.lstrip("+")) < MIN_QUERY_LENGTH:
+            raise ValueError(f"Search for at least {MIN_QUERY_LENGTH} digits of a phone number.")
+        score = func.similarity(Patient.phone_number, digits)
+        condition = Patient.phone_number.contains(digits, autoescape=True)
+    else:
+        if len(q) < MIN_QUERY_LENGTH:
+            raise ValueError(f"Search for at least {MIN_QUERY_LENGTH} characters of a name.")
+        score = func.similarity(Patient.name, q)
+        condition = or_(Patient.name.op("%")(q), Patient.name.icontains(q, autoescape=True))
+    stmt = select(*PATIENT_COLUMNS, score.label("score")).where(condition).order_by(score.desc(), Patient.patient_id)
+    return await _page(db, stmt, limit, offset)
+
+async def search_medical_history(db: AsyncSession, q: str, limit: int, offset: int):
+    query = func.websearch_to_tsquery(SEARCH_LANGUAGE, q)
+    score = func.ts_rank_cd(Patient.medical_history_search, query)
+    stmt = (
+        select(*PATIENT_COLUMNS, func.ts_headline(SEARCH_LANGUAGE, Patient.medical_history, query).label("highlight"), score.label("score"))
+        .where(Patient.medical_history_search.op("@@")(query))
+        .order_by(score.desc(), Patient.patient_id)
+    )
+    return await _page(db, stmt, limit, offset)
+
+async def search_medical_records(db: AsyncSession, q: str, limit: int, offset: int):
+    query = func.websearch_to_tsquery(SEARCH_LANGUAGE, q)
+    # Diagnosis matches are weighted above treatment matches (see the
+    # setweight() in MedicalRecord.search_vector).
+    score = func.ts_rank_cd(MedicalRecord.search_vector, query)
+    stmt = (
+        select(
+            MedicalRecord.record_id, MedicalRecord.patient_id, MedicalRecord.doctor_id,
+            MedicalRecord.diagnosis, MedicalRecord.treatment, score.label("score"),
+        )
+        .where(MedicalRecord.search_vector.op("@@")(query))
+        .order_by(score.desc(), MedicalRecord.record_id)
+    )
+    return await _page(db, stmt, limit, offset)
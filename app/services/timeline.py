@@ -0,0 +1,77 @@
+import uuid
+from datetime import date
+from typing import Optional
+from sqlalchemy import and_, false, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from crud import row_to_dict
+from models.models import Appointment, Billing, MedicalRecord
+
+# (entry type, model, primary key, loader options). Each source is read with
+# one query on its (patient_id, date) index plus at most one selectin query
+# for the doctors, so a page costs the same however long the history is.
+TIMELINE_SOURCES = (
+    ("appointment", Appointment, Appointment.appointment_id, (selectinload(Appointment.doctor),)),
+    ("medical_record", MedicalRecord, MedicalRecord.record_id, (selectinload(MedicalRecord.doctor),)),
+    ("bill", Billing, Billing.bill_id, ()),
+)
+
+
+def encode_cursor(day: Optional[date], item_id: uuid.UUID) -> str:
+    return f"{day.isoformat() if day else ''}_{item_id}"
+
+def decode_cursor(cursor: str):
+    day, _, item_id = cursor.partition("_")
+    return (date.fromisoformat(day) if day else None), uuid.UUID(item_id)
+
+def _sort_key(entry):
+    # Undated medical records (created before dates were stored) sort as the
+    # oldest entries.
+    return (entry[0] or date.min, entry[1])
+
+def _newest_first(model, pk):
+    # NULLS LAST only where the column can be NULL: the NOT NULL date indexes
+    # are scanned backwards, which yields DESC NULLS FIRST order.
+    day = model.date.desc()
+    return (day.nulls_last() if model.date.nullable else day), pk.desc()
+
+def _before(model, pk, day: Optional[date], item_id: uuid.UUID):
+    if not model.date.nullable:
+        return tuple_(model.date, pk) < (day, item_id) if day is not None else false()
+    if day is None:
+        return and_(model.date.is_(None), pk < item_id)
+    return or_(tuple_(model.date, pk) < (day, item_id), model.date.is_(None))
+
+def _doctor(item):
+    doctor = getattr(item, "doctor", None)
+    if doctor is None:
+        return None
+    return {"doctor_id": doctor.doctor_id, "name": doctor.name, "specialization": doctor.specialization}
+
+async def patient_timeline(db: AsyncSession, patient_id: uuid.UUID, limit: int, cursor: Optional[str] = None):
+    # Entries are ordered newest first by (date, id) across all sources, with
+    # undated entries last, so a single (date, id) cursor pages through the
+    # merged timeline.
+    before = decode_cursor(cursor) if cursor else None
+    entries = []
+    for kind, model, pk, options in TIMELINE_SOURCES:
+        stmt = (
+            select(model)
+            .where(model.patient_id == patient_id)
+            .order_by(*_newest_first(model, pk))
+            .limit(limit + 1)
+            .options(*options)
+        )
+        if before is not None:
+            stmt = stmt.where(_before(model, pk, *before))
+        for item in (await db.scalars(stmt)).all():
+            entries.append((item.date, getattr(item, pk.key), kind, item))
+    entries.sort(key=_sort_key, reverse=True)
+    page = entries[:limit]
+    return {
+        "items": [
+            {"type": kind, "id": item_id, "date": day, "doctor": _doctor(item), "details": row_to_dict(item)}
+            for day, item_id, kind, item in page
+        ],
+        "next_cursor": encode_cursor(page[-1][0], page[-1][1]) if len(entries) > limit else None,
+    }
@@ -0,0 +1,9 @@
+import os
+import sys
+
+# The application modules import each other as top-level packages
+# (``from schemas.schema import ...``), exactly as when run from app/.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# The app refuses to start with authentication on and no signing key.
+os.environ.setdefault("AUTH_SECRET_KEY", "test-only-signing-key-" + "x" * 32)
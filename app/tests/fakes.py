@@ -0,0 +1,55 @@
+class FakeRedis:
+    """In-process stand-in for the subset of redis.asyncio that RedisCache uses.
+
+    Values come back as bytes, as from a real client without
+    decode_responses. Time only moves through advance(), so expiry is
+    deterministic in tests.
+    """
+
+    def __init__(self):
+        self._data = {}
+        self._expires_at = {}
+        self._now = 0.0
+
+    def advance(self, seconds: float):
+        self._now += seconds
+
+    def _live(self, key):
+        expires_at = self._expires_at.get(key)
+        if expires_at is not None and expires_at <= self._now:
+            self._data.pop(key, None)
+            self._expires_at.pop(key, None)
+        return key in self._data
+
+    async def get(self, key):
+        return self._data[key] if self._live(key) else None
+
+    async def set(self, key, value, ex=None):
+        if ex is not None and ex <= 0:
+            raise ValueError("invalid expire time in 'set' command")
+        self._data[key] = value.encode() if isinstance(value, str) else value
+        if ex is None:
+            self._expires_at.pop(key, None)
+        else:
+            self._expires_at[key] = self._now + ex
+        return True
+
+    async def delete(self, *keys):
+        deleted = 0
+        for key in keys:
+            if self._live(key):
+                del self._data[key]
+                self._expires_at.pop(key, None)
+                deleted += 1
+        return deleted
+
+    async def incr(self, key):
+        value = int(self._data[key]) + 1 if self._live(key) else 1
+        self._data[key] = str(value).encode()
+        return value
+
+    async def expire(self, key, seconds):
+        if not self._live(key):
+            return False
+        self._expires_at[key] = self._now + seconds
+        return True
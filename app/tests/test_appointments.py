@@ -0,0 +1,35 @@
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("asyncpg")
+pytest.importorskip("email_validator")
+
+import asyncpg.exceptions
+from sqlalchemy.exc import IntegrityError
+
+
+def _server_error(cls, constraint=None):
+    # Built the way asyncpg builds errors from the server's error fields.
+    fields = {"C": cls.sqlstate, "M": "violation"}
+    if constraint:
+        fields["n"] = constraint
+    return cls.new(fields)
+
+
+def _integrity_error(cause):
+    # Shaped like SQLAlchemy's asyncpg adapter: the server error is the cause.
+    orig = Exception(str(cause))
+    orig.__cause__ = cause
+    return IntegrityError("INSERT INTO appointments ...", {}, orig)
+
+
+@pytest.mark.parametrize("cause, status_code, detail", [
+    (_server_error(asyncpg.exceptions.UniqueViolationError, "uq_appointments_doctor_id_date_time_active"), 409, "Doctor is already booked at that time."),
+    (_server_error(asyncpg.exceptions.ForeignKeyViolationError, "appointments_patient_id_fkey"), 404, "Patient not found."),
+    (_server_error(asyncpg.exceptions.ForeignKeyViolationError, "appointments_doctor_id_fkey"), 404, "Doctor not found."),
+    (_server_error(asyncpg.exceptions.NotNullViolationError), 422, "Appointment violates a database constraint."),
+])
+def test_integrity_errors_are_told_apart(cause, status_code, detail):
+    from routes.appointment import _integrity_error as to_http
+    error = to_http(_integrity_error(cause))
+    assert (error.status_code, error.detail) == (status_code, detail)
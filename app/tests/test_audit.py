@@ -0,0 +1,41 @@
+import uuid
+from datetime import date
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("fastapi")
+pytest.importorskip("asyncpg")
+
+from sqlalchemy import inspect
+from sqlalchemy.orm.attributes import set_committed_value
+
+
+def test_update_records_only_changed_columns():
+    from models.models import MedicalRecord
+    from services.audit import _changed_values
+    record = MedicalRecord()
+    for key, value in {"record_id": uuid.uuid4(), "diagnosis": "flu", "treatment": "rest", "prescription": None, "date": date(2026, 1, 2)}.items():
+        set_committed_value(record, key, value)
+    record.diagnosis = "bronchitis"
+    record.treatment = "rest"
+    old, new = _changed_values(inspect(record))
+    assert old == {"diagnosis": "flu"}
+    assert new == {"diagnosis": "bronchitis"}
+
+def test_entry_is_json_ready_and_skips_internal_columns():
+    from models.models import Patient
+    from auth.security import current_actor
+    from services.audit import _entry, _loaded_values
+    patient_id = uuid.uuid4()
+    patient = Patient(patient_id=patient_id, name="A", date_of_birth=date(1990, 5, 1), medical_history="none")
+    token = current_actor.set("user-1")
+    try:
+        entry = _entry(inspect(patient), "insert", None, _loaded_values(inspect(patient)))
+    finally:
+        current_actor.reset(token)
+    assert entry["table_name"] == "patients"
+    assert entry["row_id"] == patient_id
+    assert entry["actor"] == "user-1"
+    assert entry["new_values"]["date_of_birth"] == "1990-05-01"
+    assert entry["new_values"]["patient_id"] == str(patient_id)
+    assert "medical_history_search" not in entry["new_values"]
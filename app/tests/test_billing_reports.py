@@ -0,0 +1,55 @@
+import asyncio
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy.dialects import postgresql
+from services.billing_reports import record_bill_change
+
+DAY = date(2026, 3, 1)
+
+
+class CapturingSession:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+
+
+def _bill(payment_status="Pending", amount="100.00", day=DAY, payment_method="Cash"):
+    return {"date": day, "payment_method": payment_method, "payment_status": payment_status, "amount": Decimal(amount)}
+
+
+def _upserts(old=None, new=None):
+    db = CapturingSession()
+    asyncio.run(record_bill_change(db, old=old, new=new))
+    rows = []
+    for stmt in db.statements:
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        assert "ON CONFLICT (day, payment_method, payment_status) DO UPDATE" in str(compiled)
+        params = compiled.params
+        rows.append((params["day"], params["payment_method"], params["payment_status"], params["bill_count"], params["total_amount"]))
+    return rows
+
+
+def test_create_adds_one_bill_to_its_group():
+    assert _upserts(new=_bill()) == [(DAY, "Cash", "Pending", 1, Decimal("100.00"))]
+
+
+def test_delete_removes_one_bill_from_its_group():
+    assert _upserts(old=_bill()) == [(DAY, "Cash", "Pending", -1, Decimal("-100.00"))]
+
+
+def test_update_moving_groups_touches_both_rows():
+    assert _upserts(old=_bill("Pending"), new=_bill("Paid", "120.00")) == [
+        (DAY, "Cash", "Paid", 1, Decimal("120.00")),
+        (DAY, "Cash", "Pending", -1, Decimal("-100.00")),
+    ]
+
+
+def test_update_within_a_group_only_adjusts_the_amount():
+    assert _upserts(old=_bill(amount="100.00"), new=_bill(amount="80.50")) == [(DAY, "Cash", "Pending", 0, Decimal("-19.50"))]
+
+
+def test_update_without_grouped_changes_writes_nothing():
+    assert _upserts(old=_bill(), new=_bill()) == []
@@ -0,0 +1,101 @@
+import asyncio
+import os
+import uuid
+from datetime import date
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from sqlalchemy.dialects import postgresql
+import crud
+from crud import bulk_upsert
+from models.models import Patient
+
+
+def _patient(phone, name="Bulk"):
+    return {"name": name, "date_of_birth": date(1980, 1, 1), "address": "1 Road", "city": "Pune", "state": "MH", "zip_code": "411001", "phone_number": phone, "email": None, "medical_history": ""}
+
+
+class UpsertSession:
+    """Answers each upsert the way Postgres would, given phone numbers already stored."""
+
+    def __init__(self, existing=()):
+        self.existing = {phone: uuid.uuid4() for phone in existing}
+        self.chunks = []
+        self.committed = False
+
+    async def execute(self, stmt):
+        params = stmt.compile(dialect=postgresql.dialect()).params
+        # Multi-row VALUES bind as <column>_m<row>.
+        rows = range(sum(key.startswith("phone_number_m") for key in params))
+        phones = [params[f"phone_number_m{row}"] for row in rows]
+        ids = [params[f"patient_id_m{row}"] for row in rows]
+        self.chunks.append(phones)
+        rows = [(self.existing.get(phone, new_id), phone, phone not in self.existing) for phone, new_id in zip(phones, ids)]
+        return type("Result", (), {"all": lambda _: rows})()
+
+    async def commit(self):
+        self.committed = True
+
+
+@pytest.fixture(autouse=True)
+def no_listeners(monkeypatch):
+    monkeypatch.setattr(crud, "bulk_write_listeners", [])
+
+
+def test_duplicates_in_batch_are_skipped():
+    db = UpsertSession()
+    result = asyncio.run(bulk_upsert(Patient, db, [_patient("+911000000001"), _patient("+911000000002"), _patient("+911000000001")], conflict_key="phone_number"))
+    assert (result["created"], result["updated"], result["skipped"]) == (2, 0, 1)
+    assert result["results"][2] == {"index": 2, "id": None, "outcome": "skipped", "detail": "Duplicate phone_number in batch (item 0)."}
+    assert db.chunks == [["+911000000001", "+911000000002"]]
+    assert db.committed
+
+
+def test_existing_rows_are_reported_as_updated():
+    db = UpsertSession(existing=["+911000000002"])
+    result = asyncio.run(bulk_upsert(Patient, db, [_patient("+911000000001"), _patient("+911000000002")], conflict_key="phone_number"))
+    assert [entry["outcome"] for entry in result["results"]] == ["created", "updated"]
+    assert result["results"][1]["id"] == db.existing["+911000000002"]
+
+
+def test_large_batches_are_split_into_chunks(monkeypatch):
+    monkeypatch.setattr(crud, "BULK_CHUNK_SIZE", 2)
+    db = UpsertSession()
+    phones = [f"+91100000000{i}" for i in range(5)]
+    result = asyncio.run(bulk_upsert(Patient, db, [_patient(phone) for phone in phones], conflict_key="phone_number"))
+    assert db.chunks == [phones[0:2], phones[2:4], phones[4:5]]
+    assert [entry["index"] for entry in result["results"]] == [0, 1, 2, 3, 4]
+    assert result["created"] == 5
+
+
+@pytest.mark.skipif(not os.getenv("TEST_ASYNC_DATABASE_URL"), reason="set TEST_ASYNC_DATABASE_URL to a migrated database")
+def test_upsert_against_postgres(monkeypatch):
+    from sqlalchemy import select
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+    monkeypatch.setattr(crud, "BULK_CHUNK_SIZE", 2)
+    suffix = str(uuid.uuid4().int)[:8]
+    phones = [f"+91{i}{i}{suffix}" for i in range(5)]
+
+    async def run():
+        engine = create_async_engine(os.environ["TEST_ASYNC_DATABASE_URL"])
+        async with engine.connect() as conn:
+            transaction = await conn.begin()
+            db = AsyncSession(bind=conn, join_transaction_mode="create_savepoint")
+            first = await bulk_upsert(Patient, db, [_patient(phone) for phone in phones[:3]], conflict_key="phone_number")
+            # The second batch overlaps the first, repeats a phone number and spans three chunks.
+            items = [_patient(phone, "Renamed") for phone in phones[1:]] + [_patient(phones[4], "Duplicate")]
+            second = await bulk_upsert(Patient, db, items, conflict_key="phone_number")
+            names = dict((await db.execute(select(Patient.phone_number, Patient.name).where(Patient.phone_number.in_(phones)))).all())
+            ids = dict((await db.execute(select(Patient.phone_number, Patient.patient_id).where(Patient.phone_number.in_(phones)))).all())
+            await transaction.rollback()
+        await engine.dispose()
+        return first, second, names, ids
+
+    first, second, names, ids = asyncio.run(run())
+    assert (first["created"], first["updated"], first["skipped"]) == (3, 0, 0)
+    assert [entry["outcome"] for entry in second["results"]] == ["updated", "updated", "created", "created", "skipped"]
+    assert second["results"][0]["id"] == first["results"][1]["id"] == ids[phones[1]]
+    assert names == {phones[0]: "Bulk", **{phone: "Renamed" for phone in phones[1:]}}
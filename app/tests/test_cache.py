@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+
+from cache.cache import BaseCache, InMemoryCache, RedisCache
+from tests.fakes import FakeRedis
+
+
+@pytest.fixture(params=["memory", "redis"])
+def cache(request):
+    if request.param == "memory":
+        return InMemoryCache(ttl=60, max_entries=2)
+    return RedisCache(FakeRedis(), ttl=60)
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_base_cache_is_abstract():
+    with pytest.raises(TypeError):
+        BaseCache(ttl=60)
+
+
+def test_read_through_caches_until_deleted(cache):
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        return {"name": f"v{len(calls)}"}
+
+    assert run(cache.get_or_load("doctor:1", loader)) == {"name": "v1"}
+    assert run(cache.get_or_load("doctor:1", loader)) == {"name": "v1"}
+    run(cache.delete("doctor:1"))
+    assert run(cache.get_or_load("doctor:1", loader)) == {"name": "v2"}
+    assert len(calls) == 2
+    assert cache.stats.invalidations == 1
+
+
+def test_missing_rows_are_not_cached(cache):
+    async def loader():
+        return None
+
+    assert run(cache.get_or_load("doctor:1", loader)) is None
+    assert run(cache.get("doctor:1")) is None
+
+
+def test_value_loaded_across_an_invalidation_is_not_written_back(cache):
+    async def scenario():
+        async def stale_loader():
+            # An update commits and invalidates while this read is in flight.
+            await cache.delete("doctor:1")
+            return {"name": "before update"}
+
+        value = await cache.get_or_load("doctor:1", stale_loader)
+        return value, await cache.get("doctor:1")
+
+    value, cached = run(scenario())
+    assert value == {"name": "before update"}
+    assert cached is None
+
+
+def test_generation_survives_being_forgotten():
+    cache = InMemoryCache(ttl=60, max_entries=2)
+
+    async def scenario():
+        before = await cache.generation("doctor:1")
+        # Enough deletes to push doctor:1 out of the remembered generations.
+        await cache.delete("doctor:1", "doctor:2", "doctor:3", "doctor:4")
+        return before, await cache.generation("doctor:1")
+
+    before, after = run(scenario())
+    assert before != after
+
+
+def test_in_memory_cache_evicts_least_recently_used():
+    cache = InMemoryCache(ttl=60, max_entries=2)
+
+    async def scenario():
+        await cache.set("a", {"v": 1})
+        await cache.set("b", {"v": 2})
+        await cache.get("a")
+        await cache.set("c", {"v": 3})
+        return await cache.get("a"), await cache.get("b")
+
+    assert run(scenario()) == ({"v": 1}, None)
+    assert cache.stats.evictions == 1
+
+
+def test_redis_cache_round_trips_json_and_expires():
+    client = FakeRedis()
+    cache = RedisCache(client, ttl=60)
+
+    async def scenario():
+        await cache.set("inventory:alerts", {"generated_at": None, "items": [1, 2]}, ttl=5)
+        first = await cache.get("inventory:alerts")
+        client.advance(5)
+        return first, await cache.get("inventory:alerts")
+
+    assert run(scenario()) == ({"generated_at": None, "items": [1, 2]}, None)
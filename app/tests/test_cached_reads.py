@@ -0,0 +1,39 @@
+import asyncio
+import datetime as dt
+import uuid
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("asyncpg")
+pytest.importorskip("email_validator")
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import create_async_engine
+from cache.cache import cache
+from database import database
+
+
+@pytest.fixture
+def unreachable_primary(monkeypatch):
+    # Any attempt to check out a connection fails fast.
+    engine = create_async_engine("postgresql+asyncpg://nobody@127.0.0.1:1/none", pool_pre_ping=True)
+    monkeypatch.setattr(database, "async_engine", engine)
+    return engine
+
+
+def test_cache_hit_does_not_touch_the_database(unreachable_primary):
+    from routes import doctor
+    doctor_id = uuid.uuid4()
+    row = {"doctor_id": str(doctor_id), "name": "Dr A", "specialization": "GP", "phone_number": "+911", "email": None,
+           "availability_schedule": None, "version": 3, "updated_at": dt.datetime(2026, 1, 1, tzinfo=dt.timezone.utc)}
+    app = FastAPI()
+    app.include_router(doctor.router)
+    asyncio.run(cache.set(f"doctor:{doctor_id}", row))
+    try:
+        response = TestClient(app).get(f"/doctors/{doctor_id}")
+    finally:
+        asyncio.run(cache.delete(f"doctor:{doctor_id}"))
+    assert response.status_code == 200
+    assert response.headers["ETag"]
@@ -0,0 +1,131 @@
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from fastapi import HTTPException
+from starlette.requests import Request
+from services.conditional import check_if_match, http_date, is_not_modified, item_etag, page_etag, page_last_modified
+
+MODIFIED = datetime(2026, 3, 1, 12, 30, 15, 250000, tzinfo=timezone.utc)
+
+
+def _request(headers=None, query=""):
+    raw = [(name.lower().encode(), value.encode()) for name, value in (headers or {}).items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "query_string": query.encode(), "headers": raw})
+
+
+def _page(*versions, next_cursor=None):
+    return {"items": [{"id": uuid.UUID(int=i), "version": version, "updated_at": MODIFIED} for i, version in enumerate(versions)], "next_cursor": next_cursor}
+
+
+# If-None-Match / If-Modified-Since ---------------------------------------------
+
+@pytest.mark.parametrize("header, expected", [
+    ('"3"', True),
+    ('W/"3"', True),            # weak comparison ignores the W/ prefix
+    ('"2", "3"', True),
+    ("*", True),
+    ('"4"', False),
+])
+def test_if_none_match_uses_weak_comparison(header, expected):
+    assert is_not_modified(_request({"If-None-Match": header}), item_etag(3), MODIFIED) is expected
+
+
+def test_if_none_match_takes_precedence_over_if_modified_since():
+    headers = {"If-None-Match": '"4"', "If-Modified-Since": http_date(MODIFIED)}
+    assert is_not_modified(_request(headers), item_etag(3), MODIFIED) is False
+
+
+def test_if_modified_since_rounds_to_whole_seconds():
+    # The header drops the 250 ms; the row must still count as unmodified.
+    assert is_not_modified(_request({"If-Modified-Since": http_date(MODIFIED)}), item_etag(3), MODIFIED)
+    assert not is_not_modified(_request({"If-Modified-Since": "Sun, 01 Mar 2026 12:30:14 GMT"}), item_etag(3), MODIFIED)
+
+
+def test_if_modified_since_accepts_cached_iso_strings():
+    assert is_not_modified(_request({"If-Modified-Since": http_date(MODIFIED)}), item_etag(3), MODIFIED.isoformat())
+
+
+@pytest.mark.parametrize("headers, last_modified", [({}, MODIFIED), ({"If-Modified-Since": "yesterday"}, MODIFIED), ({"If-Modified-Since": http_date(MODIFIED)}, None)])
+def test_without_usable_validators_the_response_is_sent(headers, last_modified):
+    assert not is_not_modified(_request(headers), item_etag(3), last_modified)
+
+
+# If-Match -------------------------------------------------------------------------
+
+@pytest.mark.parametrize("header", [None, '"3"', '"2", "3"', "*"])
+def test_if_match_accepts_the_current_version(header):
+    check_if_match(_request({"If-Match": header} if header else {}), item_etag(3))
+
+
+@pytest.mark.parametrize("header", ['"2"', 'W/"3"'])
+def test_if_match_uses_strong_comparison(header):
+    with pytest.raises(HTTPException) as error:
+        check_if_match(_request({"If-Match": header}), item_etag(3))
+    assert error.value.status_code == 412
+
+
+# Page validators ------------------------------------------------------------------
+
+def test_page_etag_is_stable_and_weak():
+    first = page_etag(_request(query="limit=2"), _page(1, 2), "id", "version")
+    assert first == page_etag(_request(query="limit=2"), _page(1, 2), "id", "version")
+    assert first.startswith('W/"')
+
+
+@pytest.mark.parametrize("query, page", [
+    ("limit=3", _page(1, 2)),                   # different query
+    ("limit=2", _page(1, 3)),                   # a row was edited
+    ("limit=2", _page(1)),                      # a row was deleted
+    ("limit=2", _page(1, 2, next_cursor="x")),  # more rows follow
+])
+def test_page_etag_changes_with_the_page(query, page):
+    assert page_etag(_request(query=query), page, "id", "version") != page_etag(_request(query="limit=2"), _page(1, 2), "id", "version")
+
+
+def test_page_last_modified_is_the_newest_row():
+    page = _page(1, 2)
+    page["items"][0]["updated_at"] = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    assert page_last_modified(page) == MODIFIED
+    assert page_last_modified({"items": [], "next_cursor": None}) is None
+
+
+# Concurrent update ----------------------------------------------------------------
+
+def test_concurrent_update_answers_412():
+    pytest.importorskip("email_validator")
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from sqlalchemy.orm.exc import StaleDataError
+    from database.database import get_async_db
+    from routes import doctor
+
+    class StubSession:
+        rolled_back = False
+
+        async def get(self, model, key):
+            return SimpleNamespace(version=3, availability_schedule="Mon 09:00-10:00")
+
+        async def commit(self):
+            # Another request bumped the version between our read and UPDATE.
+            raise StaleDataError("UPDATE statement on table 'doctors' expected to update 1 row(s); 0 were matched.")
+
+        async def rollback(self):
+            StubSession.rolled_back = True
+
+    async def stub_db():
+        yield StubSession()
+
+    app = FastAPI()
+    app.include_router(doctor.router)
+    app.dependency_overrides[get_async_db] = stub_db
+    body = {"name": "Dr A", "specialization": "GP", "phone_number": "+911234567890", "availability_schedule": "Mon 09:00-10:00"}
+    client = TestClient(app)
+    assert client.put(f"/doctors/{uuid.uuid4()}", json=body, headers={"If-Match": '"3"'}).status_code == 412
+    assert StubSession.rolled_back
+    # A stale If-Match is refused before any write is attempted.
+    assert client.put(f"/doctors/{uuid.uuid4()}", json=body, headers={"If-Match": '"2"'}).status_code == 412
@@ -0,0 +1,27 @@
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("fastapi")
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from instrumentation.middleware import install_query_instrumentation
+
+
+def test_failed_statement_does_not_leave_a_start_time_behind():
+    engine = create_engine("sqlite://")
+    install_query_instrumentation(engine)
+    with engine.connect() as conn:
+        with pytest.raises(OperationalError):
+            conn.execute(text("SELECT * FROM missing_table"))
+        assert conn.info["query_started"] == []
+        conn.execute(text("SELECT 1"))
+        assert conn.info["query_started"] == []
+
+
+def test_diagnostics_are_not_on_the_probe_router():
+    from routes import health
+    probes = {route.path for route in health.router.routes}
+    diagnostics = {route.path for route in health.diagnostics_router.routes}
+    assert probes == {"/health/live", "/health/ready"}
+    assert {"/metrics", "/health/pool", "/health/slow-queries"} <= diagnostics
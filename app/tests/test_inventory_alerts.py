@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from cache.cache import InMemoryCache
+from services.inventory_alerts import SNAPSHOT_CACHE_KEY, InventoryAlertScanner
+
+
+def _scanner(cache):
+    return InventoryAlertScanner(None, cache, interval=60, expiry_window_days=30, low_stock_threshold=10, max_items=100)
+
+
+def test_followers_serve_the_leaders_snapshot():
+    cache = InMemoryCache(ttl=60, max_entries=10)
+    follower = _scanner(cache)
+    published = {"generated_at": "2026-01-01T00:00:00+00:00", "expiring": [], "low_stock": [{"name": "saline"}]}
+    asyncio.run(cache.set(SNAPSHOT_CACHE_KEY, published))
+    assert asyncio.run(follower.current()) == published
+
+
+def test_falls_back_to_the_local_snapshot():
+    scanner = _scanner(InMemoryCache(ttl=60, max_entries=10))
+    assert asyncio.run(scanner.current()) == scanner.snapshot
+
+
+def test_expired_backlog_does_not_hide_upcoming_expiries():
+    from datetime import date, timedelta
+    from sqlalchemy.dialects import postgresql
+
+    today = date.today()
+    statements = []
+
+    class Result:
+        def mappings(self):
+            return []
+
+    class StubSession:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+        async def execute(self, stmt):
+            statements.append(stmt.compile(dialect=postgresql.dialect()))
+            return Result()
+
+    scanner = InventoryAlertScanner(StubSession, InMemoryCache(ttl=60, max_entries=10), interval=60, expiry_window_days=30, low_stock_threshold=10, max_items=100)
+    snapshot = asyncio.run(scanner.scan())
+    expired, expiring = statements[0], statements[1]
+    assert "inventory.expiry_date < " in str(expired)
+    assert "inventory.expiry_date >= " in str(expiring) and "inventory.expiry_date <= " in str(expiring)
+    assert list(expiring.params.values())[:2] == [today, today + timedelta(days=30)]
+    assert {"expired", "expiring", "low_stock"} <= set(snapshot)
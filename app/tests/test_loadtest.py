@@ -0,0 +1,21 @@
+import random
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from benchmarks.loadtest import build_scenarios
+
+
+def _first_new_patient_phone():
+    # Creating a patient does not reference sampled ids.
+    scenarios = {name: factory for name, _, factory in build_scenarios({})}
+    post = next(factory for name, factory in scenarios.items() if name.startswith("POST /patients"))
+    return post()[2]["phone_number"]
+
+
+def test_seed_does_not_repeat_phone_numbers():
+    random.seed(42)
+    first = _first_new_patient_phone()
+    random.seed(42)
+    assert _first_new_patient_phone() != first
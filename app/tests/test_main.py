@@ -0,0 +1,33 @@
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("asyncpg")
+
+
+def test_medical_record_routes_are_mounted():
+    from main import app
+    paths = app.openapi()["paths"]
+    assert {"/medical-records/", "/medical-records", "/medical-records/{record_id}"} <= set(paths)
+    assert set(paths["/medical-records/{record_id}"]) == {"get", "put", "delete"}
+
+
+@pytest.mark.parametrize("path", ["/health/pool", "/health/slow-queries", "/metrics"])
+def test_diagnostics_require_authentication(path):
+    from fastapi.testclient import TestClient
+    from config.settings import settings
+    from main import app
+    if not settings.AUTH_ENABLED:
+        pytest.skip("authentication is disabled")
+    assert TestClient(app).get(path).status_code == 401
+
+
+def test_workers_refuse_to_start_with_the_placeholder_signing_key(monkeypatch):
+    from fastapi.testclient import TestClient
+    from auth.security import InsecureSecretKeyError
+    from config.settings import settings
+    from main import app
+    monkeypatch.setattr(settings, "AUTH_ENABLED", True)
+    monkeypatch.setattr(settings, "AUTH_SECRET_KEY", "dev-only-change-me")
+    with pytest.raises(InsecureSecretKeyError):
+        with TestClient(app):
+            pass
@@ -0,0 +1,42 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("asyncpg")
+
+from config.settings import settings
+from database import database
+from database.pool import pool_metrics
+
+
+@pytest.fixture
+def engines(monkeypatch):
+    # Engines connect lazily, so unreachable URLs are fine here.
+    monkeypatch.setattr(database, "ASYNC_DATABASE_URL", "postgresql+asyncpg://nobody@127.0.0.1:1/primary")
+    monkeypatch.setattr(settings, "ASYNC_REPLICA_DATABASE_URLS", [
+        "postgresql+asyncpg://nobody@127.0.0.1:1/replica_a",
+        "postgresql+asyncpg://nobody@127.0.0.1:1/replica_b",
+    ])
+    monkeypatch.setattr(database, "async_engine", None)
+    database.init_async_engine()
+    yield database.all_async_engines()
+    asyncio.run(database.dispose_async_engine())
+
+
+def test_every_engine_has_its_own_pool_metrics(engines):
+    primary, first_replica, _ = engines
+    assert [metrics.name for metrics in pool_metrics.all()] == ["primary", "replica_1", "replica_2"]
+    pool_metrics.for_engine(first_replica.sync_engine).observe_checkout(0.5)
+    assert pool_metrics.for_engine(primary.sync_engine).snapshot()["checkout"]["count"] == 0
+    assert pool_metrics.for_engine(first_replica.sync_engine).snapshot()["checkout"]["count"] == 1
+
+
+def test_metrics_expose_one_labelled_series_per_pool(engines):
+    from instrumentation.metrics import registry
+    from routes.health import _pool_metrics
+    assert _pool_metrics in registry.collectors
+    rendered = registry.render()
+    assert rendered.count("# TYPE db_pool_size gauge") == 1
+    for name in ("primary", "replica_1", "replica_2"):
+        assert f'db_pool_size{{pool="{name}"}}' in rendered
@@ -0,0 +1,63 @@
+import datetime as dt
+import uuid
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("email_validator")
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from database.database import get_async_db
+
+
+class StubSession:
+    async def get(self, model, key):
+        return object()
+
+
+def _client(router):
+    async def stub_db():
+        yield StubSession()
+
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_async_db] = stub_db
+    return TestClient(app)
+
+
+def _record(day):
+    return {"record_id": uuid.uuid4(), "patient_id": uuid.uuid4(), "doctor_id": uuid.uuid4(), "diagnosis": "flu", "treatment": "rest", "prescription": None, "date": day}
+
+
+@pytest.mark.parametrize("day", [dt.date(2026, 3, 1), None])
+def test_medical_record_read_validates_through_the_response_model(monkeypatch, day):
+    from routes import medical_record
+    record = _record(day)
+
+    async def get_row(model, db, key):
+        return record
+
+    monkeypatch.setattr(medical_record, "get_row", get_row)
+    response = _client(medical_record.router).get(f"/medical-records/{record['record_id']}")
+    assert response.status_code == 200
+    assert response.json()["date"] == (day.isoformat() if day else None)
+
+
+def test_timeline_validates_dated_and_undated_entries(monkeypatch):
+    from routes import patient
+    dated, undated = _record(dt.date(2026, 3, 1)), _record(None)
+
+    async def patient_timeline(db, patient_id, limit, cursor):
+        return {
+            "items": [
+                {"type": "medical_record", "id": item["record_id"], "date": item["date"], "doctor": None, "details": item}
+                for item in (dated, undated)
+            ],
+            "next_cursor": None,
+        }
+
+    monkeypatch.setattr(patient, "patient_timeline", patient_timeline)
+    response = _client(patient.router).get(f"/patients/{uuid.uuid4()}/timeline")
+    assert response.status_code == 200
+    assert [item["date"] for item in response.json()["items"]] == ["2026-03-01", None]
@@ -0,0 +1,72 @@
+import asyncio
+import json
+import os
+import uuid
+from datetime import date, datetime, time, timezone
+from decimal import Decimal
+import pytest
+
+pytest.importorskip("fastapi")
+
+
+@pytest.fixture(params=["orjson", "stdlib"], autouse=True)
+def encoder(request, monkeypatch):
+    # Every test runs against both encoders, which must agree byte for byte
+    # on the values.
+    import responses
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(responses, "orjson", None)
+    return request.param
+
+
+def _render(content):
+    from responses import FastJSONResponse
+    return json.loads(FastJSONResponse(content).body)
+
+def test_renders_asyncpg_uuid_subclass():
+    pgproto = pytest.importorskip("asyncpg.pgproto.pgproto")
+    value = pgproto.UUID("12345678-1234-5678-1234-567812345678")
+    assert _render({"items": [{"patient_id": value}], "next_cursor": value}) == {
+        "items": [{"patient_id": "12345678-1234-5678-1234-567812345678"}],
+        "next_cursor": "12345678-1234-5678-1234-567812345678",
+    }
+
+def test_renders_row_types_like_pydantic_json_mode():
+    row = {"id": uuid.UUID(int=1), "day": date(2026, 10, 18), "amount": Decimal("12.50")}
+    assert _render(row) == {"id": str(uuid.UUID(int=1)), "day": "2026-10-18", "amount": "12.50"}
+
+def test_renders_datetimes_in_iso_format():
+    moment = datetime(2026, 1, 1, 10, 0, tzinfo=timezone.utc)
+    assert _render({"at": moment, "naive": datetime(2026, 1, 1, 10, 0, 5, 120000), "time": time(9, 30)}) == {
+        "at": "2026-01-01T10:00:00+00:00",
+        "naive": "2026-01-01T10:00:05.120000",
+        "time": "09:30:00",
+    }
+
+def test_rejects_unknown_types():
+    with pytest.raises(TypeError):
+        _render({"value": object()})
+
+
+@pytest.mark.skipif(not os.getenv("TEST_ASYNC_DATABASE_URL"), reason="set TEST_ASYNC_DATABASE_URL to a migrated database")
+def test_renders_page_listed_through_asyncpg():
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    from crud import get_page
+    from models.models import Inventory
+
+    async def list_page():
+        engine = create_async_engine(os.environ["TEST_ASYNC_DATABASE_URL"])
+        async with AsyncSession(engine) as db:
+            db.add(Inventory(name="render check", quantity=1, supplier="s", category="c", expiry_date=date(2030, 1, 1)))
+            await db.flush()
+            page = await get_page(Inventory, db, limit=5)
+            await db.rollback()
+        await engine.dispose()
+        return page
+
+    page = asyncio.run(list_page())
+    assert page["items"]
+    rendered = _render(page)
+    assert rendered["items"][0]["item_id"] == str(page["items"][0]["item_id"])
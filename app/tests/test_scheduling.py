@@ -0,0 +1,107 @@
+import asyncio
+import os
+import uuid
+from datetime import date, datetime, timedelta
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from services.scheduling import expand_slots, parse_availability
+
+
+def test_schedule_expands_to_slots_within_opening_hours():
+    monday = date(2026, 10, 19)
+    slots = list(expand_slots(parse_availability("Mon 09:00-10:00"), monday, 7, 20))
+    assert slots[0] == (datetime(2026, 10, 19, 9, 0), datetime(2026, 10, 19, 9, 20))
+    assert len(slots) == 3
+
+
+def test_free_slots_are_indexed_by_start_time():
+    from models.models import DoctorSlot
+    index = next(index for index in DoctorSlot.__table__.indexes if index.name == "ix_doctor_slots_free_starts_at")
+    assert [column.name for column in index.columns] == ["starts_at"]
+
+
+@pytest.mark.skipif(not os.getenv("TEST_ASYNC_DATABASE_URL"), reason="set TEST_ASYNC_DATABASE_URL to a migrated database")
+def test_booking_a_day_without_generated_slots_fills_it_from_the_schedule(monkeypatch):
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    from config.settings import settings
+    from models.models import Doctor, Patient
+    from services.scheduling import SlotUnavailableError, book_appointment
+
+    # 09:00 and 09:30 are the only slots, whatever the environment sets.
+    monkeypatch.setattr(settings, "APPOINTMENT_SLOT_MINUTES", 30)
+    suffix = str(uuid.uuid4().int)[:9]
+    # Far beyond any generated horizon.
+    day = date.today() + timedelta(days=400)
+
+    async def scenario():
+        engine = create_async_engine(os.environ["TEST_ASYNC_DATABASE_URL"])
+        async with engine.connect() as conn:
+            transaction = await conn.begin()
+            db = AsyncSession(bind=conn, join_transaction_mode="create_savepoint")
+            schedule = f"{day.strftime('%a')} 09:00-10:00"
+            doctor = Doctor(name="Dr Slots", specialization="GP", phone_number=f"+917{suffix}", availability_schedule=schedule)
+            patient = Patient(name="Booker", date_of_birth=date(1990, 1, 1), address="1 Road", city="Pune", state="MH", zip_code="411001", phone_number=f"+918{suffix}")
+            db.add_all([doctor, patient])
+            await db.flush()
+            booking = {"patient_id": patient.patient_id, "doctor_id": doctor.doctor_id, "date": day, "status": "Scheduled"}
+            booked = await book_appointment(db, {**booking, "time": "09:30"})
+            with pytest.raises(SlotUnavailableError):
+                await book_appointment(db, {**booking, "time": "11:00"})
+            await transaction.rollback()
+        await engine.dispose()
+        return booked
+
+    assert asyncio.run(scenario()).time == "09:30"
+
+
+def test_horizon_extender_walks_every_doctor_in_batches(monkeypatch):
+    from types import SimpleNamespace
+    from services import scheduling
+
+    doctors = [SimpleNamespace(doctor_id=uuid.UUID(int=i)) for i in range(1, 6)]
+    statements, generated = [], []
+
+    class StubSession:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+        async def scalars(self, stmt):
+            statements.append(stmt)
+            after = stmt.compile().params.get("doctor_id_1")
+            remaining = [doctor for doctor in doctors if after is None or doctor.doctor_id > after]
+            return SimpleNamespace(all=lambda: remaining[:2])
+
+    async def generate_slots(db, doctor):
+        generated.append(doctor.doctor_id)
+        if doctor.doctor_id.int == 3:
+            raise ValueError("Cannot parse availability rule")
+
+    monkeypatch.setattr(scheduling, "generate_slots", generate_slots)
+    extender = scheduling.SlotHorizonExtender(StubSession, interval=60)
+    extender.batch_size = 2
+    asyncio.run(extender.run_once())
+    assert generated == [doctor.doctor_id for doctor in doctors]
+    assert len(statements) == 3
+
+
+def test_doctor_with_an_unparsable_schedule_is_rejected():
+    pytest.importorskip("email_validator")
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from database.database import get_async_db
+    from routes import doctor
+
+    async def no_db():
+        yield None
+
+    app = FastAPI()
+    app.include_router(doctor.router)
+    app.dependency_overrides[get_async_db] = no_db
+    body = {"name": "Dr A", "specialization": "GP", "phone_number": "+911234567890", "availability_schedule": "mornings"}
+    assert TestClient(app).post("/doctors/", json=body).status_code == 422
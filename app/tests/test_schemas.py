@@ -0,0 +1,21 @@
+import datetime as dt
+import uuid
+import pytest
+
+pytest.importorskip("pydantic")
+pytest.importorskip("email_validator")
+
+
+def test_schema_module_imports():
+    from schemas import schema
+    assert schema.MedicalRecordCreate.model_fields["date"].annotation is dt.date
+
+def test_medical_record_date_defaults_to_today():
+    from schemas.schema import MedicalRecordCreate
+    record = MedicalRecordCreate(patient_id=uuid.uuid4(), doctor_id=str(uuid.uuid4()), diagnosis="d", treatment="t", prescription="p")
+    assert record.date == dt.date.today()
+
+@pytest.mark.parametrize("model", ["MedicalRecordRead", "TimelineEntry"])
+def test_read_schemas_accept_dated_and_undated_entries(model):
+    from schemas import schema
+    assert schema.__dict__[model].model_fields["date"].annotation == dt.date | None
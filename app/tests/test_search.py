@@ -0,0 +1,30 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from services.search import search_patients
+
+
+@pytest.mark.parametrize("q", ["ab", "+9 1", "1-2"])
+def test_terms_too_short_for_the_trigram_index_are_rejected(q):
+    # Rejected before touching the database.
+    with pytest.raises(ValueError):
+        asyncio.run(search_patients(None, q, 20, 0))
+
+
+@pytest.mark.parametrize("path", ["/search/patients", "/search/medical-history", "/search/medical-records"])
+def test_search_routes_require_three_characters(path):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from database.database import get_async_db
+    from routes.search import router
+
+    async def no_db():
+        yield None
+
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_async_db] = no_db
+    assert TestClient(app).get(path, params={"q": "ab"}).status_code == 422
@@ -0,0 +1,210 @@
+import asyncio
+import base64
+import json
+import time
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from auth import security
+from auth.security import TokenError, TokenRevocationList, create_access_token, decode_access_token, needs_rehash
+from cache.cache import RedisCache
+from config.settings import settings
+from tests.fakes import FakeRedis
+
+
+def test_revocation_is_seen_by_every_worker_sharing_redis():
+    client = FakeRedis()
+    # Two workers: separate in-process lists over the same Redis.
+    first, second = TokenRevocationList(client), TokenRevocationList(client)
+
+    async def scenario():
+        await first.revoke("jti-1", time.time() + 300)
+        return await second.is_revoked("jti-1"), await second.is_revoked("jti-2")
+
+    assert asyncio.run(scenario()) == (True, False)
+
+
+def test_revocation_lookups_do_not_count_as_cache_traffic():
+    client = FakeRedis()
+    cache = RedisCache(client, ttl=60)
+    revoked = TokenRevocationList(cache.client, cache.prefix)
+
+    async def scenario():
+        for _ in range(5):
+            await revoked.is_revoked("jti-1")
+
+    asyncio.run(scenario())
+    assert (cache.stats.hits, cache.stats.misses) == (0, 0)
+
+
+def test_revocation_expires_with_the_token():
+    client = FakeRedis()
+    revoked = TokenRevocationList(client)
+    asyncio.run(revoked.revoke("jti-1", time.time() + 30))
+    client.advance(31)
+    # A fresh worker has nothing in process memory.
+    assert asyncio.run(TokenRevocationList(client).is_revoked("jti-1")) is False
+
+
+# Tokens and passwords ---------------------------------------------------------
+
+
+@pytest.fixture(autouse=True)
+def fast_scrypt(monkeypatch):
+    # Production cost is tens of milliseconds per hash; tests do not need it.
+    monkeypatch.setattr(settings, "PASSWORD_SCRYPT_N", 2 ** 10)
+
+
+def _user(role="staff", password=""):
+    return SimpleNamespace(user_id=uuid.uuid4(), username="alice", role=role, password=password)
+
+
+def _segments(token):
+    return token.split(".")
+
+
+def _encode(data: dict) -> str:
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b"=").decode()
+
+
+def test_token_round_trips_its_claims():
+    user = _user(role="admin")
+    claims = decode_access_token(create_access_token(user)["access_token"])
+    assert (claims["sub"], claims["username"], claims["role"]) == (str(user.user_id), "alice", "admin")
+    assert claims["exp"] - claims["iat"] == settings.AUTH_TOKEN_TTL_SECONDS
+
+
+def test_tampered_claims_fail_the_signature_check():
+    header, payload, signature = _segments(create_access_token(_user())["access_token"])
+    claims = json.loads(base64.urlsafe_b64decode(payload + "=="))
+    forged = _encode({**claims, "role": "admin"})
+    with pytest.raises(TokenError, match="signature"):
+        decode_access_token(f"{header}.{forged}.{signature}")
+
+
+def test_token_signed_with_another_key_is_rejected(monkeypatch):
+    token = create_access_token(_user())["access_token"]
+    monkeypatch.setattr(settings, "AUTH_SECRET_KEY", "some-other-key-" + "y" * 32)
+    with pytest.raises(TokenError, match="signature"):
+        decode_access_token(token)
+
+
+def test_unsigned_algorithm_is_rejected():
+    header, payload, _ = _segments(create_access_token(_user())["access_token"])
+    none_header = _encode({"alg": "none", "typ": "JWT"})
+    signature = base64.urlsafe_b64encode(security._sign(f"{none_header}.{payload}".encode())).rstrip(b"=").decode()
+    with pytest.raises(TokenError, match="header"):
+        decode_access_token(f"{none_header}.{payload}.{signature}")
+
+
+@pytest.mark.parametrize("token", ["", "abc", "a.b", "a.b.c.d", "!!!.###.$$$"])
+def test_malformed_tokens_are_rejected(token):
+    with pytest.raises(TokenError):
+        decode_access_token(token)
+
+
+def test_expired_token_is_rejected(monkeypatch):
+    token = create_access_token(_user())["access_token"]
+    monkeypatch.setattr(security.time, "time", lambda: 10 ** 12)
+    with pytest.raises(TokenError, match="expired"):
+        decode_access_token(token)
+
+
+def test_scrypt_hash_verifies_only_the_right_password():
+    stored = security._hash_password("correct horse")
+    assert stored.startswith("scrypt$1024$8$1$")
+    assert security._verify_password("correct horse", stored)
+    assert not security._verify_password("wrong horse", stored)
+    # Salted: the same password never hashes the same way twice.
+    assert security._hash_password("correct horse") != stored
+
+
+def test_hashes_with_an_old_cost_or_plaintext_need_rehashing(monkeypatch):
+    stored = security._hash_password("correct horse")
+    assert not needs_rehash(stored)
+    assert needs_rehash("correct horse")
+    monkeypatch.setattr(settings, "PASSWORD_SCRYPT_N", 2 ** 11)
+    assert needs_rehash(stored)
+
+
+# User routes -------------------------------------------------------------------
+
+class StubSession:
+    def __init__(self, scalar):
+        self._scalar = scalar
+        self.added, self.commits = [], 0
+
+    async def scalar(self, stmt):
+        return self._scalar
+
+    def add(self, obj):
+        if getattr(obj, "user_id", None) is None:
+            obj.user_id = uuid.uuid4()
+        self.added.append(obj)
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        pass
+
+
+def _client(session):
+    pytest.importorskip("email_validator")
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from database.database import get_async_db
+    from routes import user
+
+    async def stub_db():
+        yield session
+
+    app = FastAPI()
+    app.include_router(user.router)
+    app.dependency_overrides[get_async_db] = stub_db
+    return TestClient(app)
+
+
+def _bearer(role):
+    return {"Authorization": f"Bearer {create_access_token(_user(role=role))['access_token']}"}
+
+
+NEW_USER = {"username": "bob", "password": "s3cret-pass", "role": "staff"}
+
+
+def test_first_user_can_be_created_anonymously():
+    session = StubSession(scalar=False)
+    response = _client(session).post("/users/", json=NEW_USER)
+    assert response.status_code == 201
+    assert session.added[0].password.startswith("scrypt$")
+
+
+@pytest.mark.parametrize("headers, status_code", [({}, 401), ({"Authorization": "Bearer junk"}, 401)])
+def test_later_users_need_a_valid_token(headers, status_code):
+    assert _client(StubSession(scalar=True)).post("/users/", json=NEW_USER, headers=headers).status_code == status_code
+
+
+def test_only_admins_create_users():
+    client = _client(StubSession(scalar=True))
+    assert client.post("/users/", json=NEW_USER, headers=_bearer("staff")).status_code == 403
+    assert client.post("/users/", json=NEW_USER, headers=_bearer("admin")).status_code == 201
+
+
+def test_login_rehashes_a_legacy_plaintext_password():
+    user = _user(password="legacy-plain")
+    session = StubSession(scalar=user)
+    response = _client(session).post("/users/login", json={"username": "alice", "password": "legacy-plain"})
+    assert response.status_code == 200
+    assert user.password.startswith("scrypt$") and security._verify_password("legacy-plain", user.password)
+    assert session.commits == 1
+    assert decode_access_token(response.json()["access_token"])["sub"] == str(user.user_id)
+
+
+def test_login_rejects_a_wrong_password_and_unknown_users():
+    user = _user(password=security._hash_password("correct horse"))
+    assert _client(StubSession(scalar=user)).post("/users/login", json={"username": "alice", "password": "nope"}).status_code == 401
+    assert _client(StubSession(scalar=None)).post("/users/login", json={"username": "ghost", "password": "nope"}).status_code == 401
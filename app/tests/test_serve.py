@@ -0,0 +1,35 @@
+import pytest
+
+pytest.importorskip("uvicorn")
+
+import serve
+from config.settings import settings
+
+
+def test_several_workers_need_the_shared_cache(monkeypatch, capsys):
+    monkeypatch.setattr(settings, "CACHE_BACKEND", "memory")
+    monkeypatch.setattr("sys.argv", ["serve.py", "--workers", "4"])
+    monkeypatch.setattr(serve.uvicorn, "run", lambda *args, **kwargs: pytest.fail("uvicorn should not start"))
+    with pytest.raises(SystemExit):
+        serve.main()
+    assert "CACHE_BACKEND=redis" in capsys.readouterr().err
+
+
+def test_single_worker_runs_on_the_memory_cache(monkeypatch):
+    calls = []
+    monkeypatch.setattr(settings, "CACHE_BACKEND", "memory")
+    monkeypatch.setattr("sys.argv", ["serve.py", "--workers", "1"])
+    monkeypatch.setattr(serve.uvicorn, "run", lambda *args, **kwargs: calls.append(kwargs))
+    serve.main()
+    assert calls[0]["workers"] == 1
+
+
+@pytest.mark.parametrize("key", ["", "dev-only-change-me"])
+def test_refuses_to_start_without_a_signing_key(monkeypatch, capsys, key):
+    monkeypatch.setattr(settings, "AUTH_ENABLED", True)
+    monkeypatch.setattr(settings, "AUTH_SECRET_KEY", key)
+    monkeypatch.setattr("sys.argv", ["serve.py", "--workers", "1"])
+    monkeypatch.setattr(serve.uvicorn, "run", lambda *args, **kwargs: pytest.fail("uvicorn should not start"))
+    with pytest.raises(SystemExit):
+        serve.main()
+    assert "AUTH_SECRET_KEY" in capsys.readouterr().err
@@ -0,0 +1,70 @@
+import asyncio
+import os
+import uuid
+from datetime import date, timedelta
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from services.timeline import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trips_dated_and_undated_entries():
+    item_id = uuid.uuid4()
+    assert decode_cursor(encode_cursor(date(2026, 3, 1), item_id)) == (date(2026, 3, 1), item_id)
+    assert decode_cursor(encode_cursor(None, item_id)) == (None, item_id)
+
+
+@pytest.mark.skipif(not os.getenv("TEST_ASYNC_DATABASE_URL"), reason="set TEST_ASYNC_DATABASE_URL to a migrated database")
+def test_timeline_query_count_does_not_grow_with_history():
+    from sqlalchemy import event
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    from models.models import Appointment, Billing, Doctor, MedicalRecord, Patient
+    from services.timeline import patient_timeline
+
+    suffix = str(uuid.uuid4().int)[:9]
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    async def read_timeline():
+        engine = create_async_engine(os.environ["TEST_ASYNC_DATABASE_URL"])
+        async with engine.connect() as conn:
+            transaction = await conn.begin()
+            db = AsyncSession(bind=conn)
+            patient = Patient(name="Timeline", date_of_birth=date(1980, 1, 1), address="1 Road", city="Pune", state="MH", zip_code="411001", phone_number=f"+915{suffix}")
+            doctors = [Doctor(name=f"Dr {i}", specialization="GP", phone_number=f"+91{i}{suffix}") for i in range(3)]
+            db.add_all([patient, *doctors])
+            await db.flush()
+            start = date(2026, 1, 1)
+            for i in range(20):
+                doctor = doctors[i % len(doctors)]
+                day = start + timedelta(days=i)
+                db.add(Appointment(patient_id=patient.patient_id, doctor_id=doctor.doctor_id, date=day, time="09:00", status="Scheduled"))
+                db.add(MedicalRecord(patient_id=patient.patient_id, doctor_id=doctor.doctor_id, diagnosis="d", treatment="t", date=day if i % 4 else None))
+                db.add(Billing(patient_id=patient.patient_id, date=day, amount=10, payment_status="Paid", payment_method="Cash"))
+            await db.flush()
+            db.expunge_all()
+
+            event.listen(engine.sync_engine, "before_cursor_execute", count)
+            seen, cursor, pages = [], None, []
+            while True:
+                statements.clear()
+                page = await patient_timeline(db, patient.patient_id, 25, cursor)
+                pages.append(len(statements))
+                seen.extend(entry["id"] for entry in page["items"])
+                cursor = page["next_cursor"]
+                if cursor is None:
+                    break
+            event.remove(engine.sync_engine, "before_cursor_execute", count)
+            await transaction.rollback()
+        await engine.dispose()
+        return seen, pages
+
+    seen, pages = asyncio.run(read_timeline())
+    assert len(seen) == len(set(seen)) == 60
+    # One query per source plus one selectin load of doctors for appointments
+    # and one for medical records, whatever the length of the history.
+    assert max(pages) <= 5